@@ -0,0 +1,27 @@
+"""Run local SSH connection broker shared by CLI tools and the GUI."""
+
+import logging
+
+from src.core.connect.broker_daemon import SshBroker
+from src.core.log.formatter import create_formatter
+from src.platform.enums.log import LogName
+
+main_logger = logging.getLogger(LogName.MAIN.value)
+main_logger.setLevel(logging.INFO)
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(create_formatter(LogName.MAIN.value))
+main_logger.addHandler(console_handler)
+
+
+def main() -> None:
+    """Serve shared SSH transports until interrupted."""
+    SshBroker().serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        main_logger.info("Broker interrupted by user")
+    except Exception:
+        main_logger.exception("Broker failed")
@@ -75,6 +75,7 @@ sut_ethtool_logger = loggers[LogName.SUT_ETHTOOL.value]
 sut_link_flap_logger = loggers[LogName.SUT_LINK_FLAP.value]
 sut_tx_errors_logger = loggers[LogName.SUT_TX_ERRORS.value]
 sut_ipmitool_fan_logger = loggers[LogName.SUT_IPMITOOL_FAN.value]
+sut_netdev_logger = loggers[LogName.SUT_NETDEV.value]
 slx_eye_logger = loggers[LogName.SLX_EYE.value]
 slx_dsc_logger = loggers[LogName.SLX_DSC.value]
 
@@ -220,13 +221,14 @@ def main():  # noqa: PLR0915
     else:
         summary_lines.append("SLX scans: 0 (worker_collect=false)")
 
-    # SUT Worker samples
+    # SUT Worker samples (bounded buffers, memory is preallocated)
     total_samples = 0
-    for worker in sut_workers:
-        sample_count = len(worker.get_extracted_samples())
-        total_samples += sample_count
-        summary_lines.append(f"{worker.name}: {sample_count} samples")
-    summary_lines.append(f"Total SUT: {total_samples} samples (~{total_samples * 5}KB)")
+    total_bytes = 0
+    for worker in (member for w in sut_workers for member in w.members):
+        total_samples += len(worker.buffer)
+        total_bytes += worker.buffer.nbytes
+        summary_lines.append(f"{worker.name}: {worker.summary()}")
+    summary_lines.append(f"Total SUT: {total_samples} samples ({total_bytes // 1024}KB)")
 
     data_summary = frame.build("COLLECTED DATA", summary_lines)
     _logger.info(data_summary)
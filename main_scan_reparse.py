@@ -0,0 +1,62 @@
+"""Re-parse raw archives (sut.raw_archive) with the current parsers into CSV files."""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+import time
+
+from src.core.helpers import get_latest_log_dir
+from src.core.log.formatter import create_formatter
+from src.core.reparse import CHUNK_RECORDS, reparse
+from src.platform.enums.log import LogName
+
+main_logger = logging.getLogger(LogName.MAIN.value)
+main_logger.setLevel(logging.INFO)
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(create_formatter(LogName.MAIN.value))
+main_logger.addHandler(console_handler)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-parse raw command output archives with the current parsers")
+    parser.add_argument(
+        "paths", nargs="*", type=Path, help="raw archives or log directories (default: latest log directory)"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel processes")
+    parser.add_argument("--chunk", type=int, default=CHUNK_RECORDS, help="records per chunk")
+    parser.add_argument("-o", "--out", type=Path, help="output directory (default: 'reparsed' in the log directory)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Re-parse all raw archives found in the given paths."""
+    args = parse_args()
+    paths = args.paths or [Path(get_latest_log_dir() or ".")]
+    archives = [archive for path in paths for archive in (sorted(path.glob("*.raw")) if path.is_dir() else [path])]
+    if not archives:
+        main_logger.warning(f"No raw archives found in {', '.join(str(p) for p in paths)}")
+        return
+
+    for archive in archives:
+        begin = time.perf_counter()
+        try:
+            frame = reparse(archive, processes=args.jobs, chunk_records=args.chunk)
+        except ValueError as e:
+            main_logger.warning(f"Skipped {archive.name}: {e}")
+            continue
+
+        out_dir = args.out or archive.parent / "reparsed"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / f"{archive.stem}.csv"
+        frame.to_csv(out_path, index=False)
+        main_logger.info(f"{archive.name}: {len(frame)} rows in {time.perf_counter() - begin:.2f}s -> {out_path}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        main_logger.info("Re-parse interrupted by user")
+    except Exception:
+        main_logger.exception("Re-parse failed")
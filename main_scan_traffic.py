@@ -35,7 +35,7 @@ import time
 from src.core.cli import PrettyFrame
 from src.core.config import load_traffic_config
 from src.core.config.traffic import TrafficConfig
-from src.core.connect import LocalConnection, SshConnection
+from src.core.connect import BrokerConnection, LocalConnection, SshConnection, broker_available
 from src.core.enum.connect import ConnectType, IperfHostType
 from src.core.enum.messages import LogMsg
 from src.core.log.setup import init_logging
@@ -100,7 +100,7 @@ def _get_host_credentials(cfg: TrafficConfig, is_server: bool) -> tuple[str, str
 
 def create_connection(
     cfg: TrafficConfig, host_type: IperfHostType, logger: logging.Logger
-) -> SshConnection | LocalConnection:
+) -> SshConnection | BrokerConnection | LocalConnection:
     """Create connection based on configuration.
 
     Args:
@@ -120,12 +120,15 @@ def create_connection(
         return LocalConnection(host, sudo_pass)
 
     jump_host = Host(ip=cfg.jump_host, username=cfg.jump_user, password=cfg.jump_pass)
+    if broker_available():
+        return BrokerConnection(host, user, password, [jump_host], sudo_pass=sudo_pass)
     return SshConnection(
         host=host,
         username=user,
         password=password,
         jump_hosts=[jump_host],
         sudo_pass=sudo_pass,
+        max_channels=SshConnection.SHARED_MAX_CHANNELS,
     )
 
 
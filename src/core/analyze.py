@@ -127,12 +127,13 @@ class AnalyzeGraphs:
         flap_log = self.log_dir / f"{LogName.SUT_LINK_FLAP.value}.log"
         flap_csv = self.log_dir / f"{LogName.SUT_LINK_FLAP.value}.csv"
 
-        if not flap_log.exists():
-            self.logger.warning(f"Flap log file not found: {flap_log}")
-            self.df_flaps = pd.DataFrame(columns=["down_timestamp", "up_timestamp", "interface", "duration"])
-            return
-
-        strip_log_file(flap_log, flap_csv)
+        # A clean CSV written by the worker CSV sink is used as is
+        if not flap_csv.exists():
+            if not flap_log.exists():
+                self.logger.warning(f"Flap log file not found: {flap_log}")
+                self.df_flaps = pd.DataFrame(columns=["down_timestamp", "up_timestamp", "interface", "duration"])
+                return
+            strip_log_file(flap_log, flap_csv)
 
         try:
             self.df_flaps = pd.read_csv(flap_csv)
@@ -153,12 +154,22 @@ class AnalyzeGraphs:
                 continue
 
             files = get_files_with_prefix(str(self.log_dir), log.value)
+            # Raw archives (sut_raw_archive) hold unparsed outputs, see main_scan_reparse.py
             filtered_files = [
-                f for f in files if not any(skip in f.stem for skip in self.SKIP_LOGS) and f.stat().st_size > 0
+                f
+                for f in files
+                if not any(skip in f.stem for skip in self.SKIP_LOGS) and f.suffix != ".raw" and f.stat().st_size > 0
             ]
 
             for f in filtered_files:
                 csv_path = self.log_dir / f"{f.stem}.csv"
+                # Clean CSVs (worker CSV sink, its compressed segments or an earlier run) are used as is,
+                # only bare logs are stripped
+                if f.suffix == ".csv" or f.name.endswith((".csv.gz", ".csv.zst")):
+                    log_csv_files.setdefault(log.value, []).append(f)
+                    continue
+                if csv_path in filtered_files:
+                    continue
                 strip_log_file(f, csv_path)
                 log_csv_files.setdefault(log.value, []).append(csv_path)
 
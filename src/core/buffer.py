@@ -0,0 +1,255 @@
+"""Bounded columnar sample buffer.
+
+Each worker keeps its recent samples in a fixed-capacity ring: one float
+timestamp array plus one column per attribute. Columns start as typed float
+arrays and fall back to plain lists only when a non-numeric value shows up,
+so memory is known up front (nbytes) instead of measured by walking objects.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+import math
+import threading
+from typing import Any
+
+from src.core.enum.connect import BufferPolicy
+
+
+class _Timeline:
+    """Read-only logical view (oldest first) of the timestamp ring for bisect."""
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, buffer: "SampleRingBuffer"):
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return self._buffer._size  # noqa: SLF001
+
+    def __getitem__(self, index: int) -> float:
+        return self._buffer._timestamps[self._buffer._slot(index)]  # noqa: SLF001
+
+
+class SampleRingBuffer:
+    """Fixed-capacity ring of (timestamp, attribute values) rows.
+
+    Single writer (the worker), any number of readers. Reads return only the
+    requested rows; nothing copies the whole history unless asked to.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_columns",
+        "_data",
+        "_dropped",
+        "_lock",
+        "_policy",
+        "_size",
+        "_start",
+        "_timestamps",
+    )
+
+    def __init__(self, columns: list[str], capacity: int = 4096, policy: BufferPolicy = BufferPolicy.OVERWRITE):
+        """Initialize empty buffer with preallocated columns.
+
+        Args:
+            columns: Attribute column names
+            capacity: Maximum buffered rows
+            policy: Eviction policy when full
+        """
+        self._capacity = max(1, capacity)
+        self._columns = list(columns)
+        self._policy = policy
+        self._timestamps = array("d", bytes(8 * self._capacity))
+        self._data: list[array | list] = [array("d", bytes(8 * self._capacity)) for _ in self._columns]
+        self._start = 0
+        self._size = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # Properties
+    # ========================================================================
+
+    @property
+    def columns(self) -> list[str]:
+        """Get column names.
+
+        Returns:
+            Attribute column names
+        """
+        return self._columns
+
+    @property
+    def capacity(self) -> int:
+        """Get capacity.
+
+        Returns:
+            Maximum buffered rows
+        """
+        return self._capacity
+
+    @property
+    def dropped(self) -> int:
+        """Get number of rows lost to eviction or DROP_NEW.
+
+        Returns:
+            Dropped row count
+        """
+        return self._dropped
+
+    @property
+    def nbytes(self) -> int:
+        """Get preallocated storage size (list columns count their pointers only).
+
+        Returns:
+            Size in bytes
+        """
+        return self._capacity * 8 * (1 + len(self._data))
+
+    def __len__(self) -> int:
+        """Get number of buffered rows."""
+        return self._size
+
+    # ========================================================================
+    # Writing
+    # ========================================================================
+
+    def append(self, timestamp: float, values: list[Any]) -> bool:
+        """Append one row.
+
+        Args:
+            timestamp: Sample begin time as epoch seconds
+            values: One value per column (numeric strings are stored as floats)
+
+        Returns:
+            False if the row was dropped (DROP_NEW policy and buffer full)
+        """
+        with self._lock:
+            if self._size == self._capacity:
+                self._dropped += 1
+                if self._policy == BufferPolicy.DROP_NEW:
+                    return False
+                slot = self._start
+                self._start = (self._start + 1) % self._capacity
+            else:
+                slot = self._slot(self._size)
+                self._size += 1
+
+            self._timestamps[slot] = timestamp
+            for index, value in enumerate(values[: len(self._data)]):
+                self._store(index, slot, value)
+            return True
+
+    def _store(self, index: int, slot: int, value: Any) -> None:
+        """Store value in column, widening a float column to a list on first non-numeric value."""
+        column = self._data[index]
+        if isinstance(column, list):
+            column[slot] = value
+            return
+        try:
+            column[slot] = math.nan if value in (None, "") else float(value)
+        except (TypeError, ValueError):
+            widened: list[Any] = column.tolist()
+            widened[slot] = value
+            self._data[index] = widened
+
+    def clear(self) -> None:
+        """Drop all rows (capacity and column types are kept)."""
+        with self._lock:
+            self._start = 0
+            self._size = 0
+
+    # ========================================================================
+    # Reading
+    # ========================================================================
+
+    def _slot(self, index: int) -> int:
+        """Map logical index (0 = oldest) to ring slot."""
+        return (self._start + index) % self._capacity
+
+    def _row(self, index: int) -> tuple:
+        """Build row tuple for a logical index."""
+        slot = self._slot(index)
+        return (self._timestamps[slot], *(column[slot] for column in self._data))
+
+    def _index_range(self, start: float | None = None, end: float | None = None) -> tuple[int, int]:
+        """Find logical index range of rows with start <= timestamp <= end (binary search).
+
+        Args:
+            start: Earliest epoch seconds (None = oldest)
+            end: Latest epoch seconds (None = newest)
+
+        Returns:
+            Tuple of (first, stop) logical indexes
+        """
+        timeline = _Timeline(self)
+        first = 0 if start is None else bisect_left(timeline, start)
+        stop = self._size if end is None else bisect_right(timeline, end)
+        return first, max(first, stop)
+
+    def rows(self, start: float | None = None, end: float | None = None) -> list[tuple]:
+        """Get rows (timestamp, *values) within a time range, oldest first.
+
+        Args:
+            start: Earliest epoch seconds (None = oldest)
+            end: Latest epoch seconds (None = newest)
+
+        Returns:
+            Row tuples
+        """
+        with self._lock:
+            first, stop = self._index_range(start, end)
+            return [self._row(i) for i in range(first, stop)]
+
+    def since(self, timestamp: float | None) -> list[tuple]:
+        """Get rows newer than timestamp (incremental reads for live graphs).
+
+        Args:
+            timestamp: Last timestamp already seen (None = all rows)
+
+        Returns:
+            Row tuples, oldest first
+        """
+        with self._lock:
+            first = 0 if timestamp is None else bisect_right(_Timeline(self), timestamp)
+            return [self._row(i) for i in range(first, self._size)]
+
+    def column(self, name: str, since: float | None = None) -> tuple[list[float], list]:
+        """Get timestamps and values of one column, for rows newer than since.
+
+        Args:
+            name: Column name
+            since: Last timestamp already seen (None = all rows)
+
+        Returns:
+            Tuple of (timestamps, values), oldest first
+        """
+        index = self._columns.index(name)
+        with self._lock:
+            first = 0 if since is None else bisect_right(_Timeline(self), since)
+            slots = [self._slot(i) for i in range(first, self._size)]
+            column = self._data[index]
+            return [self._timestamps[s] for s in slots], [column[s] for s in slots]
+
+    def column_types(self) -> dict[str, str]:
+        """Get storage type per column.
+
+        Returns:
+            Mapping column name -> "float" or "object"
+        """
+        return {
+            name: "object" if isinstance(column, list) else "float"
+            for name, column in zip(self._columns, self._data, strict=True)
+        }
+
+    def summary(self) -> str:
+        """Generate one-line buffer summary.
+
+        Returns:
+            Summary string with fill level, drops and memory
+        """
+        return (
+            f"Buffered {self._size}/{self._capacity} samples "
+            f"({self._dropped} dropped, {self.nbytes / 1024:.1f} KiB, policy={self._policy.value})"
+        )
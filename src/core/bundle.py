@@ -0,0 +1,155 @@
+"""Bundled command execution for workers.
+
+A BundleWorker runs the commands of several worker configurations (e.g. all
+monitoring commands of one interface) as one framed batch per tick through
+exec_many(), then hands each command's output to its own worker for parsing,
+logging and buffering. One exec channel per tick replaces one per command.
+"""
+
+import logging
+import time
+
+from src.core.enum.messages import LogMsg
+from src.core.sample import SampleRecord
+from src.core.schedule import IntervalGroup
+from src.core.statistics import WorkerStatistics
+from src.core.worker import Worker, WorkerConfig
+from src.models.config import Config
+from src.platform.enums.log import LogName
+
+
+class BundleWorker(Worker):
+    """Worker executing a group of worker commands in one round trip per tick.
+
+    The bundle ticks at the shortest member interval; members with a longer
+    interval are only included in the ticks where they are due. Members are
+    regular Worker instances that are never started themselves.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        worker_cfgs: list[WorkerConfig],
+        cfg: Config,
+        ssh_factory,
+        shared_flap_state: dict | None = None,
+        statistics: WorkerStatistics | None = None,
+    ) -> None:
+        """Initialize bundle and its member workers.
+
+        Args:
+            label: Bundle name (e.g. interface), used as worker command
+            worker_cfgs: Configurations of the bundled commands
+            cfg: Application configuration
+            ssh_factory: Callable that creates new SSH connection
+            shared_flap_state: Shared dictionary for flap detection across workers
+            statistics: Shared statistics tracker for command durations
+        """
+        self._intervals = IntervalGroup([c.scan_interval_ms for c in worker_cfgs])
+
+        bundle_cfg = WorkerConfig()
+        bundle_cfg.command = f"bundle[{label}]"
+        bundle_cfg.logger = logging.getLogger(LogName.MAIN.value)
+        bundle_cfg.scan_interval_ms = self._intervals.base_interval_ms
+        super().__init__(bundle_cfg, cfg, ssh_factory, shared_flap_state, statistics)
+
+        self._members = [Worker(c, cfg, None, self._shared_flap_state, statistics) for c in worker_cfgs]
+
+    @property
+    def members(self) -> list[Worker]:
+        """Get bundled workers.
+
+        Returns:
+            Member workers in command order
+        """
+        return self._members
+
+    def open(self) -> bool:
+        """Connect and run one-time setup of all members on the bundle connection.
+
+        Returns:
+            True if bundle is ready to step
+        """
+        try:
+            self._ssh = self._ssh_factory()
+            if not self._ssh.connect():
+                self._logger.error(f"Bundle {self.command} failed to establish SSH connection")
+                return False
+        except Exception:
+            self._logger.exception(f"Bundle {self.command} failed to create SSH connection")
+            return False
+
+        for member in self._members:
+            member.attach(self._ssh)
+
+        self._intervals.start()
+        self._reconnect = 0
+        self._scheduler.start()
+        self._logger.debug(f"Bundle {self.command} started with {len(self._members)} commands")
+        return True
+
+    def step(self) -> float | None:
+        """Execute due member commands in one batch and fan results out.
+
+        Returns:
+            Due time (time.monotonic()) of the next step, or None when the bundle is done
+        """
+        if self._stop_event.is_set():
+            return None
+
+        try:
+            if self._reconnect > self.MAX_RECONNECT:
+                self._logger.info(
+                    f"{LogMsg.WORKER_RECONNECT_FAIL.value} {self.MAX_RECONNECT} times. Exiting worker: {self.command}"
+                )
+                return None
+
+            if self._tick_due:
+                self._record_schedule()
+
+            # Members with sub-commands contribute only their due sub-commands
+            cmds: list[str] = []
+            spans: list[tuple[Worker, int, int]] = []
+            for i in self._intervals.due():
+                member_cmds = self._members[i].due_commands()
+                spans.append((self._members[i], len(cmds), len(member_cmds)))
+                cmds.extend(member_cmds)
+
+            if cmds:
+                cmd_start = time.time()
+                results = self._ssh.exec_many(cmds, logger=self._logger)
+
+                if self._stop_event.is_set():
+                    return None
+
+                for member, first, count in spans:
+                    if count:
+                        # Each member is charged its own elapsed time, the round trip is shared
+                        sample = SampleRecord.from_results(cmd_start, results[first : first + count])
+                        member.handle_sample(sample, cmd_start, sample.parsed_ms)
+
+            self._reconnect = 0
+            return self._next_due(sampled=False)
+
+        except KeyboardInterrupt:
+            self._logger.info(f"{LogMsg.WORKER_USER_EXIT.value}: {self.command}")
+            return None
+        except Exception:
+            self._reconnect += 1
+            self._logger.exception(f"Bundle error - Attempt {self._reconnect}/{self.MAX_RECONNECT} - {self.command}")
+            return time.monotonic() + min(self._reconnect, 5)
+
+    def finish(self) -> None:
+        """Release member CSV sinks, then disconnect and mark bundle as done."""
+        for member in self._members:
+            member.detach()
+        super().finish()
+
+    def summary(self) -> str:
+        """Generate one-line summary of the bundle.
+
+        Returns:
+            Summary string with member count and buffered samples
+        """
+        total = sum(len(member.buffer) for member in self._members)
+        return f"Bundled {len(self._members)} commands, {total} samples buffered"
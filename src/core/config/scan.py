@@ -2,8 +2,17 @@
 
 from dataclasses import dataclass
 
-from src.core.enum.connect import ConnectType, ShowPartType
+from src.core.enum.connect import (
+    BufferPolicy,
+    ConnectType,
+    LogCompression,
+    NetdevSource,
+    SchedulePolicy,
+    ShowPartType,
+)
 from src.core.enum.messages import LogMsg
+from src.core.log.segments import compression_available
+from src.core.parser.sut.netdev import PROC_COUNTERS, SYSFS_COUNTERS
 
 
 @dataclass(frozen=True)
@@ -52,6 +61,42 @@ class ScanConfig:
     sut_scan_interval_high_res_ms: int
     sut_scan_interval_tx_errors_ms: int
     sut_scan_max_log_size_kb: int
+    sut_shared_transport: bool
+    sut_remote_sampler: bool
+    sut_bundle_commands: bool
+    sut_mlxlink_split: bool
+    sut_pipeline_depth: int
+    sut_csv_sink: bool
+    sut_csv_flush_ms: int
+    sut_csv_batch_rows: int
+    sut_log_segments: int
+    sut_log_compression: LogCompression
+    sut_raw_archive: bool
+    sut_recorder: bool
+    sut_recorder_pre_sec: float
+    sut_recorder_post_sec: float
+    sut_recorder_summary_sec: float
+    sut_deadband: bool
+    sut_deadband_abs: float
+    sut_deadband_rel: float
+    sut_deadband_max_silence_sec: float
+    sut_deadband_attributes: dict[str, dict]
+    sut_adaptive: bool
+    sut_adaptive_min_ms: int
+    sut_adaptive_max_ms: int
+    sut_adaptive_volatility_rel: float
+    sut_adaptive_hold_sec: float
+    sut_link_event_stream: bool
+    sut_netdev: bool
+    sut_netdev_interval_ms: int
+    sut_netdev_source: NetdevSource
+    sut_netdev_counters: list[str]
+    sut_netdev_rates: bool
+    sut_privileged_session: bool
+    sut_schedule_policy: SchedulePolicy
+    sut_engine_threads: int
+    sut_sample_buffer_capacity: int
+    sut_sample_buffer_policy: BufferPolicy
     worker_collect: bool
 
     @classmethod
@@ -94,6 +139,42 @@ class ScanConfig:
             sut_scan_interval_high_res_ms=sut["scan_interval_high_res_ms"],
             sut_scan_interval_tx_errors_ms=sut["scan_interval_tx_errors_ms"],
             sut_scan_max_log_size_kb=sut["scan_max_log_size_kb"],
+            sut_shared_transport=sut.get("shared_transport", False),
+            sut_remote_sampler=sut.get("remote_sampler", False),
+            sut_bundle_commands=sut.get("bundle_commands", False),
+            sut_mlxlink_split=sut.get("mlxlink_split", False),
+            sut_pipeline_depth=sut.get("pipeline_depth", 1),
+            sut_csv_sink=sut.get("csv_sink", False),
+            sut_csv_flush_ms=sut.get("csv_flush_ms", 200),
+            sut_csv_batch_rows=sut.get("csv_batch_rows", 256),
+            sut_log_segments=sut.get("log_segments", 0),
+            sut_log_compression=LogCompression(sut.get("log_compression", LogCompression.GZIP.value)),
+            sut_raw_archive=sut.get("raw_archive", False),
+            sut_recorder=sut.get("recorder", False),
+            sut_recorder_pre_sec=sut.get("recorder_pre_sec", 10),
+            sut_recorder_post_sec=sut.get("recorder_post_sec", 10),
+            sut_recorder_summary_sec=sut.get("recorder_summary_sec", 1),
+            sut_deadband=sut.get("deadband", False),
+            sut_deadband_abs=sut.get("deadband_abs", 0.0),
+            sut_deadband_rel=sut.get("deadband_rel", 0.0),
+            sut_deadband_max_silence_sec=sut.get("deadband_max_silence_sec", 60),
+            sut_deadband_attributes=sut.get("deadband_attributes", {}),
+            sut_adaptive=sut.get("adaptive", False),
+            sut_adaptive_min_ms=sut.get("adaptive_min_ms", 20),
+            sut_adaptive_max_ms=sut.get("adaptive_max_ms", 5000),
+            sut_adaptive_volatility_rel=sut.get("adaptive_volatility_rel", 0.01),
+            sut_adaptive_hold_sec=sut.get("adaptive_hold_sec", 30),
+            sut_link_event_stream=sut.get("link_event_stream", False),
+            sut_netdev=sut.get("netdev", False),
+            sut_netdev_interval_ms=sut.get("netdev_interval_ms", sut["scan_interval_tx_errors_ms"]),
+            sut_netdev_source=NetdevSource(sut.get("netdev_source", NetdevSource.SYSFS.value)),
+            sut_netdev_counters=sut.get("netdev_counters", []),
+            sut_netdev_rates=sut.get("netdev_rates", False),
+            sut_privileged_session=sut.get("privileged_session", False),
+            sut_schedule_policy=SchedulePolicy(sut.get("schedule_policy", SchedulePolicy.DELAY.value)),
+            sut_engine_threads=sut.get("engine_threads", 0),
+            sut_sample_buffer_capacity=sut.get("sample_buffer_capacity", 4096),
+            sut_sample_buffer_policy=BufferPolicy(sut.get("sample_buffer_policy", BufferPolicy.OVERWRITE.value)),
             worker_collect=data.get("worker_collect", False),
         )
 
@@ -136,6 +217,51 @@ class ScanConfig:
         if self.sut_scan_max_log_size_kb <= 0:
             errors.append(f"Invalid sut_scan_max_log_size_kb: {self.sut_scan_max_log_size_kb} (must be > 0)")
 
+        if self.sut_engine_threads < 0:
+            errors.append(f"Invalid sut_engine_threads: {self.sut_engine_threads} (must be >= 0)")
+        if self.sut_pipeline_depth < 1:
+            errors.append(f"Invalid sut_pipeline_depth: {self.sut_pipeline_depth} (must be >= 1)")
+        if self.sut_csv_flush_ms <= 0:
+            errors.append(f"Invalid sut_csv_flush_ms: {self.sut_csv_flush_ms} (must be > 0)")
+        if self.sut_csv_batch_rows <= 0:
+            errors.append(f"Invalid sut_csv_batch_rows: {self.sut_csv_batch_rows} (must be > 0)")
+        if self.sut_log_segments < 0:
+            errors.append(f"Invalid sut_log_segments: {self.sut_log_segments} (must be >= 0)")
+        if not compression_available(self.sut_log_compression):
+            errors.append(f"Invalid sut_log_compression: {self.sut_log_compression.value} (not supported by Python)")
+        if self.sut_recorder_pre_sec < 0 or self.sut_recorder_post_sec < 0:
+            errors.append(
+                f"Invalid sut_recorder_pre_sec/post_sec: {self.sut_recorder_pre_sec}/{self.sut_recorder_post_sec} "
+                "(must be >= 0)"
+            )
+        if self.sut_recorder_summary_sec <= 0:
+            errors.append(f"Invalid sut_recorder_summary_sec: {self.sut_recorder_summary_sec} (must be > 0)")
+        if self.sut_deadband_abs < 0 or self.sut_deadband_rel < 0:
+            errors.append(
+                f"Invalid sut_deadband_abs/rel: {self.sut_deadband_abs}/{self.sut_deadband_rel} (must be >= 0)"
+            )
+        if self.sut_deadband_max_silence_sec <= 0:
+            errors.append(f"Invalid sut_deadband_max_silence_sec: {self.sut_deadband_max_silence_sec} (must be > 0)")
+        if not 0 < self.sut_adaptive_min_ms <= self.sut_adaptive_max_ms:
+            errors.append(
+                f"Invalid sut_adaptive_min_ms/max_ms: {self.sut_adaptive_min_ms}/{self.sut_adaptive_max_ms} "
+                "(must be 0 < min <= max)"
+            )
+        if self.sut_adaptive_volatility_rel < 0 or self.sut_adaptive_hold_sec < 0:
+            errors.append(
+                f"Invalid sut_adaptive_volatility_rel/hold_sec: {self.sut_adaptive_volatility_rel}/"
+                f"{self.sut_adaptive_hold_sec} (must be >= 0)"
+            )
+        if self.sut_netdev_interval_ms <= 0:
+            errors.append(f"Invalid sut_netdev_interval_ms: {self.sut_netdev_interval_ms} (must be > 0)")
+        known = PROC_COUNTERS if self.sut_netdev_source == NetdevSource.PROC else SYSFS_COUNTERS
+        unknown = [counter for counter in self.sut_netdev_counters if counter not in known]
+        if unknown:
+            errors.append(f"Invalid sut_netdev_counters: {unknown} (not read from {self.sut_netdev_source.value})")
+
+        if self.sut_sample_buffer_capacity <= 0:
+            errors.append(f"Invalid sut_sample_buffer_capacity: {self.sut_sample_buffer_capacity} (must be > 0)")
+
         if errors:
             logger.error(f"{LogMsg.CONFIG_VALIDATION_FAILED.value}:")
             for error in errors:
@@ -1,6 +1,19 @@
 """Connection management package."""
 
+from src.core.connect.broker import BrokerConnection, broker_available
 from src.core.connect.local import LocalConnection
+from src.core.connect.pool import PooledSshConnection, SshTransportPool
+from src.core.connect.sampler import RemoteSampler, SampledConnection
 from src.core.connect.ssh import SshConnection, create_ssh_connection
 
-__all__ = ["LocalConnection", "SshConnection", "create_ssh_connection"]
+__all__ = [
+    "BrokerConnection",
+    "LocalConnection",
+    "PooledSshConnection",
+    "RemoteSampler",
+    "SampledConnection",
+    "SshConnection",
+    "SshTransportPool",
+    "broker_available",
+    "create_ssh_connection",
+]
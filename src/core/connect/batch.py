@@ -0,0 +1,285 @@
+"""Framing helpers for batched command execution.
+
+Several commands are shipped as one bash script and executed in a single
+round trip. Each command's stdout, stderr, exit code and elapsed time are
+delimited by sentinel lines carrying a random per-batch token, so the
+combined output can be split back into individual results.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import re
+import secrets
+import shlex
+
+from src.core.result import CmdResult
+
+_ERR_FILE = "__ic_err"
+
+
+@dataclass(frozen=True)
+class BatchPart:
+    """Output of one command within a batch."""
+
+    stdout: str
+    stderr: str
+    rcode: int
+    elapsed_ms: float
+    complete: bool = True
+
+
+def new_batch_token() -> str:
+    """Generate random token used to build unique sentinel markers.
+
+    Returns:
+        Hex token
+    """
+    return secrets.token_hex(8)
+
+
+def _marker(token: str, index: int, kind: str) -> str:
+    return f"__IC_{token}_{index}_{kind}__"
+
+
+def sudo_command(cmd: str, token: str) -> str:
+    """Build command running cmd as root with the sudo password fed on stdin.
+
+    Write sudo_stdin() before cmd's own input. sudo reads the password line
+    only when it prompts; NOPASSWD rules, cached credentials and root logins
+    leave it on stdin. The root shell therefore discards stdin up to and
+    including the sentinel line before cmd starts, so the password never
+    reaches cmd (bash -s would run it and print it in an error on stderr).
+
+    Args:
+        cmd: Command to run as root (reads the remaining stdin)
+        token: Unique token used to build the sentinel line
+
+    Returns:
+        Shell command
+    """
+    sentinel = _marker(token, 0, "SUDO")
+    skip = f'while IFS= read -r __ic_l && [ "$__ic_l" != {sentinel} ]; do :; done; {cmd}'
+    return f"sudo -S -p '' bash -c {shlex.quote(skip)}"
+
+
+def sudo_stdin(sudo_pass: str, token: str) -> str:
+    """Build stdin lines expected by sudo_command(): password, then sentinel.
+
+    Args:
+        sudo_pass: Sudo password
+        token: Token passed to sudo_command()
+
+    Returns:
+        Stdin prefix (newline terminated)
+    """
+    return f"{sudo_pass}\n{_marker(token, 0, 'SUDO')}\n"
+
+
+def redact(text: str, secret: str) -> str:
+    """Mask a secret in text before it is logged.
+
+    Args:
+        text: Text to log
+        secret: Secret to mask (nothing is masked when empty)
+
+    Returns:
+        Text with every occurrence of secret replaced
+    """
+    return text.replace(secret, "***") if secret else text
+
+
+def batch_prelude() -> list[str]:
+    """Build shell lines shared by all framed commands of a script or session.
+
+    Defines the stderr capture file and __ic_now, which stores the wall clock
+    in ns in $__ic_ns (forkless via $EPOCHREALTIME on bash 5, date otherwise).
+
+    Returns:
+        Shell lines
+    """
+    return [
+        f"{_ERR_FILE}=$(mktemp)",
+        "__ic_now() { if [ -n \"$EPOCHREALTIME\" ]; then __ic_ns=\"${EPOCHREALTIME/[.,]/}000\"; "
+        "else __ic_ns=$(date +%s%N); fi; }",
+    ]
+
+
+def build_command_frame(cmd: str, token: str, index: int) -> str:
+    """Build framed shell snippet for one command.
+
+    The command runs in its own subshell with stdin closed and stderr
+    captured to the prelude temp file, so a failing or exiting command never
+    aborts the surrounding script or session.
+
+    Args:
+        cmd: Command to execute
+        token: Unique batch/session token
+        index: Command index within the token
+
+    Returns:
+        Shell snippet (newline terminated)
+    """
+    lines = (
+        f"printf '%s\\n' '{_marker(token, index, 'OUT')}'",
+        "__ic_now; __ic_t0=$__ic_ns",
+        f'( {cmd}\n) </dev/null 2>"${_ERR_FILE}"',
+        "__ic_rc=$?",
+        "__ic_now; __ic_t1=$__ic_ns",
+        f"printf '\\n%s\\n' '{_marker(token, index, 'ERR')}'",
+        f'cat "${_ERR_FILE}"',
+        f"printf '\\n%s %s %s\\n' '{_marker(token, index, 'END')}' \"$__ic_rc\" \"$((__ic_t1 - __ic_t0))\"",
+    )
+    return "\n".join(lines) + "\n"
+
+
+def build_batch_script(cmds: list[str], token: str) -> str:
+    """Build bash script running commands sequentially with framed output.
+
+    Args:
+        cmds: Commands to execute
+        token: Unique batch token (see new_batch_token)
+
+    Returns:
+        Script text to feed to 'bash -s'
+    """
+    lines = batch_prelude()
+    lines.extend(build_command_frame(cmd, token, i) for i, cmd in enumerate(cmds))
+    lines.append(f'rm -f "${_ERR_FILE}"')
+    return "\n".join(lines) + "\n"
+
+
+def split_batch_output(output: str, count: int, token: str) -> list[BatchPart]:
+    """Split framed batch output into per-command parts.
+
+    Commands whose markers are missing (batch killed or timed out) are
+    returned as incomplete parts with rcode -1 and whatever output arrived.
+
+    Args:
+        output: Combined stdout of the batch script
+        count: Number of commands in the batch
+        token: Batch token used to build the script
+
+    Returns:
+        One BatchPart per command, in submission order
+    """
+    parts: list[BatchPart] = []
+    pos = 0
+    for i in range(count):
+        begin = f"{_marker(token, i, 'OUT')}\n"
+        err_mark = f"\n{_marker(token, i, 'ERR')}\n"
+        end_re = re.compile(rf"\n{re.escape(_marker(token, i, 'END'))} (-?\d+) (-?\d+)\n")
+
+        start = output.find(begin, pos)
+        if start < 0:
+            parts.append(BatchPart("", "Batch output missing", -1, 0.0, complete=False))
+            continue
+        out_start = start + len(begin)
+
+        err_pos = output.find(err_mark, out_start)
+        if err_pos < 0:
+            parts.append(BatchPart(output[out_start:], "Batch output truncated", -1, 0.0, complete=False))
+            pos = len(output)
+            continue
+
+        err_start = err_pos + len(err_mark)
+        end_match = end_re.search(output, err_start - 1)  # END line may directly follow ERR line
+        if end_match is None:
+            stderr = output[err_start:]
+            parts.append(BatchPart(output[out_start:err_pos], stderr or "Batch output truncated", -1, 0.0, False))
+            pos = len(output)
+            continue
+
+        elapsed_ns = int(end_match.group(2))
+        parts.append(
+            BatchPart(
+                stdout=output[out_start:err_pos],
+                stderr=output[err_start : end_match.start()],
+                rcode=int(end_match.group(1)),
+                elapsed_ms=max(elapsed_ns, 0) / 1_000_000,
+            )
+        )
+        pos = end_match.end()
+
+    return parts
+
+
+def _strip_frame_newline(data: bytes) -> str:
+    """Drop the newline added by the frame before a marker and decode."""
+    return (data[:-1] if data.endswith(b"\n") else data).decode(errors="replace")
+
+
+def read_framed_part(readline: Callable[[], bytes], token: str, index: int) -> BatchPart:
+    """Read one framed command result from a line based byte stream.
+
+    Used by long-lived sessions where output arrives incrementally instead of
+    as one complete string.
+
+    Args:
+        readline: Callable returning the next line as bytes (b"" on EOF)
+        token: Session token used to build the frame
+        index: Command index used to build the frame
+
+    Returns:
+        BatchPart (incomplete if the stream ended early)
+    """
+    begin = f"{_marker(token, index, 'OUT')}\n".encode()
+    err_mark = f"{_marker(token, index, 'ERR')}\n".encode()
+    end_prefix = f"{_marker(token, index, 'END')} ".encode()
+
+    line = readline()
+    while line and line != begin:
+        line = readline()
+    if not line:
+        return BatchPart("", "Session output missing", -1, 0.0, complete=False)
+
+    out: list[bytes] = []
+    while (line := readline()) and line != err_mark:
+        out.append(line)
+    if not line:
+        return BatchPart(_strip_frame_newline(b"".join(out)), "Session output truncated", -1, 0.0, complete=False)
+
+    err: list[bytes] = []
+    while (line := readline()) and not line.startswith(end_prefix):
+        err.append(line)
+    if not line:
+        return BatchPart(_strip_frame_newline(b"".join(out)), "Session output truncated", -1, 0.0, complete=False)
+
+    rc, elapsed_ns = line[len(end_prefix) :].split()
+    return BatchPart(
+        stdout=_strip_frame_newline(b"".join(out)),
+        stderr=_strip_frame_newline(b"".join(err)),
+        rcode=int(rc),
+        elapsed_ms=max(int(elapsed_ns), 0) / 1_000_000,
+    )
+
+
+def to_cmd_results(
+    cmds: list[str], parts: list[BatchPart], send_ms: float = 0.0, read_ms: float = 0.0
+) -> list[CmdResult]:
+    """Convert batch parts to command results.
+
+    Per-command elapsed time is reported as parsed_ms (and exec_time in
+    seconds); send_ms/read_ms are the shared round trip of the whole batch.
+
+    Args:
+        cmds: Commands in submission order
+        parts: Parts returned by split_batch_output
+        send_ms: Batch send time in milliseconds
+        read_ms: Batch read time in milliseconds
+
+    Returns:
+        One CmdResult per command
+    """
+    return [
+        CmdResult(
+            cmd=cmd,
+            stdout=part.stdout,
+            stderr=part.stderr,
+            rcode=part.rcode,
+            exec_time=part.elapsed_ms / 1000,
+            send_ms=send_ms,
+            read_ms=read_ms,
+            parsed_ms=part.elapsed_ms,
+        )
+        for cmd, part in zip(cmds, parts, strict=True)
+    ]
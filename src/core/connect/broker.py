@@ -0,0 +1,437 @@
+"""Local connection broker client.
+
+A broker daemon (see broker_daemon.py, started with main_broker.py) owns the
+SSH transports of a workstation and serves exec and shell requests from any
+process of this project over a Unix socket, similar to an OpenSSH
+ControlMaster. Processes started while the broker runs reuse its
+authenticated transports instead of logging in through the jump host again.
+
+Protocol: one JSON object per line in each direction. The first request of
+a client is 'attach' with the route credentials; later requests ('exec',
+'exec_many', 'shell_open', 'shell_exec', 'shell_clear', 'shell_close') run
+on that route. Every response carries "ok" and either data or "error".
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import stat
+import struct
+import threading
+from typing import Any
+
+from src.core.enum.messages import LogMsg
+from src.core.result import CmdResult
+from src.interfaces.component import IConnection
+from src.models.config import Host
+from src.platform.enums.log import LogName
+
+BROKER_SOCKET_ENV = "IC_BROKER_SOCKET"
+
+
+def default_socket_path() -> Path:
+    """Get broker socket path ($IC_BROKER_SOCKET, else per-user runtime dir).
+
+    Returns:
+        Socket path
+    """
+    if env_path := os.environ.get(BROKER_SOCKET_ENV):
+        return Path(env_path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"  # noqa: S108
+    return Path(runtime_dir) / f"interface-check-broker-{os.getuid()}.sock"
+
+
+def connect_broker_socket(path: Path, timeout: float | None = None) -> socket.socket:
+    """Connect to a broker socket owned and served by the current user.
+
+    Credentials are sent to the broker, so a socket another user created
+    (e.g. in the shared /tmp fallback directory) is refused: the socket file
+    must belong to us and, where the platform reports it (SO_PEERCRED), so
+    must the process listening on it.
+
+    Args:
+        path: Socket path
+        timeout: Optional socket timeout in seconds
+
+    Returns:
+        Connected socket
+
+    Raises:
+        PermissionError: If the socket or the listening process belongs to another user
+        OSError: If no broker listens on the path
+    """
+    st = path.stat()
+    if not stat.S_ISSOCK(st.st_mode):
+        msg = f"Not a socket: {path}"
+        raise OSError(msg)
+    if st.st_uid != os.getuid():
+        msg = f"Broker socket owned by uid {st.st_uid}: {path}"
+        raise PermissionError(msg)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        if hasattr(socket, "SO_PEERCRED"):
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            _, uid, _ = struct.unpack("3i", creds)
+            if uid != os.getuid():
+                msg = f"Broker process runs as uid {uid}: {path}"
+                raise PermissionError(msg)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def broker_available(socket_path: Path | None = None) -> bool:
+    """Check if a broker of the current user is listening (stale or foreign sockets are ignored).
+
+    Args:
+        socket_path: Socket path (default: default_socket_path())
+
+    Returns:
+        True if broker accepts connections
+    """
+    path = socket_path or default_socket_path()
+    try:
+        connect_broker_socket(path, timeout=0.5).close()
+    except PermissionError as e:
+        logging.getLogger(LogName.MAIN.value).warning(f"Ignoring broker socket: {e}")
+        return False
+    except OSError:
+        return False
+    return True
+
+
+def result_to_dict(result: CmdResult) -> dict[str, Any]:
+    """Serialize CmdResult for the broker protocol.
+
+    Args:
+        result: Command result
+
+    Returns:
+        JSON compatible dict
+    """
+    return {
+        "cmd": result.cmd,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "rcode": result.rcode,
+        "exec_time": result.time,
+        "send_ms": result.send_ms,
+        "read_ms": result.read_ms,
+        "parsed_ms": result.parsed_ms,
+        "timestamp": result.timestamp,
+    }
+
+
+def result_from_dict(data: dict[str, Any]) -> CmdResult:
+    """Deserialize CmdResult from the broker protocol.
+
+    Args:
+        data: Dict created by result_to_dict
+
+    Returns:
+        Command result
+    """
+    return CmdResult(**data)
+
+
+class BrokerConnection(IConnection):
+    """Connection to a route through the local broker daemon.
+
+    Drop-in replacement for SshConnection (exec, batched exec and the
+    interactive shell API). Each instance uses its own socket, so concurrent
+    workers run concurrently on the broker's shared transport.
+    """
+
+    __slots__ = ("_attach", "_file", "_host", "_lock", "_logger", "_sock", "_socket_path")
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        username: str,
+        password: str,
+        jump_hosts: list[Host] | None = None,
+        sudo_pass: str = "",
+        privileged_session: bool = False,
+        socket_path: Path | None = None,
+    ):
+        """Initialize broker connection (not connected).
+
+        Args:
+            host: Target host IP address
+            username: SSH username
+            password: SSH password
+            jump_hosts: Optional list of jump hosts
+            sudo_pass: Optional sudo password
+            privileged_session: Ask broker to run commands in persistent root shells
+            socket_path: Broker socket (default: default_socket_path())
+        """
+        self._host = host
+        self._socket_path = socket_path or default_socket_path()
+        self._attach = {
+            "op": "attach",
+            "host": host,
+            "username": username,
+            "password": password,
+            "jump_hosts": [
+                {"ip": j.ip, "username": j.username, "password": j.password.get_secret_value()}
+                for j in jump_hosts or []
+            ],
+            "sudo_pass": sudo_pass,
+            "privileged_session": privileged_session,
+        }
+        self._sock: socket.socket | None = None
+        self._file = None
+        self._lock = threading.Lock()
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    @classmethod
+    def from_route(cls, route, socket_path: Path | None = None) -> "BrokerConnection":
+        """Create BrokerConnection from Route configuration.
+
+        Args:
+            route: Route configuration with target and jump hosts
+            socket_path: Broker socket
+
+        Returns:
+            Broker connection for the route
+        """
+        return cls(
+            route.target.ip,
+            route.target.username,
+            route.target.password.get_secret_value(),
+            route.jumps,
+            socket_path=socket_path,
+        )
+
+    def __enter__(self) -> "BrokerConnection":
+        """Enter context manager."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager."""
+        self.disconnect()
+
+    # ========================================================================
+    # Connection Management
+    # ========================================================================
+
+    def connect(self) -> bool:
+        """Connect to broker and attach to route (broker logs in if needed).
+
+        Returns:
+            True if route transport is connected
+        """
+        if self._sock is not None:
+            return True
+
+        try:
+            self._sock = connect_broker_socket(self._socket_path)
+            self._file = self._sock.makefile("rwb")
+        except PermissionError as e:
+            self._logger.warning(f"Refusing broker, credentials not sent: {e}")
+            self._close_socket()
+            return False
+        except OSError:
+            self._logger.exception(f"Broker not reachable at {self._socket_path}")
+            self._close_socket()
+            return False
+
+        response = self._request(self._attach)
+        if not response.get("ok"):
+            self._logger.error(f"{LogMsg.CONN_FAILED.value} via broker: {response.get('error')}")
+            self._close_socket()
+            return False
+
+        self._logger.info(f"Attached to {self._host} via broker ({response.get('summary', '')})")
+        return True
+
+    def disconnect(self) -> None:
+        """Detach from broker (the broker keeps the transport for other processes)."""
+        if self._sock is None:
+            self._logger.debug(f"{LogMsg.CONN_ALREADY_DISCONNECTED.value}: {self._host}")
+            return
+        self._close_socket()
+
+    def _close_socket(self) -> None:
+        """Close socket and file wrapper."""
+        for closable in (self._file, self._sock):
+            if closable is not None:
+                try:
+                    closable.close()
+                except OSError:
+                    pass
+        self._file = None
+        self._sock = None
+
+    def is_connected(self) -> bool:
+        """Check if attached to broker.
+
+        Returns:
+            True if connected
+        """
+        return self._sock is not None
+
+    def _request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send request and wait for its response.
+
+        Args:
+            payload: Request object
+
+        Returns:
+            Response object ({"ok": False, "error": ...} on transport errors)
+        """
+        if self._file is None:
+            return {"ok": False, "error": "Not connected to broker"}
+
+        with self._lock:
+            try:
+                self._file.write(json.dumps(payload).encode() + b"\n")
+                self._file.flush()
+                line = self._file.readline()
+            except OSError as e:
+                self._close_socket()
+                return {"ok": False, "error": f"Broker connection lost: {e}"}
+
+        if not line:
+            self._close_socket()
+            return {"ok": False, "error": "Broker closed connection"}
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = str(e)
+        if not isinstance(response, dict):
+            # Request/response pairing is lost, later responses would not match their requests
+            self._close_socket()
+            return {"ok": False, "error": f"Invalid broker response: {response}"}
+        return response
+
+    # ========================================================================
+    # Command Execution
+    # ========================================================================
+
+    def get_cr_msg_connection(self, cmd: str, lm: LogMsg) -> CmdResult:
+        """Create connection error CmdResult.
+
+        Args:
+            cmd: Command that failed
+            lm: Log message enum
+
+        Returns:
+            CmdResult indicating no active connection
+        """
+        self._logger.error(f"{lm} - {cmd}")
+        return CmdResult.error(cmd, f"{lm} - {cmd}")
+
+    def exec_cmd(
+        self,
+        cmd: str,
+        timeout: int | None = 20,
+        use_time_cmd: bool = False,
+        logger: logging.Logger | None = None,
+    ) -> CmdResult:
+        """Execute command on the broker's shared transport.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds (default: 20)
+            use_time_cmd: Wrap command with 'time' for execution timing
+            logger: Optional logger to use instead of default
+
+        Returns:
+            Command execution result
+        """
+        if not self.is_connected():
+            return self.get_cr_msg_connection(cmd, LogMsg.CONN_FAILED)
+
+        (logger or self._logger).debug(f"Executing command via broker: '{cmd}'")
+        response = self._request({"op": "exec", "cmd": cmd, "timeout": timeout, "use_time_cmd": use_time_cmd})
+        if not response.get("ok"):
+            return CmdResult.error(cmd, response.get("error", "Broker error"))
+        return result_from_dict(response["result"])
+
+    def exec_many(
+        self,
+        cmds: list[str],
+        timeout: int | None = 60,
+        logger: logging.Logger | None = None,
+    ) -> list[CmdResult]:
+        """Execute several commands in one round trip via the broker.
+
+        Args:
+            cmds: Commands to execute, in order
+            timeout: Timeout in seconds for the whole batch (default: 60)
+            logger: Optional logger to use instead of default
+
+        Returns:
+            One CmdResult per command, in submission order
+        """
+        if not self.is_connected():
+            return [self.get_cr_msg_connection(cmd, LogMsg.CONN_FAILED) for cmd in cmds]
+
+        (logger or self._logger).debug(f"Executing batch of {len(cmds)} commands via broker")
+        response = self._request({"op": "exec_many", "cmds": cmds, "timeout": timeout})
+        if not response.get("ok"):
+            return [CmdResult.error(cmd, response.get("error", "Broker error")) for cmd in cmds]
+        return [result_from_dict(r) for r in response["results"]]
+
+    def open_stream(self, cmd: str) -> None:
+        """Long-running streams are not relayed by the broker.
+
+        Args:
+            cmd: Command that would be started
+
+        Returns:
+            None (callers fall back to per-command execution)
+        """
+        self._logger.debug(f"Streams not supported via broker: '{cmd[:60]}'")
+
+    # ========================================================================
+    # Interactive Shell Management
+    # ========================================================================
+
+    def open_shell(self) -> bool:
+        """Open interactive shell on the broker's transport.
+
+        Returns:
+            True if successful
+        """
+        response = self._request({"op": "shell_open"})
+        if not response.get("ok"):
+            self._logger.error(f"{LogMsg.SHELL_OPEN_FAILED.value}: {response.get('error')}")
+        return bool(response.get("ok"))
+
+    def exec_shell_cmd(self, cmd: str, *, until_prompt: bool = True, logger: logging.Logger | None = None) -> str:
+        """Execute command in interactive shell.
+
+        Args:
+            cmd: Command to execute
+            until_prompt: Wait for prompt before returning
+            logger: Optional logger to use instead of default
+
+        Returns:
+            Command output
+
+        Raises:
+            ConnectionError: If shell not open or broker connection lost
+        """
+        (logger or self._logger).debug(f"Executing shell command via broker: {cmd[:100]}")
+        response = self._request({"op": "shell_exec", "cmd": cmd, "until_prompt": until_prompt})
+        if not response.get("ok"):
+            raise ConnectionError(response.get("error", "Broker error"))
+        return response["output"]
+
+    def clear_shell(self) -> None:
+        """Clear shell buffer."""
+        self._request({"op": "shell_clear"})
+
+    def close_shell(self) -> None:
+        """Close interactive shell session."""
+        self._request({"op": "shell_close"})
@@ -0,0 +1,259 @@
+"""Local connection broker daemon.
+
+Serves the broker protocol (see broker.py) on a Unix socket. Transports are
+kept in an SshTransportPool; the broker holds one lease per route itself, so
+an authenticated transport outlives the clients that opened it and the next
+CLI run or GUI tab attaches without a new jump host handshake. Each client
+gets its own interactive shell as a view on the shared transport. Routes are
+keyed by their credentials too, so a client only gets a transport that was
+authenticated with the credentials it sent.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import socketserver
+import threading
+from typing import Any
+
+from pydantic import SecretStr
+
+from src.core.connect.broker import connect_broker_socket, default_socket_path, result_to_dict
+from src.core.connect.pool import PooledSshConnection, RouteKey, SshTransportPool
+from src.core.connect.ssh import SshConnection
+from src.models.config import Host
+from src.platform.enums.log import LogName
+
+
+class _BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server carrying the broker reference."""
+
+    daemon_threads = True
+    broker: "SshBroker"
+
+
+class _ClientHandler(socketserver.StreamRequestHandler):
+    """Serve one client: attach to a route, then run its requests."""
+
+    def setup(self) -> None:
+        """Initialize per-client state."""
+        super().setup()
+        self._lease: PooledSshConnection | None = None
+        self._shell: SshConnection | None = None
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    def handle(self) -> None:
+        """Read requests until the client disconnects."""
+        broker = self.server.broker
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = self._dispatch(broker, request)
+            except Exception as e:
+                self._logger.exception("Broker: request failed")
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+    def finish(self) -> None:
+        """Release shell view and lease of the client."""
+        if self._shell:
+            self._shell.disconnect()
+        if self._lease:
+            self._lease.disconnect()
+        super().finish()
+
+    def _dispatch(self, broker: "SshBroker", request: dict[str, Any]) -> dict[str, Any]:  # noqa: PLR0911
+        """Run one request.
+
+        Args:
+            broker: Owning broker
+            request: Decoded request
+
+        Returns:
+            Response object
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "summary": broker.summary()}
+        if op == "attach":
+            self._lease = broker.attach(request)
+            if self._lease is None:
+                return {"ok": False, "error": f"Connection to {request.get('host')} failed"}
+            return {"ok": True, "summary": broker.summary()}
+
+        if self._lease is None:
+            return {"ok": False, "error": "Not attached"}
+
+        if op == "exec":
+            result = self._lease.exec_cmd(request["cmd"], request.get("timeout"), request.get("use_time_cmd", False))
+            return {"ok": True, "result": result_to_dict(result)}
+        if op == "exec_many":
+            results = self._lease.exec_many(request["cmds"], request.get("timeout"))
+            return {"ok": True, "results": [result_to_dict(r) for r in results]}
+        if op == "shell_open":
+            if self._shell is None:
+                self._shell = self._lease.shell_view()
+            if not self._shell.open_shell():
+                return {"ok": False, "error": "Failed to open shell"}
+            return {"ok": True}
+        if op == "shell_exec":
+            if self._shell is None:
+                return {"ok": False, "error": "Shell not opened"}
+            output = self._shell.exec_shell_cmd(request["cmd"], until_prompt=request.get("until_prompt", True))
+            return {"ok": True, "output": output}
+        if op == "shell_clear":
+            if self._shell:
+                self._shell.clear_shell()
+            return {"ok": True}
+        if op == "shell_close":
+            if self._shell:
+                self._shell.disconnect()
+                self._shell = None
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+class SshBroker:
+    """Own SSH transports and share them with local processes."""
+
+    def __init__(self, socket_path: Path | None = None, keepalive_interval: int = 30, max_channels: int = 8):
+        """Initialize broker (not listening).
+
+        Args:
+            socket_path: Unix socket path (default: default_socket_path())
+            keepalive_interval: Keepalive interval in seconds for shared transports
+            max_channels: Concurrent exec channels per transport
+        """
+        self._socket_path = socket_path or default_socket_path()
+        self._pool = SshTransportPool(keepalive_interval=keepalive_interval, max_channels=max_channels)
+        # One lease per route held by the broker keeps transports open between clients
+        self._held: dict[RouteKey, PooledSshConnection] = {}
+        self._lock = threading.Lock()
+        self._server: _BrokerServer | None = None
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    @property
+    def socket_path(self) -> Path:
+        """Get socket path.
+
+        Returns:
+            Unix socket path
+        """
+        return self._socket_path
+
+    def attach(self, request: dict[str, Any]) -> PooledSshConnection | None:
+        """Create connected client lease for the requested route.
+
+        Args:
+            request: Attach request with route credentials
+
+        Returns:
+            Connected lease or None if the route cannot be reached
+        """
+        jump_hosts = [
+            Host(ip=j["ip"], username=j["username"], password=SecretStr(j["password"]))
+            for j in request.get("jump_hosts", [])
+        ]
+        route = (request["host"], request["username"], request["password"], jump_hosts, request.get("sudo_pass", ""))
+        privileged = request.get("privileged_session", False)
+        group = self._credentials_group(request)
+        key = SshTransportPool.route_key(request["host"], request["username"], jump_hosts, group)
+
+        with self._lock:
+            if key not in self._held:
+                held = self._pool.lease(*route, privileged_session=privileged, group=group)
+                if not held.connect():
+                    return None
+                self._held[key] = held
+
+        lease = self._pool.lease(*route, privileged_session=privileged, group=group)
+        return lease if lease.connect() else None
+
+    @staticmethod
+    def _credentials_group(request: dict[str, Any]) -> str:
+        """Derive the pool group of a route from the credentials of an attach request.
+
+        Clients with other passwords, sudo password or session mode get a
+        transport of their own instead of one another client authenticated.
+
+        Args:
+            request: Attach request with route credentials
+
+        Returns:
+            Hex digest of the credentials
+        """
+        credentials = [
+            request["password"],
+            [j["password"] for j in request.get("jump_hosts", [])],
+            request.get("sudo_pass", ""),
+            bool(request.get("privileged_session", False)),
+        ]
+        return hashlib.sha256(json.dumps(credentials).encode()).hexdigest()
+
+    def summary(self) -> str:
+        """Generate one-line broker summary.
+
+        Returns:
+            Pool summary
+        """
+        return self._pool.summary()
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until shutdown() (returns at once if the socket is in use)."""
+        if not self._remove_stale_socket():
+            return
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Socket is created with owner-only permissions: clients send credentials
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _BrokerServer(str(self._socket_path), _ClientHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.broker = self
+
+        self._logger.info(f"Broker listening on {self._socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self._socket_path.unlink()
+            self._pool.close_all()
+            self._logger.info("Broker stopped")
+
+    def _remove_stale_socket(self) -> bool:
+        """Remove a socket left behind by a broker that is gone.
+
+        Returns:
+            True if the socket path is free, False if a broker listens on it or it is not ours
+        """
+        path = self._socket_path
+        if not path.exists():
+            return True
+        try:
+            connect_broker_socket(path, timeout=0.5).close()
+        except PermissionError as e:
+            reason = str(e)
+        except OSError:
+            if path.is_socket():  # Nobody listening: left behind by a broker that is gone
+                self._logger.info(f"Removing stale broker socket: {path}")
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+                return True
+            reason = f"Not a socket: {path}"
+        else:
+            reason = f"Another broker is listening on {path}"
+        self._logger.error(f"Broker not started: {reason}")
+        return False
+
+    def shutdown(self) -> None:
+        """Stop serving (call from another thread)."""
+        if self._server:
+            self._server.shutdown()
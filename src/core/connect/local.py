@@ -1,9 +1,23 @@
 """Local command execution without SSH overhead."""
 
 import logging
+import os
+import shlex
+import signal
 import subprocess
 import time
 
+from src.core.connect.batch import (
+    build_batch_script,
+    new_batch_token,
+    redact,
+    split_batch_output,
+    sudo_command,
+    sudo_stdin,
+    to_cmd_results,
+)
+from src.core.connect.privileged import PrivilegedSessionPool
+from src.core.connect.stream import CmdStream
 from src.core.enum.messages import LogMsg
 from src.core.parser import SutTimeParser
 from src.core.result import CmdResult
@@ -45,17 +59,26 @@ class LocalConnection(IConnection):
     Executes commands directly on the local system using subprocess.
     """
 
-    __slots__ = ("_host", "_logger", "_sudo_pass")
+    __slots__ = ("_host", "_logger", "_privileged", "_sudo_pass")
 
-    def __init__(self, host: str = "localhost", sudo_pass: str = ""):
+    def __init__(
+        self, host: str = "localhost", sudo_pass: str = "", privileged_session: bool = False, max_sessions: int = 1
+    ):
         """Initialize local connection.
 
         Args:
             host: Host identifier for logging (default: localhost)
             sudo_pass: Optional sudo password for privileged commands
+            privileged_session: Run commands in a persistent root shell instead of per-command sudo
+            max_sessions: Root shells running commands concurrently (privileged_session only)
         """
         self._host = host
         self._sudo_pass = sudo_pass
+        self._privileged = (
+            PrivilegedSessionPool(self.open_stream, sudo_pass, max_sessions)
+            if privileged_session and sudo_pass
+            else None
+        )
 
         self._logger = logging.getLogger(f"{LogName.MAIN.value}.{host}")
 
@@ -78,7 +101,9 @@ class LocalConnection(IConnection):
         return True
 
     def disconnect(self) -> None:
-        """Disconnect (no-op for local execution)."""
+        """Disconnect (closes the privileged session if any)."""
+        if self._privileged:
+            self._privileged.close_all()
         self._logger.debug(LogMsg.LOCAL_CLOSED.value)
 
     def is_connected(self) -> bool:
@@ -110,6 +135,15 @@ class LocalConnection(IConnection):
         exec_cmd = cmd
         log = logger or self._logger
 
+        if self._privileged and self._privileged.available:
+            log.debug(f"{LogMsg.LOCAL_CMD_EXEC.value} (privileged session): '{cmd}' (timeout: {timeout}s)")
+            result = self._privileged.exec(cmd, timeout)
+            if result is not None:
+                _log_exec_time(result.time, result.rcode, 0.0, 0.0, result.parsed_ms or None, log)
+                if result.rcode != 0:
+                    log.warning(f"{LogMsg.LOCAL_CMD_STDERR.value}: {result.stderr[:200]}")
+                return result
+
         # Wrap with time command if requested
         if use_time_cmd:
             if self._sudo_pass:
@@ -178,3 +212,89 @@ class LocalConnection(IConnection):
         except Exception as e:
             log.exception(f"{LogMsg.LOCAL_CMD_FAILED.value}: {cmd}")
             return CmdResult(exec_cmd, "", f"Error: {e}", -1)
+
+    def exec_many(
+        self,
+        cmds: list[str],
+        timeout: int | None = 60,
+        logger: logging.Logger | None = None,
+    ) -> list[CmdResult]:
+        """Execute several commands in one framed bash script.
+
+        Args:
+            cmds: Commands to execute, in order
+            timeout: Timeout in seconds for the whole batch (default: 60)
+            logger: Optional logger to use instead of default
+
+        Returns:
+            One CmdResult per command, in submission order
+        """
+        if not cmds:
+            return []
+
+        log = logger or self._logger
+        token = new_batch_token()
+        script = build_batch_script(cmds, token)
+        runner = shlex.split(sudo_command("bash -s", token)) if self._sudo_pass else ["bash", "-s"]
+        payload = sudo_stdin(self._sudo_pass, token) + script if self._sudo_pass else script
+
+        log.debug(f"{LogMsg.LOCAL_CMD_EXEC.value}: batch of {len(cmds)} commands (timeout: {timeout}s)")
+
+        try:
+            exec_start = time.perf_counter()
+            result = subprocess.run(  # noqa: S603
+                runner,
+                capture_output=True,
+                text=True,
+                input=payload,
+                timeout=timeout,
+                check=False,
+            )
+            exec_time = time.perf_counter() - exec_start
+        except subprocess.TimeoutExpired:
+            log.exception(f"{LogMsg.COMMAND_TIMEOUT.value}: batch of {len(cmds)} commands")
+            return [CmdResult(cmd, "", "Timeout", -1) for cmd in cmds]
+        except Exception as e:
+            log.exception(f"{LogMsg.LOCAL_CMD_FAILED.value}: batch of {len(cmds)} commands")
+            return [CmdResult(cmd, "", f"Error: {e}", -1) for cmd in cmds]
+
+        _log_exec_time(exec_time, result.returncode, 0.0, 0.0, None, log)
+        if result.returncode != 0 and result.stderr:
+            # Per-command stderr is framed into stdout, this is the runner's own (sudo) output
+            log.warning(f"{LogMsg.LOCAL_CMD_STDERR.value}: {redact(result.stderr, self._sudo_pass)[:200]}")
+
+        return to_cmd_results(cmds, split_batch_output(result.stdout, len(cmds), token))
+
+    def open_stream(self, cmd: str) -> CmdStream | None:
+        """Start long-running local command with binary pipes.
+
+        Args:
+            cmd: Command to start
+
+        Returns:
+            Stream with binary stdin/stdout pipes, or None on failure
+        """
+        try:
+            proc = subprocess.Popen(  # noqa: S602
+                cmd,
+                shell=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,  # Own process group so close() also ends running children
+            )
+        except OSError:
+            self._logger.exception(f"{LogMsg.LOCAL_CMD_FAILED.value}: {cmd}")
+            return None
+
+        def closer() -> None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=0.5)
+            except (OSError, subprocess.TimeoutExpired):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except OSError:
+                    proc.kill()
+
+        return CmdStream(cmd, proc.stdin, proc.stdout, closer)
@@ -0,0 +1,421 @@
+"""Shared SSH transport pool.
+
+Keeps one authenticated SshConnection per route (jump chain + target) and
+hands out lightweight leases to workers. Leases run their commands on
+concurrent exec channels of the shared transport (bounded by max_channels),
+so N workers cost a single jump host + target handshake instead of N.
+"""
+
+from dataclasses import dataclass, field
+import logging
+import threading
+from typing import Any
+
+from pydantic import SecretStr
+
+from src.core.connect.ssh import SshConnection
+from src.core.enum.connect import HostType
+from src.core.enum.messages import LogMsg
+from src.core.result import CmdResult
+from src.interfaces.component import IConnection
+from src.models.config import Host
+from src.platform.enums.log import LogName
+
+RouteKey = tuple[str, str, tuple[tuple[str, str], ...], str]
+
+
+@dataclass
+class _PoolEntry:
+    """Shared connection for one route with its lease reference count."""
+
+    connection: SshConnection
+    refs: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SshTransportPool:
+    """Reference counted pool of SSH transports keyed by route.
+
+    A single keepalive thread serves all pooled transports. A transport is
+    closed when its last lease disconnects. Leases of one route normally
+    share one transport; a channel group gives long-lived streams transports
+    of their own, so they cannot use up the session limit of the transport
+    running the sampling commands.
+    """
+
+    def __init__(self, keepalive_interval: int = 30, max_channels: int = 8):
+        """Initialize empty pool.
+
+        Args:
+            keepalive_interval: Keepalive interval in seconds for all pooled transports
+            max_channels: Concurrent exec channels per transport (keep below sshd MaxSessions)
+        """
+        self._keepalive_interval = keepalive_interval
+        self._max_channels = max_channels
+        self._entries: dict[RouteKey, _PoolEntry] = {}
+        self._lock = threading.Lock()
+
+        self._keepalive_thread: threading.Thread | None = None
+        self._stop_keepalive = threading.Event()
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    # ========================================================================
+    # Leases
+    # ========================================================================
+
+    @staticmethod
+    def route_key(host: str, username: str, jump_hosts: list[Host] | None = None, group: str = "") -> RouteKey:
+        """Build pool key for a route.
+
+        Args:
+            host: Target host IP address
+            username: Target SSH username
+            jump_hosts: Optional list of jump hosts
+            group: Channel group ("" for the route's main transport)
+
+        Returns:
+            Hashable route key
+        """
+        return host, username, tuple((j.ip, j.username) for j in jump_hosts or []), group
+
+    def lease(  # noqa: PLR0913
+        self,
+        host: str,
+        username: str,
+        password: str,
+        jump_hosts: list[Host] | None = None,
+        sudo_pass: str = "",
+        privileged_session: bool = False,
+        group: str = "",
+        max_channels: int | None = None,
+    ) -> "PooledSshConnection":
+        """Create lease for a route (connects lazily on lease.connect()).
+
+        Args:
+            host: Target host IP address
+            username: SSH username
+            password: SSH password
+            jump_hosts: Optional list of jump hosts
+            sudo_pass: Optional sudo password
+            privileged_session: Run commands in persistent root shells (set by first lease of a route)
+            group: Channel group; leases of another group use a separate transport
+            max_channels: Concurrent exec channels of the transport (pool default if None, set by first lease)
+
+        Returns:
+            Lease behaving like an SshConnection
+        """
+        key = self.route_key(host, username, jump_hosts, group)
+        with self._lock:
+            if key not in self._entries:
+                connection = SshConnection(
+                    host=host,
+                    username=username,
+                    password=password,
+                    jump_hosts=jump_hosts,
+                    keepalive_interval=0,  # Driven by pool keepalive thread
+                    sudo_pass=sudo_pass,
+                    max_channels=self._max_channels if max_channels is None else max_channels,
+                    privileged_session=privileged_session,
+                )
+                self._entries[key] = _PoolEntry(connection)
+        return PooledSshConnection(self, key)
+
+    def lease_for(
+        self,
+        cfg,
+        host_type: HostType,
+        group: str = "",
+        max_channels: int | None = None,
+        privileged: bool = True,
+    ) -> "PooledSshConnection":
+        """Create lease from scan configuration (pooled create_ssh_connection).
+
+        Args:
+            cfg: Configuration object
+            host_type: Target host type (SLX or SUT)
+            group: Channel group; leases of another group use a separate transport
+            max_channels: Concurrent exec channels of the group transport (pool default if None)
+            privileged: Allow privileged shells when configured (stream groups run without,
+                those would take stream channels)
+
+        Returns:
+            Lease for the configured route
+        """
+        jump_host = Host(ip=cfg.jump_host, username=cfg.jump_user, password=SecretStr(cfg.jump_pass))
+
+        if host_type == HostType.SLX:
+            return self.lease(
+                cfg.slx_host, cfg.slx_user, cfg.slx_pass, [jump_host], group=group, max_channels=max_channels
+            )
+        return self.lease(
+            cfg.sut_host,
+            cfg.sut_user,
+            cfg.sut_pass,
+            [jump_host],
+            cfg.sut_sudo_pass,
+            privileged_session=cfg.sut_privileged_session and privileged,
+            group=group,
+            max_channels=max_channels,
+        )
+
+    def lease_route(self, route) -> "PooledSshConnection":
+        """Create lease from Route configuration.
+
+        Args:
+            route: Route configuration with target and jump hosts
+
+        Returns:
+            Lease for the route
+        """
+        return self.lease(
+            route.target.ip,
+            route.target.username,
+            route.target.password.get_secret_value(),
+            route.jumps,
+        )
+
+    def _acquire(self, key: RouteKey) -> SshConnection | None:
+        """Take a reference on the route transport, connecting if needed.
+
+        Args:
+            key: Route key
+
+        Returns:
+            Connected shared connection or None on failure
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            self._logger.error(f"No pool entry for route: {key[0]}")
+            return None
+
+        # Per-route lock so one slow handshake does not block other routes
+        with entry.lock:
+            if not entry.connection.is_connected():
+                self._logger.info(f"Pool: opening shared transport to {key[0]} ({entry.refs} lease(s) waiting)")
+                if not entry.connection.connect():
+                    return None
+                self._ensure_keepalive()
+            entry.refs += 1
+            self._logger.debug(f"Pool: {key[0]} leased (refs={entry.refs})")
+            return entry.connection
+
+    def _release(self, key: RouteKey) -> None:
+        """Drop a reference on the route transport and close it when unused.
+
+        Args:
+            key: Route key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        with entry.lock:
+            entry.refs = max(entry.refs - 1, 0)
+            self._logger.debug(f"Pool: {key[0]} released (refs={entry.refs})")
+            if entry.refs == 0:
+                self._logger.info(f"Pool: closing unused shared transport to {key[0]}")
+                entry.connection.disconnect()
+
+    # ========================================================================
+    # Pool management
+    # ========================================================================
+
+    def close_all(self) -> None:
+        """Close all pooled transports and stop keepalive thread."""
+        self._stop_keepalive.set()
+        if self._keepalive_thread:
+            self._keepalive_thread.join(timeout=1)
+            self._keepalive_thread = None
+
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+
+        for key, entry in entries:
+            with entry.lock:
+                if entry.refs:
+                    self._logger.warning(f"Pool: closing {key[0]} with {entry.refs} active lease(s)")
+                entry.refs = 0
+                entry.connection.disconnect()
+
+    def summary(self) -> str:
+        """Generate one-line summary of pooled transports.
+
+        Returns:
+            Summary string with route and lease counts
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        leases = sum(e.refs for _, e in entries)
+        active = sum(1 for _, e in entries if e.connection.is_connected())
+        return f"Pooled {active}/{len(entries)} active transports serving {leases} leases"
+
+    def _ensure_keepalive(self) -> None:
+        """Start the shared keepalive thread if not running."""
+        if self._keepalive_interval <= 0 or (self._keepalive_thread and self._keepalive_thread.is_alive()):
+            return
+        self._stop_keepalive.clear()
+        self._keepalive_thread = threading.Thread(target=self._keepalive_loop, name="ssh-pool-keepalive", daemon=True)
+        self._keepalive_thread.start()
+        self._logger.debug(LogMsg.ALIVE_THREAD_START.value)
+
+    def _keepalive_loop(self) -> None:
+        """Send keepalive to every pooled transport until pool is closed."""
+        while not self._stop_keepalive.wait(self._keepalive_interval):
+            with self._lock:
+                connections = [e.connection for e in self._entries.values() if e.refs]
+            for connection in connections:
+                try:
+                    connection.send_keepalive()
+                except Exception:
+                    self._logger.exception(LogMsg.ALIVE_THREAD_FAIL.value)
+
+        self._logger.debug(LogMsg.ALIVE_LOOP_STOP.value)
+
+
+class PooledSshConnection(IConnection):
+    """Lease on a pooled SSH transport.
+
+    Drop-in replacement for SshConnection in workers: connect() takes a
+    reference on the shared transport and disconnect() releases it.
+    Commands run on a dedicated exec channel per call, limited by the
+    shared connection's channel semaphore. Interactive shell calls go to a
+    shell view owned by the lease, so leases never share shell state.
+    """
+
+    __slots__ = ("_conn", "_key", "_logger", "_pool", "_shell")
+
+    # SshConnection API served by the lease's own shell view
+    _SHELL_METHODS = frozenset(
+        {"open_shell", "exec_shell_cmd", "wait_for_prompt", "clear_shell", "close_shell", "shell_ready_ms"}
+    )
+
+    def __init__(self, pool: SshTransportPool, key: RouteKey):
+        """Initialize lease.
+
+        Args:
+            pool: Owning transport pool
+            key: Route key of the shared transport
+        """
+        self._pool = pool
+        self._key = key
+        self._conn: SshConnection | None = None
+        self._shell: SshConnection | None = None
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    def __enter__(self) -> "PooledSshConnection":
+        """Enter context manager."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager."""
+        self.disconnect()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate remaining SshConnection API to the lease's shell view (shell) or shared connection.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            Attribute of the shell view or shared connection
+        """
+        conn = self.__getattribute__("_conn")
+        if conn is None:
+            msg = f"Pooled connection not connected (accessing '{name}')"
+            raise AttributeError(msg)
+        if name in PooledSshConnection._SHELL_METHODS:
+            if self._shell is None:
+                self._shell = conn.shell_view()
+            return getattr(self._shell, name)
+        return getattr(conn, name)
+
+    def connect(self) -> bool:
+        """Take reference on shared transport.
+
+        Returns:
+            True if transport is connected
+        """
+        if self._conn is not None and self._conn.is_connected():
+            return True
+        self._conn = self._pool._acquire(self._key)  # noqa: SLF001
+        return self._conn is not None
+
+    def disconnect(self) -> None:
+        """Release reference on shared transport."""
+        if self._conn is None:
+            self._logger.debug(f"{LogMsg.CONN_ALREADY_DISCONNECTED.value}: {self._key[0]}")
+            return
+        if self._shell is not None:
+            self._shell.disconnect()  # Closes only this lease's shell
+            self._shell = None
+        self._conn = None
+        self._pool._release(self._key)  # noqa: SLF001
+
+    def is_connected(self) -> bool:
+        """Check if shared transport is active.
+
+        Returns:
+            True if connected
+        """
+        return self._conn is not None and bool(self._conn.is_connected())
+
+    def get_cr_msg_connection(self, cmd: str, lm: LogMsg) -> CmdResult:
+        """Create connection error CmdResult.
+
+        Args:
+            cmd: Command that failed
+            lm: Log message enum
+
+        Returns:
+            CmdResult indicating no active connection
+        """
+        self._logger.error(f"{lm} - {cmd}")
+        return CmdResult.error(cmd, f"{lm} - {cmd}")
+
+    def exec_cmd(
+        self,
+        cmd: str,
+        timeout: int | None = 20,
+        use_time_cmd: bool = False,
+        logger: logging.Logger | None = None,
+    ) -> CmdResult:
+        """Execute command on a channel of the shared transport.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds (default: 20)
+            use_time_cmd: Wrap command with 'time' for execution timing
+            logger: Optional logger to use instead of default
+
+        Returns:
+            Command execution result
+        """
+        if not self.is_connected():
+            return self.get_cr_msg_connection(cmd, LogMsg.CONN_FAILED)
+        return self._conn.exec_cmd(cmd, timeout, use_time_cmd, logger)
+
+    def exec_many(
+        self,
+        cmds: list[str],
+        timeout: int | None = 60,
+        logger: logging.Logger | None = None,
+    ) -> list[CmdResult]:
+        """Execute several commands in one round trip on the shared transport.
+
+        Args:
+            cmds: Commands to execute, in order
+            timeout: Timeout in seconds for the whole batch (default: 60)
+            logger: Optional logger to use instead of default
+
+        Returns:
+            One CmdResult per command, in submission order
+        """
+        if not self.is_connected():
+            return [self.get_cr_msg_connection(cmd, LogMsg.CONN_FAILED) for cmd in cmds]
+        return self._conn.exec_many(cmds, timeout, logger)
@@ -0,0 +1,255 @@
+"""Persistent privileged sessions.
+
+Elevates once with 'sudo -S' into a long-lived root bash and runs later
+commands inside it, framed like batched execution (see batch.py). This
+removes the per-command bash + sudo + PAM fork chain from every sample while
+keeping the per-command elapsed time (reported as parsed_ms, the time_cmd
+measurement).
+"""
+
+from collections.abc import Callable
+import logging
+import queue
+import threading
+import time
+
+from src.core.connect.batch import (
+    batch_prelude,
+    build_command_frame,
+    new_batch_token,
+    read_framed_part,
+    sudo_command,
+    sudo_stdin,
+)
+from src.core.connect.stream import CmdStream
+from src.core.result import CmdResult
+from src.platform.enums.log import LogName
+
+StreamOpener = Callable[[str], CmdStream | None]
+
+
+class PrivilegedSession:
+    """One long-lived root shell running one command at a time."""
+
+    SHELL = "bash --noprofile --norc"
+
+    def __init__(self, open_stream: StreamOpener, sudo_pass: str):
+        """Initialize session (not started).
+
+        Args:
+            open_stream: Callable starting a long-running command with pipes
+            sudo_pass: Sudo password
+        """
+        self._open_stream = open_stream
+        self._sudo_pass = sudo_pass
+        self._stream: CmdStream | None = None
+        self._token = new_batch_token()
+        self._index = 0
+        self._no_channel = False
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    @property
+    def is_alive(self) -> bool:
+        """Check if session can run commands.
+
+        Returns:
+            True if started and not closed
+        """
+        return self._stream is not None
+
+    @property
+    def no_channel(self) -> bool:
+        """Check if the last start() failed for lack of a channel (not elevation).
+
+        Returns:
+            True if no channel could be opened
+        """
+        return self._no_channel
+
+    def start(self, timeout: float = 10.0) -> bool:
+        """Elevate once and verify the shell runs as root.
+
+        Args:
+            timeout: Maximum seconds to wait for the elevated shell
+
+        Returns:
+            True if session is ready
+        """
+        self._stream = self._open_stream(sudo_command(self.SHELL, self._token))
+        self._no_channel = self._stream is None
+        if self._stream is None:
+            return False
+
+        try:
+            prelude = "\n".join(batch_prelude()) + "\n"
+            self._stream.write((sudo_stdin(self._sudo_pass, self._token) + prelude).encode())
+        except OSError:
+            self._logger.exception("Privileged session: failed to elevate")
+            self.close()
+            return False
+
+        result = self.exec("id -u", timeout)
+        if result.rcode != 0 or result.stdout != "0":
+            self._logger.warning(f"Privileged session: elevation failed ({result.stderr or result.stdout})")
+            self.close()
+            return False
+        return True
+
+    def exec(self, cmd: str, timeout: float | None = 20) -> CmdResult:
+        """Run command in the root shell.
+
+        On timeout the session is closed (the running command cannot be
+        interrupted otherwise); callers should then start a new session.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds (None waits forever)
+
+        Returns:
+            Command result with elapsed time in parsed_ms
+        """
+        if self._stream is None:
+            return CmdResult.error(cmd, "Privileged session closed")
+
+        index = self._index
+        self._index += 1
+
+        watchdog = threading.Timer(timeout, self.close) if timeout else None
+        start = time.perf_counter()
+        try:
+            self._stream.write(build_command_frame(cmd, self._token, index).encode())
+            send_ms = (time.perf_counter() - start) * 1000
+
+            if watchdog:
+                watchdog.start()
+            read_start = time.perf_counter()
+            part = read_framed_part(self._stream.readline, self._token, index)
+            read_ms = (time.perf_counter() - read_start) * 1000
+        except (OSError, ValueError) as e:
+            self.close()
+            return CmdResult(cmd, "", f"Error: {e}", -1)
+        finally:
+            if watchdog:
+                watchdog.cancel()
+
+        if not part.complete:
+            self.close()
+            return CmdResult(cmd, part.stdout, part.stderr, -1)
+
+        return CmdResult(
+            cmd=cmd,
+            stdout=part.stdout,
+            stderr=part.stderr,
+            rcode=part.rcode,
+            exec_time=time.perf_counter() - start,
+            send_ms=send_ms,
+            read_ms=read_ms,
+            parsed_ms=part.elapsed_ms,
+        )
+
+    def close(self) -> None:
+        """Exit root shell and release its channel (idempotent)."""
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        try:
+            stream.write(b'rm -f "$__ic_err"; exit\n')
+        except (OSError, ValueError):
+            pass
+        stream.close()
+
+
+class PrivilegedSessionPool:
+    """Idle privileged sessions reused across calls, bounded by max_sessions.
+
+    Callers bound concurrency themselves (exec slots); the pool only caps
+    how many elevated shells exist.
+    """
+
+    def __init__(self, open_stream: StreamOpener, sudo_pass: str, max_sessions: int = 1):
+        """Initialize empty pool.
+
+        Args:
+            open_stream: Callable starting a long-running command with pipes
+            sudo_pass: Sudo password
+            max_sessions: Maximum concurrently existing sessions
+        """
+        self._open_stream = open_stream
+        self._sudo_pass = sudo_pass
+        self._max_sessions = max(1, max_sessions)
+        self._idle: queue.LifoQueue[PrivilegedSession] = queue.LifoQueue()
+        self._count = 0
+        self._lock = threading.Lock()
+        self._failed = False
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    @property
+    def available(self) -> bool:
+        """Check if elevation works (False after a failed elevation).
+
+        Returns:
+            True if sessions can be used
+        """
+        return not self._failed
+
+    def exec(self, cmd: str, timeout: float | None = 20) -> CmdResult | None:
+        """Run command in an idle or new privileged session.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds
+
+        Returns:
+            Command result, or None if no session could be started
+        """
+        session = self._checkout()
+        if session is None:
+            return None
+        try:
+            return session.exec(cmd, timeout)
+        finally:
+            self._checkin(session)
+
+    def _checkout(self) -> PrivilegedSession | None:
+        """Take idle session or create one within the limit, starting it if needed."""
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._count < self._max_sessions
+                if create:
+                    self._count += 1
+            session = PrivilegedSession(self._open_stream, self._sudo_pass) if create else self._idle.get()
+
+        if session.is_alive:
+            return session
+        if not self._failed and session.start():
+            self._logger.debug(f"Privileged session started ({self._count}/{self._max_sessions})")
+            return session
+        if session.no_channel:
+            # Transport at its session limit: run this command per-command, retry the session next time
+            self._idle.put(session)
+            return None
+
+        if not self._failed:
+            self._logger.warning("Privileged session unavailable, falling back to per-command sudo")
+        self._failed = True
+        # Hand the slot on so other waiters wake up and see the failure
+        self._idle.put(session)
+        return None
+
+    def _checkin(self, session: PrivilegedSession) -> None:
+        """Return session to idle pool; closed sessions are restarted by the next user."""
+        self._idle.put(session)
+
+    def close_all(self) -> None:
+        """Close all idle sessions."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._count = 0
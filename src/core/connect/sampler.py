@@ -0,0 +1,334 @@
+"""Remote streaming sampler.
+
+Ships the sampling agent (sampler_agent.py) to the SUT and runs it once over
+a single long-lived channel. The agent executes the registered commands at
+their intervals next to the hardware and streams back timestamped,
+length-prefixed records; workers consume them through SampledConnection
+instead of paying one round trip per sample.
+"""
+
+import base64
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import queue
+import threading
+
+from src.core.connect.batch import new_batch_token, sudo_command, sudo_stdin
+from src.core.connect.sampler_agent import READY_ID
+from src.core.connect.stream import CmdStream
+from src.core.enum.messages import LogMsg
+from src.core.result import CmdResult
+from src.interfaces.component import IConnection
+from src.platform.enums.log import LogName
+
+_AGENT_SOURCE = Path(__file__).with_name("sampler_agent.py")
+
+
+@dataclass
+class _SampledCommand:
+    """Registered command with its record queue."""
+
+    cmd_id: int
+    cmd: str
+    interval_ms: int
+    timeout_s: int
+    results: queue.Queue = field(default_factory=queue.Queue)
+    dropped: int = 0
+
+
+class RemoteSampler:
+    """Run registered commands remotely at fixed intervals over one channel.
+
+    Register all commands first, then start(). Records are buffered per
+    command (bounded, oldest dropped) until a worker takes them.
+    """
+
+    READY_TIMEOUT_S = 15
+
+    def __init__(self, connection, sudo_pass: str = "", python: str = "python3", queue_size: int = 1024):
+        """Initialize sampler.
+
+        Args:
+            connection: Connected SshConnection, pooled lease or LocalConnection
+            sudo_pass: Optional sudo password (agent then runs as root)
+            python: Python interpreter on the SUT
+            queue_size: Maximum buffered records per command
+        """
+        self._connection = connection
+        self._sudo_pass = sudo_pass
+        self._token = new_batch_token()
+        self._python = python
+        self._queue_size = queue_size
+
+        self._commands: dict[int, _SampledCommand] = {}
+        self._stream: CmdStream | None = None
+        self._reader: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._running = False
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if agent is streaming records.
+
+        Returns:
+            True if running
+        """
+        return self._running
+
+    def register(self, cmd: str, interval_ms: int, timeout_s: int = 20) -> int:
+        """Register command to sample (before start()).
+
+        Args:
+            cmd: Command to execute remotely
+            interval_ms: Sampling interval in milliseconds
+            timeout_s: Per-execution timeout in seconds
+
+        Returns:
+            Command id used to fetch records
+        """
+        cmd_id = len(self._commands)
+        self._commands[cmd_id] = _SampledCommand(
+            cmd_id, cmd, interval_ms, timeout_s, queue.Queue(maxsize=self._queue_size)
+        )
+        return cmd_id
+
+    def _agent_cmd(self) -> str:
+        """Build command that runs the shipped agent source inline.
+
+        Returns:
+            Shell command
+        """
+        encoded = base64.b64encode(_AGENT_SOURCE.read_bytes()).decode()
+        runner = f"{self._python} -u -c 'import base64;exec(base64.b64decode(\"{encoded}\"))'"
+        return sudo_command(runner, self._token) if self._sudo_pass else runner
+
+    def start(self) -> bool:
+        """Ship agent, send command spec and wait until it reports ready.
+
+        Returns:
+            True if agent is running
+        """
+        if not self._commands:
+            return False
+
+        self._stream = self._connection.open_stream(self._agent_cmd())
+        if self._stream is None:
+            return False
+
+        spec = {
+            "commands": [
+                {"id": c.cmd_id, "cmd": c.cmd, "interval_ms": c.interval_ms, "timeout_s": c.timeout_s}
+                for c in self._commands.values()
+            ]
+        }
+        payload = json.dumps(spec).encode() + b"\n"
+        if self._sudo_pass:
+            payload = sudo_stdin(self._sudo_pass, self._token).encode() + payload
+
+        self._running = True
+        self._reader = threading.Thread(target=self._read_loop, name="remote-sampler", daemon=True)
+        self._reader.start()
+        try:
+            self._stream.write(payload)
+        except OSError:
+            self._logger.exception("Remote sampler: failed to send command spec")
+
+        if not self._ready.wait(self.READY_TIMEOUT_S) or not self._running:
+            self._logger.warning("Remote sampler: agent did not become ready (python3 missing on SUT?)")
+            self.stop()
+            return False
+
+        self._logger.info(f"Remote sampler: streaming {len(self._commands)} commands over one channel")
+        return True
+
+    def stop(self) -> None:
+        """Stop agent, close channel and wake waiting consumers."""
+        stream, self._stream = self._stream, None
+        self._running = False
+        if stream:
+            try:
+                stream.write(b"stop\n")
+            except (OSError, ValueError):
+                pass
+            stream.close()
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=2)
+        for command in self._commands.values():
+            self._offer(command, None)
+
+        dropped = sum(c.dropped for c in self._commands.values())
+        if dropped:
+            self._logger.warning(f"Remote sampler: {dropped} records dropped (consumers too slow)")
+
+    def _offer(self, command: _SampledCommand, item: CmdResult | None) -> None:
+        """Queue record, dropping the oldest one when full."""
+        while True:
+            try:
+                command.results.put_nowait(item)
+            except queue.Full:
+                try:
+                    command.results.get_nowait()
+                    command.dropped += 1
+                except queue.Empty:
+                    pass
+            else:
+                return
+
+    def _read_loop(self) -> None:
+        """Read length-prefixed records and dispatch them per command."""
+        stream = self._stream
+        try:
+            while self._running:
+                header = stream.readline()
+                if not header:
+                    break
+                cmd_id, begin_ns, rc, dur_ns, out_len, err_len = (int(v) for v in header.split())
+                out = stream.read_exact(out_len)
+                err = stream.read_exact(err_len)
+
+                if cmd_id == READY_ID:
+                    self._logger.debug(f"Remote sampler: agent v{out.decode()} ready")
+                    self._ready.set()
+                    continue
+
+                command = self._commands.get(cmd_id)
+                if command is None:
+                    continue
+                dur_ms = dur_ns / 1_000_000
+                self._offer(
+                    command,
+                    CmdResult(
+                        cmd=command.cmd,
+                        stdout=out.decode(errors="replace"),
+                        stderr=err.decode(errors="replace"),
+                        rcode=rc,
+                        exec_time=dur_ms / 1000,
+                        parsed_ms=dur_ms,
+                        timestamp=begin_ns / 1e9,
+                    ),
+                )
+        except (OSError, ValueError):
+            if self._running:
+                self._logger.exception("Remote sampler: record stream broken")
+        finally:
+            if self._running:
+                self._logger.warning("Remote sampler: agent stream closed")
+            self._running = False
+            self._ready.set()
+
+    def next_result(self, cmd_id: int, timeout: float | None) -> CmdResult | None:
+        """Take next record of a command.
+
+        Args:
+            cmd_id: Command id from register()
+            timeout: Maximum wait in seconds
+
+        Returns:
+            CmdResult, or None on timeout or when sampler stopped
+        """
+        try:
+            return self._commands[cmd_id].results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def lease(self, cmd_id: int, fallback: IConnection) -> "SampledConnection":
+        """Create worker connection serving records of one command.
+
+        Args:
+            cmd_id: Command id from register()
+            fallback: Connection for other commands (pre/attribute commands)
+
+        Returns:
+            Connection for a worker
+        """
+        return SampledConnection(self, cmd_id, self._commands[cmd_id].cmd, fallback)
+
+
+class SampledConnection(IConnection):
+    """Worker connection backed by remote sampler records.
+
+    exec_cmd() of the sampled command blocks until the agent delivers the next
+    record (the result carries the remote begin timestamp). Any other command,
+    or the sampled one once the sampler stopped, runs on the fallback connection.
+    """
+
+    __slots__ = ("_cmd", "_cmd_id", "_fallback", "_logger", "_sampler")
+
+    def __init__(self, sampler: RemoteSampler, cmd_id: int, cmd: str, fallback: IConnection):
+        """Initialize sampled connection.
+
+        Args:
+            sampler: Running remote sampler
+            cmd_id: Command id served by this connection
+            cmd: Sampled command string
+            fallback: Connection used for non-sampled commands
+        """
+        self._sampler = sampler
+        self._cmd_id = cmd_id
+        self._cmd = cmd
+        self._fallback = fallback
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    def connect(self) -> bool:
+        """Connect fallback connection.
+
+        Returns:
+            True if connected
+        """
+        return self._fallback.connect()
+
+    def disconnect(self) -> None:
+        """Disconnect fallback connection."""
+        self._fallback.disconnect()
+
+    def is_connected(self) -> bool:
+        """Check if records can be served.
+
+        Returns:
+            True if sampler or fallback is available
+        """
+        return self._sampler.is_running or self._fallback.is_connected()
+
+    def get_cr_msg_connection(self, cmd: str, lm: LogMsg) -> CmdResult:
+        """Create connection error CmdResult.
+
+        Args:
+            cmd: Command that failed
+            lm: Log message enum
+
+        Returns:
+            CmdResult indicating no active connection
+        """
+        self._logger.error(f"{lm} - {cmd}")
+        return CmdResult.error(cmd, f"{lm} - {cmd}")
+
+    def exec_cmd(
+        self,
+        cmd: str,
+        timeout: int | None = 20,
+        use_time_cmd: bool = False,
+        logger: logging.Logger | None = None,
+    ) -> CmdResult:
+        """Return next sampled record, or execute on fallback connection.
+
+        Args:
+            cmd: Command to execute
+            timeout: Maximum wait in seconds (default: 20)
+            use_time_cmd: Ignored for sampled records (remote duration is in parsed_ms)
+            logger: Optional logger to use instead of default
+
+        Returns:
+            Command execution result
+        """
+        if cmd == self._cmd and self._sampler.is_running:
+            result = self._sampler.next_result(self._cmd_id, timeout)
+            if result is not None:
+                return result
+            if self._sampler.is_running:
+                return CmdResult.error(cmd, f"{LogMsg.COMMAND_TIMEOUT.value}: no sampler record within {timeout}s")
+        return self._fallback.exec_cmd(cmd, timeout=timeout, use_time_cmd=use_time_cmd, logger=logger)
@@ -0,0 +1,123 @@
+"""Remote sampling agent (runs on the SUT).
+
+Self-contained, standard library only, shipped to the SUT by RemoteSampler
+and executed once over a long-lived channel. Keep it compatible with old
+system Python 3 releases (no dataclasses, no walrus, no 3.9+ typing).
+
+Protocol:
+    stdin:  first line is a JSON spec
+            {"commands": [{"id": 0, "cmd": "...", "interval_ms": 20, "timeout_s": 20}]}
+            then stdin stays open; EOF or a "stop" line ends the agent.
+    stdout: stream of records, each a header line
+            b"<id> <begin_ns> <rc> <dur_ns> <out_len> <err_len>\\n"
+            followed by out_len bytes of stdout and err_len bytes of stderr.
+            A record with id -1 signals that the agent is ready.
+"""
+
+import json
+import re
+import subprocess
+import sys
+import threading
+import time
+
+AGENT_VERSION = "1"
+READY_ID = -1
+
+# 'cat <sysfs/procfs path>' is read in-process instead of forking a shell
+_DIRECT_READ = re.compile(r"^\s*cat\s+(/(?:sys|proc)/[\w./:@+-]+)\s*$")
+
+
+class _Writer:
+    """Serialize records from all sampling threads onto stdout."""
+
+    def __init__(self, stream, stop):
+        self._stream = stream
+        self._stop = stop
+        self._lock = threading.Lock()
+
+    def emit(self, cmd_id, begin_ns, rc, dur_ns, out, err):
+        header = ("%d %d %d %d %d %d\n" % (cmd_id, begin_ns, rc, dur_ns, len(out), len(err))).encode()
+        with self._lock:
+            try:
+                self._stream.write(header + out + err)
+                self._stream.flush()
+            except (OSError, ValueError):
+                self._stop.set()
+
+
+def _execute(cmd, direct_path, timeout_s):
+    if direct_path:
+        try:
+            with open(direct_path, "rb") as f:
+                return 0, f.read(), b""
+        except OSError as e:
+            return 1, b"", str(e).encode()
+    try:
+        proc = subprocess.run(
+            cmd,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout_s,
+        )
+        return proc.returncode, proc.stdout, proc.stderr
+    except subprocess.TimeoutExpired:
+        return -1, b"", b"Timeout"
+    except OSError as e:
+        return -1, b"", str(e).encode()
+
+
+def _sample_loop(entry, writer, stop):
+    cmd_id = int(entry["id"])
+    cmd = entry["cmd"]
+    interval = max(int(entry.get("interval_ms", 1000)), 1) / 1000.0
+    timeout_s = entry.get("timeout_s", 20)
+    match = _DIRECT_READ.match(cmd)
+    direct_path = match.group(1) if match else None
+
+    next_tick = time.monotonic()
+    while not stop.is_set():
+        begin_ns = int(time.time() * 1e9)
+        t0 = time.monotonic()
+        rc, out, err = _execute(cmd, direct_path, timeout_s)
+        dur_ns = int((time.monotonic() - t0) * 1e9)
+        writer.emit(cmd_id, begin_ns, rc, dur_ns, out or b"", err or b"")
+
+        # Fixed-rate schedule; overruns skip missed ticks instead of bursting
+        next_tick += interval
+        now = time.monotonic()
+        if next_tick < now:
+            next_tick += ((now - next_tick) // interval + 1) * interval
+        stop.wait(next_tick - now)
+
+
+def main():
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+
+    spec = json.loads(stdin.readline().decode() or "{}")
+    stop = threading.Event()
+    writer = _Writer(stdout, stop)
+
+    threads = []
+    for entry in spec.get("commands", []):
+        thread = threading.Thread(target=_sample_loop, args=(entry, writer, stop), daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    writer.emit(READY_ID, int(time.time() * 1e9), 0, 0, AGENT_VERSION.encode(), b"")
+
+    while not stop.is_set():
+        line = stdin.readline()
+        if not line or line.strip() == b"stop":
+            break
+    stop.set()
+
+    for thread in threads:
+        thread.join(timeout=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 import logging
 import re
+import select
 import threading
 import time
 from typing import Any, ClassVar
@@ -9,8 +10,20 @@ from typing import Any, ClassVar
 import paramiko
 from pydantic import SecretStr
 
+from src.core.connect.batch import (
+    build_batch_script,
+    new_batch_token,
+    redact,
+    split_batch_output,
+    sudo_command,
+    sudo_stdin,
+    to_cmd_results,
+)
+from src.core.connect.broker import BrokerConnection, broker_available
 from src.core.connect.local import _log_exec_time
-from src.core.enum.connect import HostType
+from src.core.connect.privileged import PrivilegedSessionPool
+from src.core.connect.stream import CmdStream
+from src.core.enum.connect import HostType, ShellState
 from src.core.enum.messages import LogMsg
 from src.core.parser import SutTimeParser
 from src.core.result import CmdResult
@@ -19,15 +32,87 @@ from src.models.config import Host
 from src.platform.enums.log import LogName
 
 
-def create_ssh_connection(cfg, host_type: HostType) -> "SshConnection":
-    """Create SSH connection with jump host.
+class _ChannelBudget:
+    """Open session channels of one transport, capped at sshd MaxSessions.
+
+    Exec channels wait for a free channel. Long-lived channels (streams,
+    privileged shells, the remote sampler) are refused instead of waiting
+    and never take the last channel, so exec channels keep working however
+    many streams are open.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize budget.
+
+        Args:
+            limit: Maximum open channels on the transport
+        """
+        self._limit = limit
+        self._open = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get maximum open channels.
+
+        Returns:
+            Channel limit
+        """
+        return self._limit
+
+    @property
+    def open(self) -> int:
+        """Get currently open channels.
+
+        Returns:
+            Open channel count
+        """
+        return self._open
+
+    def acquire(self, timeout: float | None) -> bool:
+        """Take a channel for one exec, waiting until one is free.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if a channel was taken
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._open < self._limit, timeout):
+                return False
+            self._open += 1
+            return True
+
+    def try_acquire_long_lived(self) -> bool:
+        """Take a channel for a long-lived stream without waiting.
+
+        Returns:
+            True if a channel was taken (at least one stays free for execs)
+        """
+        with self._cond:
+            if self._open >= self._limit - 1:
+                return False
+            self._open += 1
+            return True
+
+    def release(self) -> None:
+        """Return a channel."""
+        with self._cond:
+            self._open = max(self._open - 1, 0)
+            self._cond.notify()
+
+
+def create_ssh_connection(cfg, host_type: HostType, max_channels: int = 1) -> "SshConnection | BrokerConnection":
+    """Create SSH connection with jump host (via the local broker when it runs).
 
     Args:
         cfg: Configuration object
         host_type: Target host type (SLX or SUT)
+        max_channels: Maximum concurrent exec channels (1 = serialized)
 
     Returns:
-        SshConnection: Configured SSH connection
+        SshConnection, or BrokerConnection if a local broker is listening
     """
     jump_host = Host(
         ip=cfg.jump_host,
@@ -35,12 +120,26 @@ def create_ssh_connection(cfg, host_type: HostType) -> "SshConnection":
         password=cfg.jump_pass,
     )
 
+    # Reuse the transports of a running local broker (main_broker.py) instead of logging in again
+    if broker_available():
+        if host_type == HostType.SLX:
+            return BrokerConnection(cfg.slx_host, cfg.slx_user, cfg.slx_pass, [jump_host])
+        return BrokerConnection(
+            cfg.sut_host,
+            cfg.sut_user,
+            cfg.sut_pass,
+            [jump_host],
+            sudo_pass=cfg.sut_sudo_pass,
+            privileged_session=cfg.sut_privileged_session,
+        )
+
     if host_type == HostType.SLX:
         return SshConnection(
             host=cfg.slx_host,
             username=cfg.slx_user,
             password=cfg.slx_pass,
             jump_hosts=[jump_host],
+            max_channels=max_channels,
         )
     return SshConnection(
         host=cfg.sut_host,
@@ -48,6 +147,8 @@ def create_ssh_connection(cfg, host_type: HostType) -> "SshConnection":
         password=cfg.sut_pass,
         jump_hosts=[jump_host],
         sudo_pass=cfg.sut_sudo_pass,
+        max_channels=max_channels,
+        privileged_session=cfg.sut_privileged_session,
     )
 
 
@@ -59,17 +160,23 @@ class SshConnection(IConnection):
     """
 
     __slots__ = (
-        "_exec_lock",
+        "_channels",
+        "_exec_slots",
         "_host",
         "_jump_clients",
         "_jump_hosts",
         "_keepalive_interval",
         "_keepalive_thread",
+        "_max_channels",
+        "_owns_client",
         "_password",
+        "_privileged",
         "_prompt_pattern",
         "_shell",
+        "_shell_ready_ms",
         "_ssh_client",
         "_stop_keepalive",
+        "_sudo_pass",
         "_username",
     )
 
@@ -79,6 +186,29 @@ class SshConnection(IConnection):
         "timeout": 30,
     }
 
+    # OpenSSH default MaxSessions per connection
+    _MAX_SESSIONS: ClassVar[int] = 10
+
+    # Long-lived channels one transport holds (one channel always stays free for execs)
+    MAX_STREAMS: ClassVar[int] = _MAX_SESSIONS - 1
+
+    # Concurrent channels for connections shared between tabs/threads
+    SHARED_MAX_CHANNELS: ClassVar[int] = 4
+
+    # Window at end of shell output checked for a prompt
+    _PROMPT_TAIL_BYTES: ClassVar[int] = 512
+
+    # Silence after output treated as prompt ready
+    _SHELL_IDLE_READY_S: ClassVar[float] = 2.4
+
+    # Quiet period ending a clear_shell() drain
+    _SHELL_DRAIN_QUIET_S: ClassVar[float] = 0.05
+
+    # Upper bounds for shell bring-up phases (proceed as soon as prompt is seen)
+    _SHELL_BANNER_TIMEOUT_S: ClassVar[float] = 2.0
+    _SHELL_WAKE_TIMEOUT_S: ClassVar[float] = 15.0
+    _SHELL_CONFIG_TIMEOUT_S: ClassVar[float] = 2.0
+
     _PROMPT_PATTERN: ClassVar[bytes] = (
         rb"SLX#\s*$|\[.*@.*\][$#]\s*$|.*[$#]\s*$|Password:\s*$|password for.*:\s*$|FBR\.\d+>\s*$|.*@.*:.*[$#]\s*$|Shell>\s*$|.*>\s*$"
     )
@@ -91,6 +221,8 @@ class SshConnection(IConnection):
         jump_hosts: list[Host] | None = None,
         keepalive_interval: int = 30,
         sudo_pass="",
+        max_channels: int = 1,
+        privileged_session: bool = False,
     ):
         """Initialize SSH connection.
 
@@ -99,8 +231,10 @@ class SshConnection(IConnection):
             username: SSH username
             password: SSH password
             jump_hosts: Optional list of jump hosts
-            keepalive_interval: Keepalive interval in seconds
+            keepalive_interval: Keepalive interval in seconds (<= 0 disables the keepalive thread)
             sudo_pass: Optional sudo password
+            max_channels: Maximum concurrent exec channels (1 = fully serialized, capped at MaxSessions)
+            privileged_session: Run commands in persistent root shells instead of per-command sudo
         """
         # Connection parameters
         self._host = host
@@ -113,6 +247,7 @@ class SshConnection(IConnection):
         # SSH clients
         self._ssh_client = None
         self._jump_clients = []
+        self._owns_client = True  # False for shell views borrowing another connection's transport
 
         # Keepalive management
         self._keepalive_thread = None
@@ -120,10 +255,22 @@ class SshConnection(IConnection):
 
         # Shell session
         self._shell = None
-        self._prompt_pattern = re.compile(self._PROMPT_PATTERN, re.MULTILINE)
-
-        # Thread safety for command execution
-        self._exec_lock = threading.Lock()
+        self._shell_ready_ms: float | None = None
+        # No MULTILINE: "$" must only match at the end of the output, not after any line of it
+        self._prompt_pattern = re.compile(self._PROMPT_PATTERN)
+
+        # Concurrency limit for exec channels on the shared transport
+        self._max_channels = max(1, min(max_channels, self._MAX_SESSIONS))
+        self._exec_slots = threading.BoundedSemaphore(self._max_channels)
+        # All open channels (execs, streams, privileged shells) count against MaxSessions
+        self._channels = _ChannelBudget(self._MAX_SESSIONS)
+
+        # Persistent root shells (one per exec slot at most), used instead of 'echo pass | sudo -S'
+        self._privileged = (
+            PrivilegedSessionPool(self.open_stream, sudo_pass, self._max_channels)
+            if privileged_session and sudo_pass
+            else None
+        )
 
         self._logger = logging.getLogger(LogName.MAIN.value)
 
@@ -155,11 +302,12 @@ class SshConnection(IConnection):
     # ========================================================================
 
     @classmethod
-    def from_route(cls, route) -> "SshConnection":
+    def from_route(cls, route, max_channels: int = 1) -> "SshConnection":
         """Create SshConnection from Route configuration.
 
         Args:
             route: Route configuration with target and jump hosts
+            max_channels: Maximum concurrent exec channels
 
         Returns:
             Configured SshConnection instance
@@ -169,7 +317,31 @@ class SshConnection(IConnection):
             route.target.username,
             route.target.password.get_secret_value(),
             route.jumps,
+            max_channels=max_channels,
+        )
+
+    def shell_view(self) -> "SshConnection":
+        """Create connection sharing this transport but owning its own shell.
+
+        Lets several users run interactive shells over one authenticated
+        transport (the view has no keepalive; disconnect() only closes its shell).
+
+        Returns:
+            Connected view of this connection
+        """
+        view = SshConnection(
+            self._host,
+            self._username,
+            self._password,
+            self._jump_hosts,
+            keepalive_interval=0,
+            sudo_pass=self._sudo_pass,
+            max_channels=self._max_channels,
         )
+        view._ssh_client = self._ssh_client
+        view._owns_client = False
+        view._channels = self._channels  # Same transport, same session limit
+        return view
 
     # ========================================================================
     # Connection Management
@@ -181,9 +353,9 @@ class SshConnection(IConnection):
         Returns:
             True if connection successful, False otherwise
         """
-        if self.is_connected():
+        if self.is_connected() or not self._owns_client:
             self._logger.debug(f"{LogMsg.PRE_HOST_CON.value}: {self._host}")
-            return True
+            return bool(self.is_connected())
 
         self._logger.info(f"Connecting to {self._host} via {len(self._jump_hosts)} jump host(s)")
         conn_start = time.perf_counter()
@@ -232,6 +404,14 @@ class SshConnection(IConnection):
             self._logger.debug(f"{LogMsg.CONN_ALREADY_DISCONNECTED.value}: {self._host}")
             return
 
+        if not self._owns_client:
+            # Shell view: only release own shell/sessions, transport belongs to the parent connection
+            self.close_shell()
+            if self._privileged:
+                self._privileged.close_all()
+            self._ssh_client = None
+            return
+
         try:
             self._logger.info(f"{LogMsg.CONN_DISCONNECTING.value}: {self._host}")
 
@@ -239,6 +419,8 @@ class SshConnection(IConnection):
 
             self._stop_keepalive_thread()
             self.close_shell()
+            if self._privileged:
+                self._privileged.close_all()
             self._close_all_clients()
 
             self._logger.info(f"{LogMsg.CONN_DISCONNECTED.value}: {self._host}")
@@ -286,6 +468,15 @@ class SshConnection(IConnection):
     # Command Execution
     # ========================================================================
 
+    @property
+    def max_channels(self) -> int:
+        """Get maximum number of concurrent exec channels.
+
+        Returns:
+            Channel limit
+        """
+        return self._max_channels
+
     def exec_cmd(
         self,
         cmd: str,
@@ -295,6 +486,11 @@ class SshConnection(IConnection):
     ) -> CmdResult:
         """Execute command via SSH.
 
+        Up to max_channels commands run concurrently, each on its own exec
+        channel (or persistent root shell in privileged session mode);
+        further callers wait for a free slot. Slot wait time is not included
+        in the returned send_ms/read_ms.
+
         Args:
             cmd: Command to execute
             timeout: Timeout in seconds (default: 20)
@@ -307,32 +503,183 @@ class SshConnection(IConnection):
         if not self.is_connected():
             return self.get_cr_msg_connection(cmd, LogMsg.CONN_FAILED)
 
-        with self._exec_lock:
-            log = logger or self._logger
-            exec_cmd = cmd
+        wait_start = time.perf_counter()
+        with self._exec_slots:
+            wait_ms = (time.perf_counter() - wait_start) * 1000
+            if wait_ms > 1.0:
+                (logger or self._logger).debug(f"Waited {wait_ms:.1f}ms for exec channel slot ({self._max_channels} max)")
+            if self._privileged and self._privileged.available:
+                result = self._exec_privileged(cmd, timeout, logger)
+                if result is not None:
+                    return result
+            if not self._channels.acquire(timeout):
+                return self.get_cr_log_common(cmd, LogMsg.CONN_NO_CHANNEL)
+            try:
+                return self._exec_on_channel(cmd, timeout, use_time_cmd, logger)
+            finally:
+                self._channels.release()
 
-            # Wrap with time command if requested
-            if use_time_cmd:
-                if self._sudo_pass:
-                    escaped_cmd = cmd.replace("'", "'\"'\"'")
-                    exec_cmd = f"time bash -c 'echo \"{self._sudo_pass}\" | sudo -S {escaped_cmd}'"
-                else:
-                    escaped_cmd = cmd.replace("'", "'\"'\"'")
-                    exec_cmd = f"time bash -c '{escaped_cmd}'"
-            elif self._sudo_pass and "sudo -S" not in cmd:
-                # Wrap compound commands (with &&, ||, ;) in bash -c for proper sudo handling
-                if any(op in cmd for op in ["&&", "||", ";"]):
-                    escaped_cmd = cmd.replace('"', '\\"')
-                    exec_cmd = f'echo "{self._sudo_pass}" | sudo -S bash -c "{escaped_cmd}"'
-                else:
-                    exec_cmd = f'echo "{self._sudo_pass}" | sudo -S {cmd}'
+    def _exec_privileged(
+        self,
+        cmd: str,
+        timeout: int | None = 20,
+        logger: logging.Logger | None = None,
+    ) -> CmdResult | None:
+        """Execute command in a persistent root shell.
+
+        The per-command elapsed time is measured inside the shell and
+        returned as parsed_ms, replacing the 'time' wrapper.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds
+            logger: Optional logger to use instead of default
+
+        Returns:
+            Command result, or None if no privileged session is available
+        """
+        log = logger or self._logger
+        log.debug(f"Executing command (privileged session): '{cmd}'")
+
+        result = self._privileged.exec(cmd, timeout)
+        if result is None:
+            return None
+
+        _log_exec_time(result.time, result.rcode, result.send_ms, result.read_ms, result.parsed_ms or None, log)
+        if result.rcode != 0 and result.stderr:
+            log.warning(f"Command stderr: {result.stderr[:200]}")
+        return result
+
+    def _exec_on_channel(
+        self,
+        cmd: str,
+        timeout: int | None = 20,
+        use_time_cmd: bool = False,
+        logger: logging.Logger | None = None,
+    ) -> CmdResult:
+        """Execute command on a new exec channel of the transport.
+
+        Callers must hold an exec slot and a channel (see exec_cmd).
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds
+            use_time_cmd: Wrap command with 'time' for execution timing
+            logger: Optional logger to use instead of default
+
+        Returns:
+            Command execution result
+        """
+        log = logger or self._logger
+        exec_cmd = cmd
+
+        # Wrap with time command if requested
+        if use_time_cmd:
+            if self._sudo_pass:
+                escaped_cmd = cmd.replace("'", "'\"'\"'")
+                exec_cmd = f"time bash -c 'echo \"{self._sudo_pass}\" | sudo -S {escaped_cmd}'"
+            else:
+                escaped_cmd = cmd.replace("'", "'\"'\"'")
+                exec_cmd = f"time bash -c '{escaped_cmd}'"
+        elif self._sudo_pass and "sudo -S" not in cmd:
+            # Wrap compound commands (with &&, ||, ;) in bash -c for proper sudo handling
+            if any(op in cmd for op in ["&&", "||", ";"]):
+                escaped_cmd = cmd.replace('"', '\\"')
+                exec_cmd = f'echo "{self._sudo_pass}" | sudo -S bash -c "{escaped_cmd}"'
+            else:
+                exec_cmd = f'echo "{self._sudo_pass}" | sudo -S {cmd}'
+
+        timeout_str = f" (timeout: {timeout}s)" if timeout is not None else ""
+        log.debug(f"Executing command: '{exec_cmd}'{timeout_str}")
+
+        try:
+            start_time = time.perf_counter()
+            _, stdout, stderr = self._ssh_client.exec_command(exec_cmd, timeout=timeout)
+            send_time = (time.perf_counter() - start_time) * 1000
+
+            read_start = time.perf_counter()
+            stdout_data = self._clean(stdout.read().decode())
+            stderr_data = self._clean(stderr.read().decode())
+            rcode = stdout.channel.recv_exit_status()
+            read_time = (time.perf_counter() - read_start) * 1000
+
+            exec_time = time.perf_counter() - start_time
+
+            # Parse time command output if present in stderr
+            time_cmd_ms = 0.0
+            if stderr_data and ("real" in stderr_data or "elapsed" in stderr_data):
+                time_parser = SutTimeParser(log.name)
+                time_parser.parse(stderr_data)
+                time_cmd_ms = time_parser.get_result()
+
+            _log_exec_time(
+                exec_time,
+                rcode,
+                send_time,
+                read_time,
+                time_cmd_ms if time_cmd_ms > 0 else None,
+                log,
+            )
+            if rcode != 0 and stderr_data and "[sudo] password for" not in stderr_data:
+                log.warning(f"Command stderr: {stderr_data[:200]}")
+
+            return CmdResult(
+                cmd=exec_cmd,
+                stdout=stdout_data,
+                stderr=stderr_data,
+                exec_time=exec_time,
+                rcode=rcode,
+                send_ms=send_time,
+                read_ms=read_time,
+                parsed_ms=time_cmd_ms,
+            )
+
+        except Exception as e:
+            self._logger.exception(f"{LogMsg.AGENT_CMD_FAIL.value}: {cmd}")
+            return CmdResult(exec_cmd, "", f"Error: {e}", -1)
+
+    def exec_many(
+        self,
+        cmds: list[str],
+        timeout: int | None = 60,
+        logger: logging.Logger | None = None,
+    ) -> list[CmdResult]:
+        """Execute several commands in one round trip.
 
-            timeout_str = f" (timeout: {timeout}s)" if timeout is not None else ""
-            log.debug(f"Executing command: '{exec_cmd}'{timeout_str}")
+        Commands are shipped as a single framed script on one exec channel
+        (run under one sudo when a sudo password is set) and split back into
+        individual results. A failing command does not stop the batch.
 
+        Args:
+            cmds: Commands to execute, in order
+            timeout: Timeout in seconds for the whole batch (default: 60)
+            logger: Optional logger to use instead of default
+
+        Returns:
+            One CmdResult per command, in submission order
+        """
+        if not cmds:
+            return []
+        if not self.is_connected():
+            return [self.get_cr_msg_connection(cmd, LogMsg.CONN_FAILED) for cmd in cmds]
+
+        log = logger or self._logger
+        token = new_batch_token()
+        script = build_batch_script(cmds, token)
+        runner = sudo_command("bash -s", token) if self._sudo_pass else "bash -s"
+        payload = sudo_stdin(self._sudo_pass, token) + script if self._sudo_pass else script
+
+        log.debug(f"Executing batch of {len(cmds)} commands")
+
+        with self._exec_slots:
+            if not self._channels.acquire(timeout):
+                return [self.get_cr_log_common(cmd, LogMsg.CONN_NO_CHANNEL) for cmd in cmds]
             try:
                 start_time = time.perf_counter()
-                _, stdout, stderr = self._ssh_client.exec_command(exec_cmd, timeout=timeout)
+                stdin, stdout, stderr = self._ssh_client.exec_command(runner, timeout=timeout)
+                stdin.write(payload)
+                stdin.flush()
+                stdin.channel.shutdown_write()
                 send_time = (time.perf_counter() - start_time) * 1000
 
                 read_start = time.perf_counter()
@@ -340,41 +687,57 @@ class SshConnection(IConnection):
                 stderr_data = self._clean(stderr.read().decode())
                 rcode = stdout.channel.recv_exit_status()
                 read_time = (time.perf_counter() - read_start) * 1000
+            except Exception as e:
+                self._logger.exception(f"{LogMsg.AGENT_CMD_FAIL.value}: batch of {len(cmds)} commands")
+                return [CmdResult(cmd, "", f"Error: {e}", -1) for cmd in cmds]
+            finally:
+                self._channels.release()
 
-                exec_time = time.perf_counter() - start_time
-
-                # Parse time command output if present in stderr
-                time_cmd_ms = 0.0
-                if stderr_data and ("real" in stderr_data or "elapsed" in stderr_data):
-                    time_parser = SutTimeParser(log.name)
-                    time_parser.parse(stderr_data)
-                    time_cmd_ms = time_parser.get_result()
-
-                _log_exec_time(
-                    exec_time,
-                    rcode,
-                    send_time,
-                    read_time,
-                    time_cmd_ms if time_cmd_ms > 0 else None,
-                    log,
-                )
-                if rcode != 0 and stderr_data and "[sudo] password for" not in stderr_data:
-                    log.warning(f"Command stderr: {stderr_data[:200]}")
-
-                return CmdResult(
-                    cmd=exec_cmd,
-                    stdout=stdout_data,
-                    stderr=stderr_data,
-                    exec_time=exec_time,
-                    rcode=rcode,
-                    send_ms=send_time,
-                    read_ms=read_time,
-                    parsed_ms=time_cmd_ms,
-                )
+        _log_exec_time(time.perf_counter() - start_time, rcode, send_time, read_time, None, log)
+        if rcode != 0 and stderr_data:
+            # Per-command stderr is framed into stdout, this is the runner's own (sudo) output
+            log.warning(f"Batch runner stderr: {redact(stderr_data, self._sudo_pass)[:200]}")
 
-            except Exception as e:
-                self._logger.exception(f"{LogMsg.AGENT_CMD_FAIL.value}: {cmd}")
-                return CmdResult(exec_cmd, "", f"Error: {e}", -1)
+        return to_cmd_results(cmds, split_batch_output(stdout_data, len(cmds), token), send_time, read_time)
+
+    def open_stream(self, cmd: str) -> CmdStream | None:
+        """Start long-running command on a dedicated exec channel.
+
+        The channel is not counted against the exec channel slots but against
+        the transport's session limit: once MAX_STREAMS long-lived channels
+        are open, further streams are refused (callers fall back to per-call
+        execution). It stays open until the returned stream is closed. No
+        sudo wrapping is applied.
+
+        Args:
+            cmd: Command to start
+
+        Returns:
+            Stream with binary stdin/stdout pipes, or None on failure
+        """
+        if not self.is_connected():
+            self._logger.error(f"{LogMsg.CONN_FAILED.value} - {cmd}")
+            return None
+        if not self._channels.try_acquire_long_lived():
+            self._logger.warning(f"{LogMsg.CONN_STREAM_REFUSED.value} ({self._channels.open}/{self._channels.limit})")
+            return None
+
+        try:
+            channel = self._ssh_client.get_transport().open_session()
+            channel.exec_command(cmd)
+        except Exception:
+            self._channels.release()
+            self._logger.exception(f"{LogMsg.AGENT_CMD_FAIL.value}: stream")
+            return None
+
+        def closer() -> None:  # Called once (CmdStream.close is idempotent)
+            try:
+                channel.shutdown_write()
+            finally:
+                channel.close()
+                self._channels.release()
+
+        return CmdStream(cmd, channel.makefile_stdin("wb"), channel.makefile("rb"), closer)
 
     def _clean(self, data: str) -> str:
         """Remove ANSI escape sequences from output.
@@ -481,7 +844,14 @@ class SshConnection(IConnection):
             raise
 
     def _start_keepalive(self) -> None:
-        """Start keepalive thread to maintain connection health."""
+        """Start keepalive thread to maintain connection health.
+
+        Skipped when keepalive_interval <= 0 (keepalive driven externally,
+        e.g. by SshTransportPool).
+        """
+        if self._keepalive_interval <= 0:
+            self._logger.debug("Keepalive thread disabled (externally managed)")
+            return
         self._stop_keepalive.clear()
         self._keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
         self._keepalive_thread.start()
@@ -497,32 +867,55 @@ class SshConnection(IConnection):
 
         while not self._stop_keepalive.wait(self._keepalive_interval):
             try:
-                active_count = 0
-                total_count = 0
+                self.send_keepalive()
+            except Exception:
+                self._logger.exception(LogMsg.ALIVE_THREAD_FAIL.value)
 
-                for client in filter(None, [self._ssh_client, *self._jump_clients]):
-                    total_count += 1
-                    if (t := client.get_transport()) and t.is_active():
-                        t.send_ignore()
-                        active_count += 1
+        self._logger.debug(LogMsg.ALIVE_LOOP_STOP.value)
 
-                self._logger.debug(f"Keepalive sent to {active_count}/{total_count} active connections")
+    def send_keepalive(self) -> tuple[int, int]:
+        """Send one keepalive packet to target and all jump host transports.
 
-                if active_count == 0 and total_count > 0:
-                    self._logger.warning(LogMsg.ALIVE_NO_ACTIVE.value)
+        Returns:
+            Tuple of (active, total) transport counts
+        """
+        active_count = 0
+        total_count = 0
 
-            except Exception:
-                self._logger.exception(LogMsg.ALIVE_THREAD_FAIL.value)
+        for client in filter(None, [self._ssh_client, *self._jump_clients]):
+            total_count += 1
+            if (t := client.get_transport()) and t.is_active():
+                t.send_ignore()
+                active_count += 1
 
-        self._logger.debug(LogMsg.ALIVE_LOOP_STOP.value)
+        self._logger.debug(f"Keepalive sent to {active_count}/{total_count} active connections")
+
+        if active_count == 0 and total_count > 0:
+            self._logger.warning(LogMsg.ALIVE_NO_ACTIVE.value)
+
+        return active_count, total_count
 
     # ========================================================================
     # Interactive Shell Management
     # ========================================================================
 
+    @property
+    def shell_ready_ms(self) -> float | None:
+        """Get latency from invoke_shell to configured prompt.
+
+        Returns:
+            Milliseconds of last open_shell(), or None if shell never became ready
+        """
+        return self._shell_ready_ms
+
     def open_shell(self) -> bool:
         """Open interactive shell session.
 
+        Bring-up is prompt driven: BANNER waits for the login prompt, WAKE
+        sends Enter only if no prompt was seen, CONFIG sends terminal setup
+        commands and waits for each prompt. Phase timeouts are upper bounds,
+        each phase proceeds as soon as the prompt appears.
+
         Returns:
             True if successful, False otherwise
         """
@@ -536,49 +929,53 @@ class SshConnection(IConnection):
 
         self._logger.info(f"Opening shell on {self._host}")
 
+        # Configure SLX terminal - these commands may not work on all systems
+        config_commands = [
+            "terminal length 0"  # SLX specific
+        ]
+
+        state = ShellState.BANNER
+        start = time.perf_counter()
         try:
             self._shell = self._ssh_client.invoke_shell(width=120, height=40)
             self._logger.debug(LogMsg.SHELL_INVOKED_BANNER.value)
 
-            # Wait longer for initial banner and send enter to activate prompt
-            time.sleep(2)
-            self._shell.send("\n")
-            time.sleep(1)
-
-            try:
-                output = self._read_until_prompt(timeout=15)
-                self._logger.debug(f"Shell opened. Initial banner length: {len(output)} chars")
-                if output:
-                    self._logger.debug(f"Banner preview:\n\n{output[:200]}...\n")
-            except TimeoutError:
-                self._logger.warning(LogMsg.SHELL_OPEN_FAILED.value)
-                output = ""
-
-            # Configure SLX terminal - these commands may not work on all systems
-            config_commands = [
-                "terminal length 0"  # SLX specific
-            ]
-
-            for cmd in config_commands:
-                try:
-                    self._logger.debug(f"Executing config command: '{cmd}'")
-                    self._shell.send(f"{cmd}\n")
-                    time.sleep(0.5)
-                except Exception:
-                    self._logger.exception(f"Failed executing config command: '{cmd}'")
-
-            # Clear buffer after config commands to prevent contamination
-            try:
-                self._read_until_prompt(timeout=2)
-                self._logger.debug(LogMsg.SHELL_BUFFER_CLEAR.value)
-            except Exception:
-                self._logger.exception(LogMsg.SHELL_BUFFER_CLEAR_FAIL.value)
-
-            self._logger.info(LogMsg.SHELL_OPENED_CONFIGURED.value)
+            while state not in (ShellState.READY, ShellState.FAILED):
+                if state == ShellState.BANNER:
+                    output, prompt_seen = self._read_shell(self._SHELL_BANNER_TIMEOUT_S)
+                    state = ShellState.CONFIG if prompt_seen else ShellState.WAKE
+
+                elif state == ShellState.WAKE:
+                    # Send enter to activate prompt
+                    self._shell.send("\n")
+                    more, prompt_seen = self._read_shell(self._SHELL_WAKE_TIMEOUT_S, idle_ready=True)
+                    output += more
+                    if not prompt_seen and not output:
+                        self._logger.warning(LogMsg.SHELL_OPEN_FAILED.value)
+                    state = ShellState.CONFIG
+
+                elif state == ShellState.CONFIG:
+                    self._logger.debug(f"Shell opened. Initial banner length: {len(output)} chars")
+                    if output:
+                        self._logger.debug(f"Banner preview:\n\n{output[:200]}...\n")
+
+                    for cmd in config_commands:
+                        try:
+                            self._logger.debug(f"Executing config command: '{cmd}'")
+                            self._shell.send(f"{cmd}\n")
+                            # Consume echo and prompt to prevent contamination of the first command
+                            self._read_shell(self._SHELL_CONFIG_TIMEOUT_S)
+                        except Exception:
+                            self._logger.exception(f"Failed executing config command: '{cmd}'")
+                    self._logger.debug(LogMsg.SHELL_BUFFER_CLEAR.value)
+                    state = ShellState.READY
+
+            self._shell_ready_ms = (time.perf_counter() - start) * 1000
+            self._logger.info(f"{LogMsg.SHELL_OPENED_CONFIGURED.value} (ready in {self._shell_ready_ms:.0f} ms)")
             return True
 
         except Exception:
-            self._logger.exception(LogMsg.SHELL_OPEN_FAILED.value)
+            self._logger.exception(f"{LogMsg.SHELL_OPEN_FAILED.value} (state: {state.value})")
             if self._shell:
                 try:  # noqa: SIM105
                     self._shell.close()
@@ -598,9 +995,78 @@ class SshConnection(IConnection):
         """
         return line.endswith(("$", "#", ">", ":")) or ":~$" in line or "Shell>" in line
 
+    def _read_shell(self, timeout: float, *, idle_ready: bool = False) -> tuple[str, bool]:
+        """Read shell output until prompt, idle fallback or timeout.
+
+        Waits on the channel with select() instead of polling, accumulates
+        into a bytearray and only checks the last _PROMPT_TAIL_BYTES for a
+        prompt, so large outputs stay linear.
+
+        Args:
+            timeout: Maximum seconds to wait
+            idle_ready: Treat _SHELL_IDLE_READY_S of silence after output as prompt
+
+        Returns:
+            Tuple of (decoded output, prompt detected)
+        """
+        buffer = bytearray()
+        start = time.monotonic()
+        deadline = start + timeout
+        last_activity = start
+
+        while (now := time.monotonic()) < deadline:
+            # Wake up at the latest when the idle fallback is due
+            wait = deadline - now
+            if idle_ready:
+                wait = min(wait, max(self._SHELL_IDLE_READY_S - (now - last_activity), 0.05))
+            readable, _, _ = select.select([self._shell], [], [], wait)
+
+            if readable:
+                chunk = self._shell.recv(65536)
+                if not chunk:
+                    self._logger.debug("Shell channel closed while reading")
+                    break
+                buffer += chunk
+                last_activity = time.monotonic()
+
+                # Prompt can only be at the end: match on bounded tail window
+                tail = bytes(buffer[-self._PROMPT_TAIL_BYTES :])
+                if self._prompt_pattern.search(tail):
+                    self._logger.debug(f"Prompt pattern matched after {len(buffer)} bytes")
+                    return buffer.decode(errors="ignore").strip(), True
+
+                lines = tail.splitlines()
+                if lines and self._is_prompt_like(last := lines[-1].decode(errors="ignore").strip()):
+                    self._logger.debug(f"Detected prompt-like ending: '{last}'")
+                    return buffer.decode(errors="ignore").strip(), True
+            elif idle_ready and buffer and time.monotonic() - last_activity >= self._SHELL_IDLE_READY_S:
+                self._logger.debug("No activity detected, assuming prompt ready")
+                return buffer.decode(errors="ignore").strip(), True
+
+        return buffer.decode(errors="ignore").strip(), False
+
+    def wait_for_prompt(self, timeout: float = 10.0) -> tuple[str, bool]:
+        """Wait until the shell shows a prompt, without sending anything.
+
+        Args:
+            timeout: Upper bound in seconds (returns as soon as prompt is seen)
+
+        Returns:
+            Tuple of (output read, prompt detected)
+
+        Raises:
+            ConnectionError: If shell not open
+        """
+        if not self._shell:
+            msg = "Shell not open"
+            raise ConnectionError(msg)
+        return self._read_shell(timeout)
+
     def _read_until_prompt(self, timeout: float = 10.0) -> str:
         """Read shell output until prompt detected.
 
+        Returns early after _SHELL_IDLE_READY_S without data (prompt assumed).
+
         Args:
             timeout: Maximum seconds to wait for prompt
 
@@ -615,47 +1081,16 @@ class SshConnection(IConnection):
             msg = "Shell not open"
             raise ConnectionError(msg)
 
-        buffer = b""
-        start = time.time()
         self._logger.debug("Reading until prompt (timeout: %.1f s)", timeout)
-        last_activity = start
-        stable_count = 0
-
-        while time.time() - start < timeout:
-            if self._shell.recv_ready():
-                chunk = self._shell.recv(4096)
-                if chunk:
-                    buffer += chunk
-                    last_activity = time.time()
-                    stable_count = 0
-                    self._logger.debug(f"Received {len(chunk)} bytes, total buffer: {len(buffer)} bytes")
-
-                    # Check for prompt pattern
-                    if self._prompt_pattern.search(buffer):
-                        self._logger.debug("Prompt pattern matched!")
-                        return buffer.decode(errors="ignore").strip()
-
-                    # Also check last few lines for common prompt patterns
-                    lines = buffer.decode(errors="ignore").splitlines()
-                    if lines and self._is_prompt_like(lines[-1].strip()):
-                        self._logger.debug(f"Detected prompt-like ending: '{lines[-1].strip()}'")
-                        return buffer.decode(errors="ignore").strip()
-            else:
-                # No data ready, check if we've been stable
-                if time.time() - last_activity > 2.0:  # 2 seconds of no activity
-                    stable_count += 1
-                    if stable_count > 3:  # Been stable for a while
-                        self._logger.debug("No activity detected, assuming prompt ready")
-                        if buffer:
-                            return buffer.decode(errors="ignore").strip()
-                time.sleep(0.1)
-
-        self._logger.error(f"Timeout after {timeout:.1f}s. Buffer length: {len(buffer)}")
-        if buffer:
-            content = buffer.decode(errors="ignore")
+        content, prompt_seen = self._read_shell(timeout, idle_ready=True)
+        if prompt_seen:
+            return content
+
+        self._logger.error(f"Timeout after {timeout:.1f}s. Buffer length: {len(content)}")
+        if content:
             self._logger.error(f"Final buffer content: {content[-500:]}")
             # Return what we have instead of failing
-            return content.strip()
+            return content
 
         msg = "Prompt not detected within timeout"
         raise TimeoutError(msg)
@@ -791,9 +1226,10 @@ class SshConnection(IConnection):
 
         try:
             self._logger.debug(LogMsg.SHELL_BUFFER_CLEARING.value)
-            while self._shell.recv_ready():
-                self._shell.recv(65536)
-                time.sleep(0.1)
+            # Drain until the channel stays quiet for a short moment
+            while select.select([self._shell], [], [], self._SHELL_DRAIN_QUIET_S)[0]:
+                if not self._shell.recv(65536):
+                    break
             self._logger.debug(LogMsg.SHELL_BUFFER_CLEARED.value)
         except Exception:
             self._logger.exception("Error clearing shell buffer")
@@ -0,0 +1,67 @@
+"""Long-running command stream with raw binary pipes."""
+
+from collections.abc import Callable
+from typing import BinaryIO
+
+
+class CmdStream:
+    """Handle to a long-running command (remote exec channel or local process).
+
+    Args:
+        cmd: Command that was started
+        stdin: Writable binary pipe to the command
+        stdout: Readable binary pipe from the command
+        closer: Callable terminating the command and releasing its channel
+    """
+
+    __slots__ = ("_closed", "_closer", "cmd", "stdin", "stdout")
+
+    def __init__(self, cmd: str, stdin: BinaryIO, stdout: BinaryIO, closer: Callable[[], None]):
+        self.cmd = cmd
+        self.stdin = stdin
+        self.stdout = stdout
+        self._closer = closer
+        self._closed = False
+
+    def write(self, data: bytes) -> None:
+        """Write data to command stdin and flush.
+
+        Args:
+            data: Bytes to send
+        """
+        self.stdin.write(data)
+        self.stdin.flush()
+
+    def readline(self) -> bytes:
+        """Read one line from command stdout.
+
+        Returns:
+            Line including newline, or b"" on EOF
+        """
+        return self.stdout.readline()
+
+    def read_exact(self, size: int) -> bytes:
+        """Read exactly size bytes from command stdout.
+
+        Args:
+            size: Number of bytes to read
+
+        Returns:
+            Data read (shorter than size only on EOF)
+        """
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = self.stdout.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        """Terminate command and release resources (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._closer()
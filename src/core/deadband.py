@@ -0,0 +1,88 @@
+"""Change-only recording of worker rows.
+
+A DeadbandFilter passes a row only when at least one attribute moved beyond
+its deadband since the last row that was passed, or when nothing was passed
+for max_silence_sec (heartbeat, so flat telemetry still shows up in the CSV).
+Numeric values are compared against absolute and relative thresholds, all
+other values on any change. Comparing against the last passed row (not the
+previous sample) makes slow drift show up once it adds up to a deadband.
+"""
+
+from typing import Any
+
+
+class DeadbandFilter:
+    """Per-attribute deadband with heartbeat for one worker."""
+
+    __slots__ = ("_abs", "_default", "_ignore", "_last", "_last_ts", "_max_silence_sec", "_overrides", "_rel")
+
+    def __init__(
+        self,
+        abs_threshold: float = 0.0,
+        rel_threshold: float = 0.0,
+        max_silence_sec: float = 60.0,
+        overrides: dict[str, dict] | None = None,
+    ):
+        """Initialize filter.
+
+        Args:
+            abs_threshold: Default absolute change needed to pass a row
+            rel_threshold: Default change relative to the last passed value (0.01 = 1%)
+            max_silence_sec: Pass a row at least this often
+            overrides: Per-attribute {"abs": float, "rel": float, "ignore": bool}; ignored attributes
+                never cause a row on their own (e.g. counters that move every sample)
+        """
+        self._default = (abs_threshold, rel_threshold)
+        self._max_silence_sec = max_silence_sec
+        self._overrides = overrides or {}
+        self._abs: list[float] = []
+        self._rel: list[float] = []
+        self._ignore: list[bool] = []
+        self._last: list[Any] | None = None
+        self._last_ts = 0.0
+
+    def bind(self, columns: list[str]) -> None:
+        """Resolve thresholds for the row columns and reset state.
+
+        Args:
+            columns: Attribute names in row order
+        """
+        self._abs, self._rel, self._ignore = [], [], []
+        for name in columns:
+            override = self._overrides.get(name, {})
+            self._abs.append(override.get("abs", self._default[0]))
+            self._rel.append(override.get("rel", self._default[1]))
+            self._ignore.append(override.get("ignore", False))
+        self._last = None
+
+    def accept(self, ts: float, values: list[Any]) -> bool:
+        """Check if a row should be recorded (remembers it if so).
+
+        Args:
+            ts: Sample begin time as epoch seconds
+            values: Row values in bound column order
+
+        Returns:
+            True if the row is outside the deadband or the heartbeat is due
+        """
+        if self._last is None or len(values) != len(self._last) or ts - self._last_ts >= self._max_silence_sec:
+            return self._keep(ts, values)
+
+        for i, (value, last) in enumerate(zip(values, self._last, strict=True)):
+            if value == last or (i < len(self._ignore) and self._ignore[i]):
+                continue
+            try:
+                delta = abs(float(value) - float(last))
+            except (TypeError, ValueError):
+                return self._keep(ts, values)
+            abs_thr = self._abs[i] if i < len(self._abs) else self._default[0]
+            rel_thr = self._rel[i] if i < len(self._rel) else self._default[1]
+            if delta > max(abs_thr, rel_thr * abs(float(last))):
+                return self._keep(ts, values)
+        return False
+
+    def _keep(self, ts: float, values: list[Any]) -> bool:
+        """Remember passed row."""
+        self._last = list(values)
+        self._last_ts = ts
+        return True
@@ -0,0 +1,153 @@
+"""Shared worker engine.
+
+Runs many workers on a small fixed thread pool instead of one OS thread per
+worker. A dispatcher thread keeps a heap of (due time, worker) entries and
+hands each due worker's step() to the pool; a worker is never queued while
+its step runs, so steps of one worker are serialized and each worker keeps
+its own deadline based schedule (TickScheduler).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from src.platform.enums.log import LogName
+
+if TYPE_CHECKING:
+    from src.core.worker import Worker
+
+
+class WorkerEngine:
+    """Multiplex periodic workers onto a bounded thread pool."""
+
+    def __init__(self, threads: int = 4):
+        """Initialize engine (threads start with the first worker).
+
+        Args:
+            threads: Pool threads running worker steps (max concurrent commands)
+        """
+        self._threads = max(1, threads)
+        self._heap: list[tuple[float, int, Worker]] = []
+        self._seq = itertools.count()  # Tie breaker, workers are not comparable
+        self._cond = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._dispatcher: threading.Thread | None = None
+        self._running = False
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    @property
+    def threads(self) -> int:
+        """Get pool size.
+
+        Returns:
+            Number of pool threads
+        """
+        return self._threads
+
+    def add(self, worker: "Worker") -> None:
+        """Bind worker to engine and open it on the pool.
+
+        Args:
+            worker: Worker to drive (its own thread is never started)
+        """
+        worker.bind_engine(self)
+        self._ensure_running()
+        self._executor.submit(self._open, worker)
+
+    def wake(self, worker: "Worker") -> None:
+        """Make a closed worker due now so it finishes without waiting for its tick.
+
+        Args:
+            worker: Worker that was closed
+        """
+        with self._cond:
+            self._heap = [(0.0 if w is worker else due, seq, w) for due, seq, w in self._heap]
+            heapq.heapify(self._heap)
+            self._cond.notify()
+
+    def shutdown(self) -> None:
+        """Stop dispatcher and pool (call after all workers are closed)."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._dispatcher:
+            self._dispatcher.join(timeout=2)
+            self._dispatcher = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        # Workers still queued never get another step
+        with self._cond:
+            pending, self._heap = self._heap, []
+        for _, _, worker in pending:
+            worker.finish()
+
+    def _ensure_running(self) -> None:
+        """Start pool and dispatcher if not running."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._executor = ThreadPoolExecutor(self._threads, thread_name_prefix="worker-engine")
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="worker-engine-dispatch", daemon=True)
+            self._dispatcher.start()
+        self._logger.debug(f"Worker engine started with {self._threads} threads")
+
+    def _schedule(self, worker: "Worker", due: float) -> None:
+        """Queue worker step at due time.
+
+        Args:
+            worker: Worker to step
+            due: time.monotonic() value
+        """
+        with self._cond:
+            heapq.heappush(self._heap, (due, next(self._seq), worker))
+            self._cond.notify()
+
+    def _dispatch_loop(self) -> None:
+        """Hand due workers to the pool until shutdown."""
+        while True:
+            with self._cond:
+                while self._running:
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    self._cond.wait(self._heap[0][0] - now if self._heap else None)
+                if not self._running:
+                    return
+                _, _, worker = heapq.heappop(self._heap)
+            self._executor.submit(self._step, worker)
+
+    def _open(self, worker: "Worker") -> None:
+        """Run worker setup and queue its first step.
+
+        Args:
+            worker: Worker to open
+        """
+        worker.start_timer()
+        if worker.open():
+            self._schedule(worker, time.monotonic())
+        else:
+            worker.finish()
+
+    def _step(self, worker: "Worker") -> None:
+        """Run one worker step and queue the next one.
+
+        Args:
+            worker: Worker to step
+        """
+        try:
+            due = worker.step()
+        except Exception:
+            self._logger.exception(f"Worker engine: step of '{worker.command}' failed")
+            due = None
+        if due is None:
+            worker.finish()
+        else:
+            self._schedule(worker, due)
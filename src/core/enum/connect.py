@@ -17,6 +17,52 @@ class HostType(str, Enum):
     SUT = "sut"
 
 
+class ShellState(str, Enum):
+    """Interactive shell bring-up state."""
+
+    BANNER = "banner"
+    WAKE = "wake"
+    CONFIG = "config"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class SchedulePolicy(str, Enum):
+    """Worker sampling schedule.
+
+    DELAY sleeps the interval after each command (period = command time + interval).
+    SKIP and COALESCE run on a fixed grid (start + k * interval); when a command
+    overruns, SKIP waits for the next future tick and COALESCE runs the overdue
+    ticks once, immediately.
+    """
+
+    DELAY = "delay"
+    SKIP = "skip"
+    COALESCE = "coalesce"
+
+
+class BufferPolicy(str, Enum):
+    """What a full worker sample buffer does with new samples."""
+
+    OVERWRITE = "overwrite"  # Evict oldest sample
+    DROP_NEW = "drop_new"  # Keep history, drop incoming sample
+
+
+class LogCompression(str, Enum):
+    """Compression of closed CSV log segments."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"  # Needs Python 3.14+ (compression.zstd)
+
+
+class NetdevSource(str, Enum):
+    """Counter source of the netdev snapshot worker."""
+
+    SYSFS = "sysfs"  # /sys/class/net/<iface>/statistics/<counter>, only the selected counters are read
+    PROC = "proc"  # /proc/net/dev, 16 counters of every interface in one file
+
+
 class IperfHostType(str, Enum):
     """Iperf host type for traffic testing."""
 
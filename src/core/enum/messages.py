@@ -13,6 +13,7 @@ class LogMsg(Enum):
     # Connection
     CONN_ALREADY_CONNECTED = "Already connected to host"
     CONN_ALREADY_DISCONNECTED = "Already disconnected from host"
+    PRE_HOST_CON = "Using existing connection to host"
     CONN_DISCONNECTING = "Disconnecting from host"
     CONN_DISCONNECT_FAILED = "Failed disconnecting from host"
     CONN_DISCONNECTED = "Disconnected from host"
@@ -40,6 +41,8 @@ class LogMsg(Enum):
     CONN_CONNECTING = "Connecting to hosts..."
     CONN_ESTABLISHED = "Connection established to hosts..."
     CONN_TRANSPORT_INACTIVE = "Connection established but transport is not active"
+    CONN_NO_CHANNEL = "No free SSH channel on transport"
+    CONN_STREAM_REFUSED = "Long-lived channel refused, transport at its session limit"
 
     # SSH Connection
     SSH_CONN_SUCCESS = "SSH connection successful"
@@ -66,6 +69,10 @@ class LogMsg(Enum):
     SHELL_ALREADY_CLOSED = "Shell already closed or have not been opened"
     SHELL_INVOKED_BANNER = "Shell invoked, waiting for banner"
     SHELL_STOPPING_THREAD = "Stopping keepalive thread"
+    SHELL_BUFFER_CLEAR = "Shell buffer cleared after config commands"
+    SHELL_BUFFER_CLEAR_FAIL = "Failed to clear shell buffer after config commands"
+    SHELL_BUFFER_CLEARING = "Clearing shell buffer"
+    SHELL_BUFFER_CLEARED = "Shell buffer cleared"
 
     # Command Execution
     CMD_EXEC = "Executing command"
@@ -232,6 +239,11 @@ class LogMsg(Enum):
     WORKER_LOG_HEADER_FAIL = "Failed to read header from log file"
     WORKER_LOG_CLEAR_FAIL = "Failed to clear log file"
 
+    # Worker Link Event Stream
+    WORKER_LINK_STREAM_STARTED = "Streaming link events"
+    WORKER_LINK_STREAM_FALLBACK = "Link event stream unavailable, polling instead"
+    WORKER_LINK_STREAM_ENDED = "Link event stream ended, polling instead"
+
     # Scanner - General
     SCANNER_INIT = "Initializing scanners"
     SCANNER_CONN_FAILED = "Scanner connection failed"
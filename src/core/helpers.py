@@ -62,6 +62,39 @@ def get_attr_value(obj: Any, attr_name: str, default: str = "") -> str:
     return str(attr)
 
 
+def get_attr_values(obj: Any, attributes: list[str]) -> list[str]:
+    """Extract row values of several attributes from a parsed result.
+
+    Args:
+        obj: Parsed result (typed records such as MlxlinkRecord format their own row)
+        attributes: Attribute names in column order
+
+    Returns:
+        One string value per attribute
+    """
+    row = getattr(obj, "row", None)
+    if row is not None:
+        return row(attributes)
+    return [get_attr_value(obj, attr) for attr in attributes]
+
+
+def get_flap_values(flap: Any) -> list[str]:
+    """Get row values of a link flap.
+
+    Args:
+        flap: Flap object with interface, down_time, up_time, duration
+
+    Returns:
+        Interface, down time, up time and duration
+    """
+    return [
+        flap.interface,
+        flap.down_time.strftime("%Y-%m-%d %H:%M:%S.%f"),
+        flap.up_time.strftime("%Y-%m-%d %H:%M:%S.%f"),
+        str(flap.duration),
+    ]
+
+
 def safe_float(value: str, default: float = 0.0) -> float:
     """Convert string to float with fallback.
 
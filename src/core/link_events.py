@@ -0,0 +1,129 @@
+"""Event-driven link flap detection.
+
+A LinkEventWorker keeps one long-lived channel open on `dmesg --follow` and
+feeds each kernel line to SutDmesgFlapParser.feed() as it arrives, instead of
+dumping the whole ring buffer every high-res tick. Flaps are logged, buffered
+and marked in shared_flap_state exactly like polled flaps, at the time the
+up event arrives. When a stream cannot be opened (e.g. broker connections) or
+ends, the worker falls back to polling its regular dmesg command. With raw
+archiving on, every streamed line is archived as its own record.
+"""
+
+import time
+
+from src.core.connect.batch import new_batch_token, sudo_command, sudo_stdin
+from src.core.connect.stream import CmdStream
+from src.core.enum.messages import LogMsg
+from src.core.sample import SampleRecord
+from src.core.statistics import WorkerStatistics
+from src.core.worker import Worker, WorkerConfig
+from src.models.config import Config
+
+
+class LinkEventWorker(Worker):
+    """Flap worker reading streamed kernel link events, polling as fallback."""
+
+    def __init__(
+        self,
+        worker_cfg: WorkerConfig,
+        stream_command: str,
+        cfg: Config,
+        ssh_factory,
+        shared_flap_state: dict | None = None,
+        statistics: WorkerStatistics | None = None,
+    ) -> None:
+        """Initialize worker.
+
+        Args:
+            worker_cfg: Polling dmesg worker configuration (parser must provide feed())
+            stream_command: Long-running command printing link event lines
+            cfg: Application configuration
+            ssh_factory: Callable that creates new SSH connection
+            shared_flap_state: Shared dictionary for flap detection across workers
+            statistics: Shared statistics tracker for command durations
+        """
+        super().__init__(worker_cfg, cfg, ssh_factory, shared_flap_state, statistics)
+        self._stream_command = stream_command
+        self._stream: CmdStream | None = None
+
+    def open(self) -> bool:
+        """Connect, run setup and start the event stream.
+
+        Returns:
+            True if worker is ready to step
+        """
+        if not super().open():
+            return False
+
+        sudo_pass = getattr(self._cfg, "sut_sudo_pass", "")
+        token = new_batch_token()
+        cmd = sudo_command(self._stream_command, token) if sudo_pass else self._stream_command
+        self._stream = self._ssh.open_stream(cmd)
+        if self._stream is None:
+            self._logger.warning(f"{LogMsg.WORKER_LINK_STREAM_FALLBACK.value}: {self.command}")
+            return True
+
+        if sudo_pass:
+            self._stream.write(sudo_stdin(sudo_pass, token).encode())
+        self._logger.info(f"{LogMsg.WORKER_LINK_STREAM_STARTED.value}: {self._stream_command}")
+        return True
+
+    def step(self) -> float | None:
+        """Wait for the next streamed line and record a flap it completes.
+
+        Returns:
+            Due time (time.monotonic()) of the next step, or None when the worker is done
+        """
+        stream = self._stream  # close() on another thread may drop it at any time
+        if stream is None:
+            return super().step()
+        if self._stop_event.is_set():
+            return None
+
+        try:
+            line = stream.readline()
+        except (OSError, ValueError):  # Closed underneath the read
+            line = b""
+        if self._stop_event.is_set():
+            return None
+        if not line:
+            self._logger.warning(f"{LogMsg.WORKER_LINK_STREAM_ENDED.value}: {self.command}")
+            self._close_stream()
+            self._scheduler.start()
+            return time.monotonic()
+
+        text = line.decode(errors="replace")
+        if self._raw_archive is not None:
+            self._raw_archive.append(time.time(), text.rstrip("\n"))
+        flap = self._worker_cfg.parser.feed(text)
+        if flap is not None:
+            sample = SampleRecord(time.time())
+            self._record_flap(sample.begin_str, sample.begin, 0.0, flap)
+        return time.monotonic()
+
+    def close(self) -> None:
+        """Signal worker to stop and unblock a pending stream read."""
+        super().close()
+        self._close_stream()
+
+    def finish(self) -> None:
+        """Close the event stream, then disconnect and mark worker as done."""
+        self._close_stream()
+        super().finish()
+
+    def _raw_archive_meta(self) -> dict:
+        """Describe archived outputs; streamed lines are re-parsed with feed().
+
+        Returns:
+            Worker archive header marked as stream archive
+        """
+        return {**super()._raw_archive_meta(), "stream": True}
+
+    def _close_stream(self) -> None:
+        """Close event stream (idempotent)."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                self._logger.exception(f"Failed to close link event stream: {self.command}")
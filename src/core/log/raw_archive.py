@@ -0,0 +1,230 @@
+"""Raw command output archive for offline re-parsing.
+
+In raw archive mode every worker appends the unparsed output of each sample
+to its own file, so historical values can be re-derived after a parser
+change (see src/core/reparse.py). File layout:
+
+    MAGIC | meta length (u32) | meta JSON | record*
+    record = begin (f64 epoch seconds) | payload length (u32) | zlib payload
+
+Each record is compressed on its own, so any slice of records can be read
+and decompressed independently (parallel re-parse). A record cut short by a
+crash is ignored by the reader and cut off by the next writer of the file
+before it appends. Sampling threads only queue outputs; the shared CSV
+writer thread (src/core/log/sink.py) compresses and writes them.
+"""
+
+import json
+import logging
+import mmap
+from pathlib import Path
+from queue import Empty, SimpleQueue
+import re
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+from src.core.log.sink import CsvWriter, shared_writer
+from src.platform.enums.log import LogName
+
+MAGIC = b"ICRAW01\n"
+COMPRESS_LEVEL = 6
+
+_META_LEN = struct.Struct("<I")
+_RECORD = struct.Struct("<dI")
+
+
+def raw_archive_path(log_path: Path, command: str) -> Path:
+    """Get archive path of one worker next to its log file.
+
+    Workers sharing a logger (one per interface) get one file each, named
+    after the command plus a checksum that keeps truncated names unique.
+
+    Args:
+        log_path: Worker log file
+        command: Worker command
+
+    Returns:
+        Path like sut_ethtool_ethtool_m_ens1f0np0_1a2b3c4d.raw
+    """
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", command).strip("_")[:48]
+    return log_path.with_name(f"{log_path.stem}_{slug}_{zlib.crc32(command.encode()):08x}.raw")
+
+
+class RawArchiveWriter:
+    """Appends raw outputs of one worker, compressed and written in batches by a CsvWriter."""
+
+    def __init__(self, path: Path, meta: dict, writer: CsvWriter | None = None, batch_records: int = 64):
+        """Open archive for appending (header is written when the file is new).
+
+        A record cut short by a crash of an earlier run is cut off first, so
+        new records follow the last complete one.
+
+        Args:
+            path: Archive file
+            meta: Parser description stored in the header (command, parser, attributes, ...)
+            writer: Background writer (default: shared writer)
+            batch_records: Queued outputs that trigger an early write
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("ab", buffering=0)
+        size = self._file.tell()
+        end = _complete_size(self._path) if size else 0
+        if end != size:
+            logging.getLogger(LogName.MAIN.value).warning(
+                f"Raw archive {self._path.name}: dropped {size - end} bytes of a record cut short"
+            )
+            self._file.truncate(end)
+        if end == 0:
+            data = json.dumps(meta).encode()
+            self._file.write(MAGIC + _META_LEN.pack(len(data)) + data)
+        self._batch_records = max(1, batch_records)
+        self._queue: SimpleQueue[tuple[float, str]] = SimpleQueue()
+        self._lock = threading.Lock()  # Serializes drains (writer thread vs close)
+        self._writer = writer or shared_writer()
+        self._writer.register(self)
+
+    @property
+    def path(self) -> Path:
+        """Get archive file path.
+
+        Returns:
+            Archive path
+        """
+        return self._path
+
+    def append(self, begin: float, output: str) -> None:
+        """Queue one raw output (compressed and written by the writer thread).
+
+        Args:
+            begin: Sample begin time as epoch seconds
+            output: Unparsed command output
+        """
+        self._queue.put((begin, output))
+        if self._queue.qsize() >= self._batch_records:
+            self._writer.wake()
+
+    def drain(self) -> int:
+        """Compress queued outputs and write them in one call (called by the writer).
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            if self._file is None:
+                return 0
+            records: list[bytes] = []
+            while True:
+                try:
+                    begin, output = self._queue.get_nowait()
+                except Empty:
+                    break
+                payload = zlib.compress(output.encode(), COMPRESS_LEVEL)
+                records.append(_RECORD.pack(begin, len(payload)) + payload)
+            if records:
+                self._file.write(b"".join(records))
+            return len(records)
+
+    def close(self) -> None:
+        """Write everything queued and close archive file."""
+        self._writer.unregister(self)
+        self.drain()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _complete_size(path: Path) -> int:
+    """Get the size of an archive up to its last complete record.
+
+    Args:
+        path: Archive file
+
+    Returns:
+        Bytes to keep (0 if not even the header is complete)
+    """
+    try:
+        with RawArchive(path) as archive:
+            _, offsets, lengths = archive.index()
+            return int(offsets[-1] + lengths[-1]) if len(offsets) else archive.data_start
+    except (ValueError, struct.error):
+        return 0  # Header cut short
+
+
+class RawArchive:
+    """Memory mapped read access to a raw archive."""
+
+    def __init__(self, path: Path):
+        """Map archive and read its header.
+
+        Args:
+            path: Archive file
+
+        Raises:
+            ValueError: If the file is not a raw archive
+        """
+        self._path = Path(path)
+        with self._path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a raw archive: {self._path}")
+        (meta_len,) = _META_LEN.unpack_from(self._map, len(MAGIC))
+        start = len(MAGIC) + _META_LEN.size
+        self.meta: dict = json.loads(self._map[start : start + meta_len])
+        self._data_start = start + meta_len
+
+    def __enter__(self) -> "RawArchive":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    @property
+    def data_start(self) -> int:
+        """Get offset of the first record.
+
+        Returns:
+            Byte offset after the header
+        """
+        return self._data_start
+
+    def index(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Scan record headers without decompressing payloads.
+
+        Returns:
+            Tuple of (begin times, payload offsets, payload lengths), one entry per complete record
+        """
+        begins, offsets, lengths = [], [], []
+        pos, end = self._data_start, len(self._map)
+        unpack = _RECORD.unpack_from
+        while pos + _RECORD.size <= end:
+            begin, length = unpack(self._map, pos)
+            pos += _RECORD.size
+            if pos + length > end:
+                break  # Truncated last record
+            begins.append(begin)
+            offsets.append(pos)
+            lengths.append(length)
+            pos += length
+        return np.array(begins, dtype=np.float64), np.array(offsets, dtype=np.int64), np.array(lengths, dtype=np.int64)
+
+    def output(self, offset: int, length: int) -> str:
+        """Decompress one raw output.
+
+        Args:
+            offset: Payload offset from index()
+            length: Payload length from index()
+
+        Returns:
+            Command output as written
+        """
+        return zlib.decompress(self._map[offset : offset + length]).decode(errors="replace")
+
+    def close(self) -> None:
+        """Unmap archive."""
+        self._map.close()
@@ -2,9 +2,13 @@
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.core.log.formatter import create_formatter
 
+if TYPE_CHECKING:
+    from src.core.log.sink import CsvSink
+
 
 def _get_log_file(logger: logging.Logger) -> Path | None:
     """Get log file path from logger.
@@ -165,6 +169,72 @@ def check_and_rotate_log(
         _clear_log_file(log_file, logger, keep_header, csv_header)
 
 
+def _rotated_path(log_file: Path, count: int) -> Path:
+    """Build numbered file name for a rotation (sut_mxlink.log -> sut_mxlink_1.log).
+
+    Args:
+        log_file: Current file path (may already carry a rotation number)
+        count: Rotation number
+
+    Returns:
+        New file path
+    """
+    base_stem = (
+        log_file.stem.rsplit("_", 1)[0]
+        if "_" in log_file.stem and log_file.stem.split("_")[-1].isdigit()
+        else log_file.stem
+    )
+    return log_file.with_name(f"{base_stem}_{count}{log_file.suffix}")
+
+
+def check_and_rotate_sink(
+    sink: "CsvSink",
+    logger_key: str,
+    max_size_kb: int,
+    shared_flap_state: dict,
+    has_rotated_since_flap: dict[str, bool],
+    log_rotation_count: dict[str, int],
+) -> None:
+    """Check CSV sink size and rotate or clear it (same per-logger flap rules as check_and_rotate_log).
+
+    Size is tracked by the sink in memory, so this costs no syscall. A
+    segmented sink never clears: it rolls to the next segment and the closed
+    one is compressed in the background, retained for good if a flap is pending.
+
+    Args:
+        sink: CSV sink of the worker
+        logger_key: Logger name owning the sink (flap state key)
+        max_size_kb: Maximum file size in KB
+        shared_flap_state: Dict with 'logger_flap_states' per logger
+        has_rotated_since_flap: Dict tracking rotation state per logger
+        log_rotation_count: Dict tracking rotation count per logger
+    """
+    if sink.size_kb < max_size_kb:
+        return
+
+    main_logger = logging.getLogger("main")
+    _init_rotation_state(logger_key, has_rotated_since_flap, log_rotation_count, shared_flap_state)
+
+    if sink.segmented:
+        retain = _should_logger_rotate(logger_key, shared_flap_state)
+        log_rotation_count[logger_key] += 1
+        new_path = sink.roll(retain)
+        main_logger.info(
+            f"Rotation: {logger_key} CSV rolling to {new_path.name} (size={sink.size_kb:.1f}KB, retain={retain})"
+        )
+        if retain:
+            _clear_logger_flap_state(logger_key, shared_flap_state, has_rotated_since_flap)
+    elif _should_logger_rotate(logger_key, shared_flap_state):
+        log_rotation_count[logger_key] += 1
+        new_path = _rotated_path(sink.path, log_rotation_count[logger_key])
+        main_logger.info(f"Rotation: {logger_key} CSV rotating to {new_path.name} (size={sink.size_kb:.1f}KB)")
+        sink.rotate(new_path)
+        _clear_logger_flap_state(logger_key, shared_flap_state, has_rotated_since_flap)
+    else:
+        main_logger.info(f"Rotation: {logger_key} CSV clearing file (size={sink.size_kb:.1f}KB)")
+        sink.clear()
+
+
 def _rotate_to_new_file(
     log_file: Path,
     logger: logging.Logger,
@@ -184,12 +254,7 @@ def _rotate_to_new_file(
         csv_header: CSV header string
     """
     log_rotation_count[logger_key] += 1
-    base_stem = (
-        log_file.stem.rsplit("_", 1)[0]
-        if "_" in log_file.stem and log_file.stem.split("_")[-1].isdigit()
-        else log_file.stem
-    )
-    new_log_file = log_file.with_name(f"{base_stem}_{log_rotation_count[logger_key]}: {log_file.suffix}")
+    new_log_file = _rotated_path(log_file, log_rotation_count[logger_key])
 
     for handler in logger.handlers[:]:
         if isinstance(handler, logging.FileHandler):
@@ -0,0 +1,202 @@
+"""Numbered CSV segments with background compression and bounded retention.
+
+A segmented CSV sink never truncates its file. When it is full it rolls to the
+next numbered segment (sut_mlxlink.csv -> sut_mlxlink_1.csv -> ...) and the
+closed segment is handed to a shared compressor thread, so the sampling
+thread never waits for a rename, truncate or compress. Segments closed while
+a link flap was pending are retained for good; all other segments are kept
+up to a configured count, oldest deleted first.
+"""
+
+from collections import deque
+import gzip
+import logging
+from pathlib import Path
+from queue import SimpleQueue
+import shutil
+import threading
+
+from src.core.enum.connect import LogCompression
+from src.platform.enums.log import LogName
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+
+def compression_available(compression: LogCompression) -> bool:
+    """Check if a compression type can be used by this interpreter.
+
+    Args:
+        compression: Compression type
+
+    Returns:
+        True if segments can be compressed with it
+    """
+    return compression != LogCompression.ZSTD or zstd is not None
+
+
+class SegmentArchive:
+    """Numbering, compression and retention of closed segments of one CSV file."""
+
+    def __init__(self, base_path: Path, keep: int, compression: LogCompression = LogCompression.GZIP):
+        """Initialize archive.
+
+        Args:
+            base_path: Path of the first segment (later segments are numbered from it)
+            keep: Closed segments kept when no flap is pending (older ones are deleted)
+            compression: Compression applied to closed segments
+        """
+        self._base_path = Path(base_path)
+        self._keep = max(1, keep)
+        self._compression = compression
+        self._count = 0
+        self._lock = threading.Lock()
+        self._expiring: deque[Path] = deque()  # Closed segments subject to retention, oldest first
+        self._retained: list[Path] = []
+
+    @property
+    def retained(self) -> list[Path]:
+        """Get segments kept because a flap was pending when they closed.
+
+        Returns:
+            Segment paths (compressed name once compression is done)
+        """
+        with self._lock:
+            return list(self._retained)
+
+    def next_path(self) -> Path:
+        """Reserve file name of the next segment.
+
+        Returns:
+            Numbered segment path (sut_mlxlink_3.csv)
+        """
+        with self._lock:
+            self._count += 1
+            count = self._count
+        return self._base_path.with_name(f"{self._base_path.stem}_{count}{self._base_path.suffix}")
+
+    def close_segment(self, path: Path, retain: bool = False) -> None:
+        """Queue closed segment for compression and retention (returns immediately).
+
+        Args:
+            path: Closed segment file
+            retain: Keep segment regardless of the retention count
+        """
+        shared_compressor().submit(self, Path(path), retain)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until queued segments are compressed.
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            True if no compression is pending anymore
+        """
+        return shared_compressor().wait(timeout)
+
+    def _archive(self, path: Path, retain: bool) -> None:
+        """Compress segment and delete segments beyond retention (compressor thread)."""
+        path = self._compress(path)
+        with self._lock:
+            if retain:
+                self._retained.append(path)
+                return
+            self._expiring.append(path)
+            expired = [self._expiring.popleft() for _ in range(len(self._expiring) - self._keep)]
+        for old in expired:
+            old.unlink(missing_ok=True)
+
+    def _compress(self, path: Path) -> Path:
+        """Compress file next to itself and remove the original.
+
+        The compressed file is written under a temporary name first, so an
+        interrupted compression leaves the plain segment intact.
+
+        Returns:
+            Path of the compressed file (or path itself without compression)
+        """
+        if self._compression == LogCompression.NONE or not path.exists():
+            return path
+        if self._compression == LogCompression.ZSTD:
+            target, opener = path.with_name(path.name + ".zst"), zstd.open
+        else:
+            target, opener = path.with_name(path.name + ".gz"), gzip.open
+        tmp = target.with_name(target.name + ".tmp")
+        with path.open("rb") as src, opener(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        tmp.replace(target)
+        path.unlink()
+        return target
+
+
+class SegmentCompressor:
+    """Background thread compressing closed segments of all archives."""
+
+    def __init__(self):
+        """Initialize compressor (thread starts with the first segment)."""
+        self._queue: SimpleQueue = SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._thread: threading.Thread | None = None
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    def submit(self, archive: SegmentArchive, path: Path, retain: bool) -> None:
+        """Queue closed segment.
+
+        Args:
+            archive: Archive the segment belongs to
+            path: Closed segment file
+            retain: Keep segment regardless of the retention count
+        """
+        with self._lock:
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="segment-compressor", daemon=True)
+                self._thread.start()
+        self._queue.put((archive, path, retain))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until all queued segments are compressed.
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            True if nothing is pending anymore
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _loop(self) -> None:
+        """Compress queued segments one at a time."""
+        while True:
+            archive, path, retain = self._queue.get()
+            try:
+                archive._archive(path, retain)  # noqa: SLF001
+            except Exception:
+                self._logger.exception(f"Segment compressor failed to archive {path}")
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+
+
+_shared_compressor: SegmentCompressor | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_compressor() -> SegmentCompressor:
+    """Get process wide segment compressor (created on first use).
+
+    Returns:
+        Shared compressor
+    """
+    global _shared_compressor  # noqa: PLW0603
+    with _shared_lock:
+        if _shared_compressor is None:
+            _shared_compressor = SegmentCompressor()
+        return _shared_compressor
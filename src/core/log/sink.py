@@ -0,0 +1,342 @@
+"""Asynchronous batched CSV sinks for worker sample rows.
+
+Sampling threads only push finished CSV lines onto a per-sink SimpleQueue;
+one shared background writer drains every sink in batches, either every
+flush interval or as soon as a sink has a full batch queued. Files are clean
+CSV (header + rows), no logging prefix, no formatter, no per-row syscalls.
+Rotation requests travel through the same queue so they stay ordered with
+the rows around them. Raw archives (raw_archive.py) are drained the same
+way. A sink with a SegmentArchive never truncates: it rolls to numbered
+segments that are compressed in the background.
+"""
+
+from collections.abc import Callable
+import logging
+from pathlib import Path
+from queue import Empty, SimpleQueue
+import threading
+from typing import TYPE_CHECKING
+
+from src.core.enum.connect import LogCompression
+from src.core.log.segments import SegmentArchive
+from src.platform.enums.log import LogName
+
+if TYPE_CHECKING:
+    from src.core.log.raw_archive import RawArchiveWriter
+
+_CLEAR = "clear"
+_ROTATE = "rotate"
+
+
+class CsvSink:
+    """Clean CSV file fed from any thread, written by a CsvWriter."""
+
+    __slots__ = (
+        "_archive",
+        "_batch_rows",
+        "_bytes",
+        "_file",
+        "_header",
+        "_lock",
+        "_path",
+        "_pending_resets",
+        "_queue",
+        "_writer",
+    )
+
+    ARCHIVE_WAIT_SEC = 10  # Max wait on close for closed segments still being compressed
+
+    def __init__(
+        self,
+        path: Path,
+        header: str | None = None,
+        writer: "CsvWriter | None" = None,
+        batch_rows: int = 256,
+        archive: SegmentArchive | None = None,
+    ):
+        """Create sink, write header and register it with the writer.
+
+        Args:
+            path: CSV file path (truncated)
+            header: Header line written to every new or cleared file (None = data carries its own)
+            writer: Background writer (default: shared writer)
+            batch_rows: Queued rows that trigger an early flush
+            archive: Segment archive (roll() instead of clear/rotate)
+        """
+        self._path = Path(path)
+        self._archive = archive
+        self._header = header
+        self._batch_rows = max(1, batch_rows)
+        self._queue: SimpleQueue = SimpleQueue()
+        self._lock = threading.Lock()  # Serializes drains (writer thread vs close)
+        self._file = None
+        self._bytes = 0
+        self._pending_resets = 0  # Queued clear/rotate requests not applied yet
+        self._open(self._path)
+        self._writer = writer or shared_writer()
+        self._writer.register(self)
+
+    @property
+    def path(self) -> Path:
+        """Get current file path.
+
+        Returns:
+            CSV file path (changes on rotation)
+        """
+        return self._path
+
+    @property
+    def segmented(self) -> bool:
+        """Check if sink rolls to archived segments.
+
+        Returns:
+            True if a segment archive is attached
+        """
+        return self._archive is not None
+
+    @property
+    def size_kb(self) -> float:
+        """Get size of the current file as written so far.
+
+        Returns:
+            Size in KB (rows still queued are not counted, 0 while a clear/rotate is queued)
+        """
+        return 0.0 if self._pending_resets else self._bytes / 1024
+
+    def write(self, line: str) -> None:
+        """Queue one CSV line (without newline).
+
+        Args:
+            line: CSV row
+        """
+        self._queue.put(line)
+        if self._queue.qsize() >= self._batch_rows:
+            self._writer.wake()
+
+    def clear(self) -> None:
+        """Queue truncation of the current file (header is rewritten)."""
+        with self._lock:
+            self._pending_resets += 1
+        self._queue.put((_CLEAR, None, None))
+
+    def rotate(self, path: Path, closed: Callable[[Path], None] | None = None) -> None:
+        """Queue switch to a new file (header is written to it).
+
+        Args:
+            path: New CSV file path
+            closed: Called by the writer with the old path once it is closed
+        """
+        with self._lock:
+            self._pending_resets += 1
+        self._queue.put((_ROTATE, Path(path), closed))
+
+    def roll(self, retain: bool = False) -> Path:
+        """Queue switch to the next segment and archive the current one after it is closed.
+
+        Args:
+            retain: Keep the closed segment regardless of retention (flap pending)
+
+        Returns:
+            Path of the next segment
+        """
+        path = self._archive.next_path()
+        self.rotate(path, lambda old: self._archive.close_segment(old, retain))
+        return path
+
+    def close(self) -> None:
+        """Write everything queued and close the file (the active segment stays uncompressed)."""
+        self._writer.unregister(self)
+        self.drain()
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+        if self._archive is not None:
+            self._archive.wait(self.ARCHIVE_WAIT_SEC)
+
+    def drain(self) -> int:
+        """Write queued rows and apply queued rotations (called by the writer).
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            if self._file is None:
+                return 0
+            lines: list[str] = []
+            written = 0
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+                if isinstance(item, str):
+                    lines.append(item)
+                    continue
+                written += self._write_lines(lines)
+                lines = []
+                action, path, closed = item
+                old_path = self._path
+                self._file.close()
+                self._open(path if action == _ROTATE else self._path)
+                self._pending_resets -= 1
+                if closed is not None:
+                    closed(old_path)
+            written += self._write_lines(lines)
+            if written:
+                self._file.flush()
+            return written
+
+    def _write_lines(self, lines: list[str]) -> int:
+        """Write batch of lines to the open file."""
+        if not lines:
+            return 0
+        data = "\n".join(lines) + "\n"
+        self._file.write(data)
+        self._bytes += len(data)
+        return len(lines)
+
+    def _open(self, path: Path) -> None:
+        """Open (truncate) file and write header."""
+        self._path = path
+        self._file = path.open("w", buffering=1 << 16)
+        self._bytes = 0
+        if self._header:
+            self._file.write(self._header + "\n")
+            self._bytes = len(self._header) + 1
+        self._file.flush()
+
+
+class CsvWriter:
+    """Background thread draining registered CSV sinks (and raw archives) in batches."""
+
+    def __init__(self, flush_interval_ms: int = 200):
+        """Initialize writer (thread starts with the first sink).
+
+        Args:
+            flush_interval_ms: Maximum time rows wait in a queue
+        """
+        self._interval = max(flush_interval_ms, 1) / 1000
+        self._sinks: list[CsvSink | RawArchiveWriter] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._logger = logging.getLogger(LogName.MAIN.value)
+
+    def register(self, sink: "CsvSink | RawArchiveWriter") -> None:
+        """Add sink to the drain loop.
+
+        Args:
+            sink: Sink to drain
+        """
+        with self._lock:
+            self._sinks.append(sink)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="csv-writer", daemon=True)
+                self._thread.start()
+
+    def unregister(self, sink: "CsvSink | RawArchiveWriter") -> None:
+        """Remove sink from the drain loop.
+
+        Args:
+            sink: Sink to remove
+        """
+        with self._lock:
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+
+    def wake(self) -> None:
+        """Drain now instead of at the next flush interval."""
+        self._wake.set()
+
+    def _loop(self) -> None:
+        """Drain all sinks every interval or when woken, until no sink is left."""
+        while True:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            with self._lock:
+                sinks = list(self._sinks)
+                if not sinks:
+                    self._thread = None
+                    return
+            for sink in sinks:
+                try:
+                    sink.drain()
+                except Exception:
+                    self._logger.exception(f"CSV writer failed to write {sink.path}")
+
+
+_shared_writer: CsvWriter | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_writer(flush_interval_ms: int = 200) -> CsvWriter:
+    """Get process wide CSV writer (created on first use).
+
+    Args:
+        flush_interval_ms: Flush interval used when the writer is created
+
+    Returns:
+        Shared writer
+    """
+    global _shared_writer  # noqa: PLW0603
+    with _shared_lock:
+        if _shared_writer is None:
+            _shared_writer = CsvWriter(flush_interval_ms)
+        return _shared_writer
+
+
+_open_sinks: dict[Path, list] = {}  # path -> [sink, users]
+
+
+def acquire_sink(
+    path: Path,
+    header: str | None = None,
+    flush_interval_ms: int = 200,
+    batch_rows: int = 256,
+    segments: int = 0,
+    compression: LogCompression = LogCompression.GZIP,
+) -> CsvSink:
+    """Get the sink writing path, creating it for the first user.
+
+    Workers logging to the same file share one sink, so the file is
+    truncated and gets its header only once.
+
+    Args:
+        path: CSV file path
+        header: Header line (used when the sink is created)
+        flush_interval_ms: Flush interval of the shared writer (used when it is created)
+        batch_rows: Queued rows that trigger an early flush
+        segments: Closed segments to keep (0 = clear/rotate the file instead of rolling segments)
+        compression: Compression of closed segments
+
+    Returns:
+        CSV sink
+    """
+    key = Path(path).resolve()
+    writer = shared_writer(flush_interval_ms)
+    with _shared_lock:
+        entry = _open_sinks.get(key)
+        if entry is None:
+            archive = SegmentArchive(key, segments, compression) if segments > 0 else None
+            entry = _open_sinks[key] = [CsvSink(key, header, writer, batch_rows, archive), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_sink(sink: CsvSink) -> None:
+    """Drop one user of a sink, flushing and closing it after the last one.
+
+    Args:
+        sink: Sink returned by acquire_sink
+    """
+    with _shared_lock:
+        for key, entry in list(_open_sinks.items()):
+            if entry[0] is sink:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del _open_sinks[key]
+                break
+    sink.close()
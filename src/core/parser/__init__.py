@@ -10,7 +10,9 @@ from src.core.parser.sut import (
     DmesgFlapResult,
     EthtoolModuleDevice,
     MlxlinkDevice,
+    MlxlinkRecord,
     MstVersionDevice,
+    NetdevSnapshot,
     ParsedDevice,
     SutDmesgFlapParser,
     SutEthtoolModuleParser,
@@ -19,6 +21,7 @@ from src.core.parser.sut import (
     SutMlxlinkAmberParser,
     SutMlxlinkParser,
     SutMstStatusVersionParser,
+    SutNetdevParser,
     SutTimeParser,
     SutTxErrorsParser,
     TxErrorsResult,
@@ -31,7 +34,9 @@ __all__ = [
     "DmesgFlapResult",
     "EthtoolModuleDevice",
     "MlxlinkDevice",
+    "MlxlinkRecord",
     "MstVersionDevice",
+    "NetdevSnapshot",
     "ParsedDevice",
     "SlxDscParser",
     "SlxEyeParser",
@@ -42,6 +47,7 @@ __all__ = [
     "SutMlxlinkAmberParser",
     "SutMlxlinkParser",
     "SutMstStatusVersionParser",
+    "SutNetdevParser",
     "SutTimeParser",
     "SutTxErrorsParser",
     "TxErrorsResult",
@@ -30,7 +30,7 @@ class SlxEyeParser(IParser):
     }
 
     def __init__(self):
-        IParser.__init__(self, LogName.SLX_EYE_SCANNER.value)
+        IParser.__init__(self, LogName.SLX_EYE.value)
 
         self._rows: list[dict[str, str]] = []
         self._raw_data: str | None = None
@@ -8,9 +8,10 @@ from src.core.parser.sut.dmesg_flap import (
 from src.core.parser.sut.ethtool_module import EthtoolModuleDevice, SutEthtoolModuleParser
 from src.core.parser.sut.ipmitool_fan import SutIpmitoolFanParser
 from src.core.parser.sut.ipmitool_fan_name import SutIpmitoolFanNameParser
-from src.core.parser.sut.mlxlink import MlxlinkDevice, SutMlxlinkParser
+from src.core.parser.sut.mlxlink import MlxlinkDevice, MlxlinkRecord, SutMlxlinkParser
 from src.core.parser.sut.mlxlink_amber import SutMlxlinkAmberParser
 from src.core.parser.sut.mst_status import MstVersionDevice, SutMstStatusVersionParser
+from src.core.parser.sut.netdev import NetdevSnapshot, SutNetdevParser
 from src.core.parser.sut.time_command import SutTimeParser
 from src.core.parser.sut.tx_errors import SutTxErrorsParser, TxErrorsResult
 
@@ -20,7 +21,9 @@ __all__ = [
     "DmesgFlapResult",
     "EthtoolModuleDevice",
     "MlxlinkDevice",
+    "MlxlinkRecord",
     "MstVersionDevice",
+    "NetdevSnapshot",
     "ParsedDevice",
     "SutDmesgFlapParser",
     "SutEthtoolModuleParser",
@@ -29,6 +32,7 @@ __all__ = [
     "SutMlxlinkAmberParser",
     "SutMlxlinkParser",
     "SutMstStatusVersionParser",
+    "SutNetdevParser",
     "SutTimeParser",
     "SutTxErrorsParser",
     "TxErrorsResult",
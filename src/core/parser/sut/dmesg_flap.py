@@ -83,6 +83,7 @@ class SutDmesgFlapParser(IParser):
         self._start_time = start_time if start_time else dt.fromtimestamp(0, tz=UTC)
         self._result: list[DmesgFlapDevice] = []
         self._raw_data: str | None = None
+        self._pending_down: dict[str, dt] = {}  # feed(): down event per interface waiting for its up
 
     @property
     def name(self) -> str:
@@ -135,6 +136,38 @@ class SutDmesgFlapParser(IParser):
 
         self._logger.debug(f"[{self.name}] Parsed {len(self._result)} link flaps")
 
+    def feed(self, line: str) -> DmesgFlapDevice | None:
+        """Parse one streamed dmesg line (dmesg --follow) incrementally.
+
+        A down event is kept until the next event of the same interface; a
+        following up event completes the flap, like the down->up pairing of parse().
+
+        Args:
+            line: One dmesg line with ISO timestamp
+
+        Returns:
+            Completed flap, or None if the line did not complete one
+        """
+        match = self._link_event_pattern.search(line)
+        if not match:
+            return None
+
+        ts = self._parse_timestamp(match.group("timestamp"))
+        if not ts or ts <= self._start_time:
+            return None
+
+        iface, state = match.group("iface"), match.group("state").lower()
+        if state == "down":
+            self._pending_down[iface] = ts
+            return None
+
+        down_time = self._pending_down.pop(iface, None)
+        if down_time is None:
+            return None
+        self._start_time = ts
+        self._raw_data = line
+        return DmesgFlapDevice(interface=iface, down_time=down_time, up_time=ts)
+
     def get_result(self) -> DmesgFlapResult:
         """Get all detected link flaps and update start_time to latest up_timestamp."""
         if self._result:
@@ -154,38 +154,181 @@ class MlxlinkDevice(ParsedDevice):
         return None
 
 
+_NUMBER = re.compile(r"[\d.-]+")
+_SCIENTIFIC = re.compile(r"[\d.-]+[Ee][+-]?\d+|[\d.-]+")
+
+
+def _number(text: str) -> float | None:
+    """First plain number in text (value with range, e.g. '45 [-5..75]', 'N/A' gives None)."""
+    match = _NUMBER.search(text)
+    try:
+        return float(match.group()) if match else None
+    except ValueError:
+        return None
+
+
+def _scientific(text: str) -> float | None:
+    """First number in text, scientific notation allowed ('N/A' gives None)."""
+    if text == "N/A":
+        return None
+    match = _SCIENTIFIC.search(text)
+    try:
+        return float(match.group()) if match else None
+    except ValueError:
+        return None
+
+
+def _text(text: str) -> str:
+    """Text value as is."""
+    return text
+
+
+class MlxlinkRecord:
+    """Typed mlxlink result parsed in one pass, one value per field in fixed order.
+
+    ATTRIBUTES is the mlxlink worker column order; row() formats the values
+    like get_attr_value() (6 decimals, empty when missing) without any
+    per-attribute lookups or regex work.
+    """
+
+    ATTRIBUTES = (
+        "temperature",
+        "voltage",
+        "bias_current",
+        "rx_power",
+        "tx_power",
+        "time_since_last_clear",
+        "effective_physical_errors",
+        "effective_physical_ber",
+        "raw_physical_errors_per_lane",
+        "raw_physical_ber",
+        "physical_grade",
+        "height_eye",
+        "phase_eye",
+    )
+    FIELDS = (*ATTRIBUTES, "state", "speed", "vendor_name", "vendor_part_number", "vendor_serial_number")
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: list[float | str | None]):
+        """Initialize record.
+
+        Args:
+            values: One value per FIELDS entry (None when missing)
+        """
+        self._values = values
+
+    def __getattr__(self, name: str) -> float | str | None:
+        """Get field value by name (temperature, rx_power, state, ...)."""
+        try:
+            return self._values[_FIELD_INDEX[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def row(self, attributes: list[str] | tuple[str, ...]) -> list[str]:
+        """Format values of the given attributes as CSV fields.
+
+        Args:
+            attributes: Attribute names (fast path when equal to ATTRIBUTES)
+
+        Returns:
+            One field per attribute
+        """
+        values = self._values
+        if tuple(attributes) != self.ATTRIBUTES:
+            values = [values[_FIELD_INDEX[name]] if name in _FIELD_INDEX else None for name in attributes]
+        return [
+            "" if value is None else f"{value:.6f}" if isinstance(value, float) else value
+            for value in values[: len(attributes)]
+        ]
+
+
+_FIELD_INDEX = {name: i for i, name in enumerate(MlxlinkRecord.FIELDS)}
+
+# mlxlink output key -> (field index, converter)
+_KEYS = {
+    key: (_FIELD_INDEX[field], convert)
+    for key, field, convert in (
+        ("Temperature [C]", "temperature", _number),
+        ("Voltage [mV]", "voltage", _number),
+        ("Bias Current [mA]", "bias_current", _number),
+        ("Rx Power Current [dBm]", "rx_power", _number),
+        ("Tx Power Current [dBm]", "tx_power", _number),
+        ("Time Since Last Clear [Min]", "time_since_last_clear", _scientific),
+        ("Effective Physical Errors", "effective_physical_errors", _scientific),
+        ("Effective Physical BER", "effective_physical_ber", _scientific),
+        ("Raw Physical Errors Per Lane", "raw_physical_errors_per_lane", _scientific),
+        ("Raw Physical BER", "raw_physical_ber", _scientific),
+        ("Physical Grade", "physical_grade", _text),
+        ("Height Eye Opening [mV]", "height_eye", _number),
+        ("Phase  Eye Opening [psec]", "phase_eye", _number),
+        ("State", "state", _text),
+        ("Speed", "speed", _text),
+        ("Vendor Name", "vendor_name", _text),
+        ("Vendor Part Number", "vendor_part_number", _text),
+        ("Vendor Serial Number", "vendor_serial_number", _text),
+    )
+}
+
+
 class SutMlxlinkParser(IParser):
-    """Parser for mlxlink command output from SUT system."""
+    """Parser for mlxlink command output from SUT system.
+
+    Each output is parsed in one pass straight into an MlxlinkRecord; only
+    known keys are converted. With carry_over, fields missing from an output
+    keep their last value (split mlxlink queries each print only part of the
+    fields), otherwise every output starts from empty fields.
+    """
+
+    def __init__(self, carry_over: bool = False):
+        """Initialize parser.
 
-    def __init__(self):
+        Args:
+            carry_over: Keep last value of fields missing from an output
+        """
         IParser.__init__(self, LogName.MAIN.value)
-        self._result: dict[str, str] = {}
+        self._carry_over = carry_over
+        self._values: list[float | str | None] = [None] * len(MlxlinkRecord.FIELDS)
         self._raw_data: str | None = None
 
     @property
     def name(self) -> str:
         return "mlxlink"
 
+    @property
+    def carry_over(self) -> bool:
+        """Whether fields missing from an output keep their last value."""
+        return self._carry_over
+
     def parse(self, raw_data: str) -> None:
         self._log_parse(raw_data)
         self._raw_data = raw_data
 
-        for line in self._raw_data.splitlines():
-            if ":" in line and not line.strip().endswith(":"):
-                key, value = line.split(":", 1)
-                self._result[key.strip()] = value.strip()
-
-        self._logger.debug(f"[{self.name}] Parsed {len(self._result)} key-value pairs")
-
-    def get_result(self) -> MlxlinkDevice:
-        return MlxlinkDevice(self._result)
+        values = self._values if self._carry_over else [None] * len(MlxlinkRecord.FIELDS)
+        found = 0
+        for line in raw_data.splitlines():
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            entry = _KEYS.get(key.strip())
+            value = value.strip()
+            if entry is None or not value:
+                continue
+            values[entry[0]] = entry[1](value)
+            found += 1
+        self._values = values
+
+        self._logger.debug(f"[{self.name}] Parsed {found} known key-value pairs")
+
+    def get_result(self) -> MlxlinkRecord:
+        return MlxlinkRecord(list(self._values))
 
     def log(self) -> None:
-        device = self.get_result()
-        self._logger.info(f"State: {device.state}")
-        self._logger.info(f"Speed: {device.speed}")
-        self._logger.info(f"Vendor: {device.vendor_name}")
-        if device.temperature:
-            self._logger.info(f"Temperature: {device.temperature.value} {device.temperature.unit}")
-        if device.voltage:
-            self._logger.info(f"Voltage: {device.voltage.value} {device.voltage.unit}")
+        record = self.get_result()
+        self._logger.info(f"State: {record.state}")
+        self._logger.info(f"Speed: {record.speed}")
+        self._logger.info(f"Vendor: {record.vendor_name}")
+        if record.temperature is not None:
+            self._logger.info(f"Temperature: {record.temperature} C")
+        if record.voltage is not None:
+            self._logger.info(f"Voltage: {record.voltage} mV")
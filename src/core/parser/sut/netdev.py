@@ -0,0 +1,319 @@
+import time
+
+import numpy as np
+
+from src.core.enum.connect import NetdevSource
+from src.interfaces.component import IParser
+from src.platform.enums.log import LogName
+
+# Kernel netdev statistics (/sys/class/net/<iface>/statistics/), stable ABI
+SYSFS_COUNTERS = (
+    "rx_packets",
+    "tx_packets",
+    "rx_bytes",
+    "tx_bytes",
+    "rx_errors",
+    "tx_errors",
+    "rx_dropped",
+    "tx_dropped",
+    "multicast",
+    "collisions",
+    "rx_length_errors",
+    "rx_over_errors",
+    "rx_crc_errors",
+    "rx_frame_errors",
+    "rx_fifo_errors",
+    "rx_missed_errors",
+    "tx_aborted_errors",
+    "tx_carrier_errors",
+    "tx_fifo_errors",
+    "tx_heartbeat_errors",
+    "tx_window_errors",
+    "rx_compressed",
+    "tx_compressed",
+    "rx_nohandler",
+)
+
+# /proc/net/dev columns in order, named like their sysfs counterparts
+PROC_COUNTERS = (
+    "rx_bytes",
+    "rx_packets",
+    "rx_errors",
+    "rx_dropped",
+    "rx_fifo_errors",
+    "rx_frame_errors",
+    "rx_compressed",
+    "multicast",
+    "tx_bytes",
+    "tx_packets",
+    "tx_errors",
+    "tx_dropped",
+    "tx_fifo_errors",
+    "collisions",
+    "tx_carrier_errors",
+    "tx_compressed",
+)
+
+# Remote wall clock (ns resolution) printed right before the counters are read. Archives of
+# older versions carry /proc/uptime (10 ms resolution) instead, which is still understood.
+_CLOCK = "clock"
+_UPTIME = "/proc/uptime"
+_WRAP32 = 1 << 32
+_HALF32 = 1 << 31
+# A 32-bit wrap may imply at most this multiple of the counter's previous rate, larger jumps are resets
+_WRAP_RATE_FACTOR = 4.0
+
+
+def netdev_command(interfaces: list[str], counters: list[str], source: NetdevSource) -> str:
+    """Build the one remote call reading all counters plus the remote clock.
+
+    Args:
+        interfaces: Monitored interfaces
+        counters: Counter names
+        source: Read sysfs statistics files or /proc/net/dev
+
+    Returns:
+        Shell command (date, then a single grep or cat process)
+    """
+    if NetdevSource(source) == NetdevSource.PROC:
+        return "date +%s.%N; cat /proc/net/dev"
+    files = " ".join(f"/sys/class/net/{iface}/statistics/{counter}" for iface in interfaces for counter in counters)
+    return f"date +{_CLOCK}:%s.%N; grep -sH . {files}"
+
+
+def netdev_columns(interfaces: list[str], counters: list[str]) -> list[str]:
+    """Get worker columns: interval followed by one column per interface and counter.
+
+    Args:
+        interfaces: Monitored interfaces
+        counters: Counter names
+
+    Returns:
+        Column names (interval_ms, eth0.rx_bytes, ...)
+    """
+    return ["interval_ms", *[f"{iface}.{counter}" for iface in interfaces for counter in counters]]
+
+
+def _to_seconds(text: str) -> float | None:
+    """Parse a clock reading (date without %N support prints it literally).
+
+    Args:
+        text: Seconds as decimal string
+
+    Returns:
+        Seconds, or None if unreadable
+    """
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+class NetdevSnapshot:
+    """Per-interval counter deltas (or rates) of all interfaces taken at one remote timestamp."""
+
+    __slots__ = ("_columns", "_interval_sec", "_present", "_values")
+
+    def __init__(self, columns: tuple[str, ...], interval_sec: float, values: np.ndarray, present: np.ndarray):
+        """Initialize snapshot.
+
+        Args:
+            columns: Worker columns (see netdev_columns())
+            interval_sec: Time between the two counter reads
+            values: Delta (uint64) or rate per second (float64) per interface and counter, flattened
+            present: Whether each counter was read in both snapshots
+        """
+        self._columns = columns
+        self._interval_sec = interval_sec
+        self._values = values
+        self._present = present
+
+    @property
+    def interval_sec(self) -> float:
+        """Get time between the two counter reads.
+
+        Returns:
+            Interval in seconds
+        """
+        return self._interval_sec
+
+    @property
+    def values(self) -> np.ndarray:
+        """Get deltas or rates, one per interface and counter in column order.
+
+        Returns:
+            Flattened counter matrix
+        """
+        return self._values
+
+    def row(self, attributes: list[str] | tuple[str, ...]) -> list[str]:
+        """Format interval and counter values as CSV fields.
+
+        Args:
+            attributes: Column names (fast path when equal to the worker columns)
+
+        Returns:
+            One field per attribute (empty for counters that could not be read)
+        """
+        rate = self._values.dtype.kind == "f"
+        fields = [f"{self._interval_sec * 1000:.3f}"]
+        fields.extend(
+            ("" if not ok else f"{value:.3f}" if rate else str(value))
+            for value, ok in zip(self._values.tolist(), self._present.tolist(), strict=True)
+        )
+        if tuple(attributes) == self._columns:
+            return fields
+        index = {name: i for i, name in enumerate(self._columns)}
+        return [fields[index[name]] if name in index else "" for name in attributes]
+
+
+class SutNetdevParser(IParser):
+    """Parser for the netdev snapshot command (sysfs statistics or /proc/net/dev).
+
+    Every output is parsed into a flat uint64 counter vector (interfaces x
+    counters). Deltas to the previous output are computed in one vectorized
+    step. A counter going backwards from the upper half of the 32-bit range
+    has wrapped (32-bit driver counters) only if it never exceeded 2^32 and
+    the wrap implies a rate close to its previous one; any other decrease is
+    a reset (driver reload) and counts from zero. The interval is taken from
+    the remote clock (ns resolution) read in the same call, so all ports
+    share one timestamp.
+    """
+
+    def __init__(
+        self,
+        interfaces: list[str],
+        counters: list[str],
+        source: NetdevSource | str = NetdevSource.SYSFS,
+        rates: bool = False,
+    ):
+        """Initialize parser.
+
+        Args:
+            interfaces: Monitored interfaces
+            counters: Counter names (SYSFS_COUNTERS or PROC_COUNTERS)
+            source: Counter source the command reads
+            rates: Report per second rates instead of per interval deltas
+        """
+        IParser.__init__(self, LogName.MAIN.value)
+        self._interfaces = list(interfaces)
+        self._counters = list(counters)
+        self._source = NetdevSource(source)
+        self._rates = rates
+        self._columns = tuple(netdev_columns(self._interfaces, self._counters))
+        size = len(self._interfaces) * len(self._counters)
+
+        # sysfs: file path -> flat index; proc: interface -> (flat index, /proc/net/dev column) pairs
+        self._paths = {
+            f"/sys/class/net/{iface}/statistics/{counter}": i * len(self._counters) + j
+            for i, iface in enumerate(self._interfaces)
+            for j, counter in enumerate(self._counters)
+        }
+        self._proc = {
+            iface: [
+                (i * len(self._counters) + j, PROC_COUNTERS.index(counter))
+                for j, counter in enumerate(self._counters)
+                if counter in PROC_COUNTERS
+            ]
+            for i, iface in enumerate(self._interfaces)
+        }
+
+        self._empty = [0] * size
+        self._prev: tuple[float, np.ndarray, np.ndarray] | None = None
+        self._rate = np.zeros(size)  # Previous per second rate of each counter
+        self._wide = np.zeros(size, dtype=bool)  # Counters seen above 2^32 (64-bit, never wrap at 2^32)
+        self._result: NetdevSnapshot | None = None
+        self._raw_data: str | None = None
+
+    @property
+    def name(self) -> str:
+        return "netdev"
+
+    @property
+    def args(self) -> dict:
+        """Get constructor arguments (stored with raw archives for re-parsing).
+
+        Returns:
+            Keyword arguments recreating this parser
+        """
+        return {
+            "interfaces": self._interfaces,
+            "counters": self._counters,
+            "source": self._source.value,
+            "rates": self._rates,
+        }
+
+    def parse(self, raw_data: str) -> None:
+        self._log_parse(raw_data)
+        self._raw_data = raw_data
+
+        values = list(self._empty)
+        present = [False] * len(values)
+        clock = None
+        if self._source == NetdevSource.PROC:
+            lines = raw_data.splitlines()
+            if lines and lines[0][:1].isdigit():
+                clock = _to_seconds(lines[0].split()[0])
+            for line in lines[1:]:
+                iface, sep, fields = line.partition(":")
+                slots = self._proc.get(iface.strip()) if sep else None
+                if not slots:
+                    continue
+                numbers = fields.split()
+                for index, column in slots:
+                    values[index] = int(numbers[column])
+                    present[index] = True
+        else:
+            for line in raw_data.splitlines():
+                path, sep, value = line.partition(":")
+                if not sep:
+                    continue
+                index = self._paths.get(path)
+                if index is not None:
+                    values[index] = int(value)
+                    present[index] = True
+                elif path in (_CLOCK, _UPTIME):
+                    clock = _to_seconds(value.split()[0])
+
+        now = clock if clock is not None else time.monotonic()
+        current = (now, np.array(values, dtype=np.uint64), np.array(present, dtype=bool))
+        self._wide |= current[1] >= _WRAP32
+        self._result = self._delta(self._prev, current) if self._prev is not None else None
+        self._prev = current
+
+        self._logger.debug(f"[{self.name}] Parsed {sum(present)} counters")
+
+    def _delta(
+        self, prev: tuple[float, np.ndarray, np.ndarray], current: tuple[float, np.ndarray, np.ndarray]
+    ) -> NetdevSnapshot:
+        """Compute deltas (or rates) between two counter vectors with wraparound handling."""
+        prev_time, before, before_ok = prev
+        now, after, after_ok = current
+
+        interval = now - prev_time
+        delta = after - before  # uint64 arithmetic, correct across 64-bit wraps
+        back = after < before
+        if back.any():
+            wrapped = back & (before >= _HALF32) & (before < _WRAP32) & ~self._wide
+            if wrapped.any():
+                wrap_delta = after + np.uint64(_WRAP32) - before
+                wrapped &= (self._rate > 0) & (wrap_delta <= self._rate * max(interval, 0.0) * _WRAP_RATE_FACTOR)
+                delta[wrapped] = wrap_delta[wrapped]
+            reset = back & ~wrapped
+            delta[reset] = after[reset]
+
+        rate = delta / interval if interval > 0 else np.zeros(len(delta))
+        self._rate = rate
+        return NetdevSnapshot(self._columns, interval, rate if self._rates else delta, before_ok & after_ok)
+
+    def get_result(self) -> NetdevSnapshot | None:
+        """Get deltas to the previous output.
+
+        Returns:
+            Snapshot, or None after the first output (no previous counters yet)
+        """
+        return self._result
+
+    def log(self) -> None:
+        if self._result is not None:
+            self._logger.info(f"Interval: {self._result.interval_sec:.3f}s")
@@ -0,0 +1,71 @@
+"""Flap-triggered black-box recording of worker rows.
+
+In recorder mode a worker does not write every sample. It keeps the rows of
+the last pre-trigger seconds in memory and writes one summary row per summary
+interval. When a trigger event arrives (link flap, tx_errors change), the
+buffered pre-trigger rows not yet written as summaries are written and every
+row is written until the post-trigger window has passed, so the file holds
+full resolution exactly around events and low resolution everywhere else.
+"""
+
+from collections import deque
+from collections.abc import Callable
+
+
+class BlackBoxRecorder:
+    """Pre/post-trigger window writer for one worker's rows."""
+
+    __slots__ = ("_last_summary", "_post_sec", "_pre_sec", "_rows", "_summary_sec", "_until", "_write")
+
+    def __init__(self, pre_sec: float, post_sec: float, summary_sec: float, write: Callable[[list[str]], None]):
+        """Initialize recorder.
+
+        Args:
+            pre_sec: Seconds of full-resolution rows kept before a trigger
+            post_sec: Seconds of full-resolution rows written after a trigger
+            summary_sec: Interval of summary rows outside trigger windows (latest row is written)
+            write: Writes one row to the worker output
+        """
+        self._pre_sec = pre_sec
+        self._post_sec = post_sec
+        self._summary_sec = summary_sec
+        self._write = write
+        self._rows: deque[list] = deque()  # [ts, row, written] entries of the pre-trigger window
+        self._until = float("-inf")  # End of the current post-trigger window
+        self._last_summary = float("-inf")
+
+    def record(self, ts: float, row: list[str]) -> None:
+        """Add one row.
+
+        Args:
+            ts: Sample begin time as epoch seconds
+            row: Row fields
+        """
+        rows = self._rows
+        entry = [ts, row, False]
+        rows.append(entry)
+        while rows[0][0] < ts - self._pre_sec:
+            rows.popleft()
+
+        if ts <= self._until or ts - self._last_summary >= self._summary_sec:
+            self._emit(entry)
+            if ts > self._until:
+                self._last_summary = ts
+
+    def trigger(self, ts: float) -> None:
+        """Write buffered rows from the pre-trigger window and open the post-trigger window.
+
+        Args:
+            ts: Trigger event time as epoch seconds
+        """
+        start = ts - self._pre_sec
+        for entry in self._rows:
+            if entry[0] >= start:
+                self._emit(entry)
+        self._until = max(self._until, ts + self._post_sec)
+
+    def _emit(self, entry: list) -> None:
+        """Write row once (rows already written as summary or window rows are skipped)."""
+        if not entry[2]:
+            self._write(entry[1])
+            entry[2] = True
@@ -0,0 +1,185 @@
+"""Offline re-parse of raw archives into columns.
+
+Archives written in raw archive mode (src/core/log/raw_archive.py) are
+indexed once, split into chunks of records and parsed in parallel processes
+with the same src/core/parser classes the live workers use. Each chunk is
+turned into columns (numeric columns converted in one vectorized step) and
+the chunks are concatenated in record order.
+
+Chunks are parsed independently, so parser state is rebuilt per chunk:
+- every chunk first parses the output preceding it without emitting rows,
+  so delta parsers (netdev counters) have their previous values and flap
+  parsers do not report flaps of the previous chunk again;
+- carry-over parsers (split mlxlink queries) parse every output on its own
+  and missing fields are forward filled over the whole archive afterwards;
+- stream archives (LinkEventWorker, one record per kernel line) feed every
+  line to the flap parser; a down event may be any number of records before
+  its up event, so they are parsed as one chunk.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime as dt
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.core import parser as parsers
+from src.core.helpers import get_attr_values, get_flap_values
+from src.core.log.raw_archive import RawArchive
+
+CHUNK_RECORDS = 2048
+TIMESTAMP_COLUMN = "begin_timestamp"
+
+
+def _new_parser(meta: dict, since: float) -> Any:
+    """Create the parser described by an archive header.
+
+    Args:
+        meta: Archive header
+        since: First record time; flap parsers ignore older events like the live worker
+
+    Returns:
+        Parser instance
+    """
+    parser_cls = getattr(parsers, meta["parser"])
+    if meta.get("is_flap_logger"):
+        return parser_cls(dt.fromtimestamp(since, UTC))
+    return parser_cls(**meta.get("parser_args", {}))
+
+
+def _to_numeric(frame: pd.DataFrame) -> None:
+    """Convert columns holding only numbers (empty fields become NaN), in place.
+
+    Args:
+        frame: Parsed columns as strings
+    """
+    for column in frame.columns:
+        try:
+            frame[column] = pd.to_numeric(frame[column].replace("", np.nan))
+        except (ValueError, TypeError):
+            pass  # Text column (state, physical_grade, ...)
+
+
+def _parse_stream(parser: Any, output: str) -> list:
+    """Feed each line of an archived output to a streaming flap parser.
+
+    Args:
+        parser: Parser providing feed()
+        output: One streamed line (or a polled dmesg output after a stream fallback)
+
+    Returns:
+        Flaps completed by these lines
+    """
+    flaps = (parser.feed(line) for line in output.splitlines())
+    return [flap for flap in flaps if flap is not None]
+
+
+def _parse_chunk(
+    path: str,
+    meta: dict,
+    begins: np.ndarray,
+    offsets: np.ndarray,
+    lengths: np.ndarray,
+    prime: tuple[int, int] | None,
+    since: float,
+) -> pd.DataFrame:
+    """Parse one chunk of records (runs in a worker process).
+
+    Args:
+        path: Archive file
+        meta: Archive header
+        begins: Record begin times
+        offsets: Record payload offsets
+        lengths: Record payload lengths
+        prime: Payload (offset, length) of the preceding record, parsed first without output, or None
+        since: First record time of the archive
+
+    Returns:
+        One row per record with a result (per flap for flap parsers)
+    """
+    attributes = meta["attributes"]
+    flap = meta.get("is_flap_logger", False)
+    stream = meta.get("stream", False)
+    parser = _new_parser(meta, since)
+    times: list[float] = []
+    rows: list[list[str]] = []
+
+    with RawArchive(Path(path)) as archive:
+        if prime is not None and stream:
+            _parse_stream(parser, archive.output(*prime))
+        elif prime is not None:
+            parser.parse(archive.output(*prime))
+            parser.get_result()
+        for begin, offset, length in zip(begins.tolist(), offsets.tolist(), lengths.tolist(), strict=True):
+            if stream:
+                for item in _parse_stream(parser, archive.output(offset, length)):
+                    times.append(begin)
+                    rows.append(get_flap_values(item))
+                continue
+            parser.parse(archive.output(offset, length))
+            result = parser.get_result()
+            if result is None:
+                continue  # No change (tx_errors) or no previous counters yet (netdev)
+            if flap:
+                for item in result.flaps:
+                    times.append(begin)
+                    rows.append(get_flap_values(item))
+            else:
+                times.append(begin)
+                rows.append(get_attr_values(result, attributes))
+
+    frame = pd.DataFrame(rows, columns=attributes, dtype=object)
+    _to_numeric(frame)
+    frame.insert(0, TIMESTAMP_COLUMN, pd.to_datetime(np.array(times, dtype=np.float64), unit="s", utc=True))
+    return frame
+
+
+def reparse(path: Path, processes: int | None = None, chunk_records: int = CHUNK_RECORDS) -> pd.DataFrame:
+    """Re-parse a raw archive with the current parsers.
+
+    Args:
+        path: Raw archive file
+        processes: Parallel processes (default: all cores, 1 parses in this process)
+        chunk_records: Records per chunk
+
+    Returns:
+        begin_timestamp column followed by one column per attribute
+
+    Raises:
+        ValueError: If the archive has no parser or attribute columns (raw value workers)
+    """
+    with RawArchive(path) as archive:
+        meta = archive.meta
+        begins, offsets, lengths = archive.index()
+
+    if not meta.get("parser") or not meta.get("attributes"):
+        raise ValueError("archive has no parser with attribute columns")
+    if not hasattr(parsers, meta["parser"]):
+        raise ValueError(f"unknown parser {meta['parser']}")
+
+    since = float(begins[0]) if len(begins) else 0.0
+    if meta.get("stream"):
+        chunk_records = len(begins)  # Pending down events span chunks
+    tasks = []
+    for start in range(0, len(begins), max(1, chunk_records)):
+        stop = start + max(1, chunk_records)
+        prime = (int(offsets[start - 1]), int(lengths[start - 1])) if start else None
+        tasks.append((str(path), meta, begins[start:stop], offsets[start:stop], lengths[start:stop], prime, since))
+
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    if processes <= 1:
+        frames = [_parse_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            frames = list(pool.map(_parse_chunk, *zip(*tasks, strict=True)))
+
+    if not frames:
+        return pd.DataFrame(columns=[TIMESTAMP_COLUMN, *meta["attributes"]])
+    frame = pd.concat(frames, ignore_index=True)
+    if meta.get("carry_over"):
+        columns = meta["attributes"]
+        frame[columns] = frame[columns].ffill()
+    return frame
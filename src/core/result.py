@@ -14,6 +14,7 @@ class CmdResult:
         send_ms: float = 0.0,
         read_ms: float = 0.0,
         parsed_ms: float = 0.0,
+        timestamp: float | None = None,
     ):
         """Initialize command result.
 
@@ -26,6 +27,7 @@ class CmdResult:
             send_ms: Time to send command in milliseconds
             read_ms: Time to read response in milliseconds
             parsed_ms: Parsed execution time from time command in milliseconds
+            timestamp: Remote begin time as epoch seconds (set by remote sampler)
         """
         self._cmd = cmd
         self._stdout = stdout
@@ -35,6 +37,7 @@ class CmdResult:
         self._send_ms = send_ms
         self._read_ms = read_ms
         self._parsed_ms = parsed_ms
+        self._timestamp = timestamp
 
     @property
     def cmd(self) -> str:
@@ -108,6 +111,15 @@ class CmdResult:
         """
         return self._parsed_ms
 
+    @property
+    def timestamp(self) -> float | None:
+        """Return remote begin time.
+
+        Returns:
+            Epoch seconds, or None when executed on demand
+        """
+        return self._timestamp
+
     @property
     def success(self) -> bool:
         """Indicates whether the executed command was successful or not.
@@ -1,14 +1,19 @@
-from datetime import datetime as dt
+from datetime import UTC, datetime as dt
+import logging
+import time
+from typing import Any
 
 from src.core.connect import SshConnection
 from src.core.enum.messages import LogMsg
-from src.core.tool import Tool
+from src.core.result import CmdResult
+from src.core.tool import Tool, exec_command
 from src.interfaces.component import ITime
 from src.models.config import Config
+from src.platform.enums.log import LogName
 
 
 class Sample(Tool, ITime):
-    """Data sample collector.
+    """Data sample collector for interactive use (workers use SampleRecord).
 
     Args:
         cfg: Application configuration
@@ -60,6 +65,10 @@ class Sample(Tool, ITime):
         result = self._exec(worker_command.command, use_time_cmd=time_cmd, use_shell=use_shell, logger=logger)
         self._cmd_result = result
 
+        # Remote sampler records carry the begin time taken next to the hardware
+        if result.timestamp is not None:
+            self._begin = dt.fromtimestamp(result.timestamp, UTC)
+
         if result.success:
             self._snapshot = result.stdout
         else:
@@ -80,6 +89,144 @@ class Sample(Tool, ITime):
         return self._cmd_result
 
 
+class SampleRecord:
+    """Compact sample produced by the worker collection loop.
+
+    Holds only what the loop needs per tick (epoch timestamps, return code,
+    timing and the snapshot) so collecting a sample allocates one small
+    slotted object instead of a Sample with its tool, timer and result state.
+    """
+
+    __slots__ = ("begin", "end", "parsed_ms", "rcode", "read_ms", "remote", "send_ms", "snapshot", "stderr")
+
+    def __init__(self, begin: float) -> None:
+        """Initialize empty record.
+
+        Args:
+            begin: Begin time as epoch seconds
+        """
+        self.begin = begin
+        self.end = begin
+        self.rcode = 0
+        self.send_ms = 0.0
+        self.read_ms = 0.0
+        self.parsed_ms = 0.0
+        self.remote = False  # Begin time was taken by the remote sampler
+        self.stderr = ""
+        self.snapshot: Any = ""
+
+    @classmethod
+    def collect(
+        cls,
+        ssh: SshConnection,
+        worker_cfg: Any,
+        use_time_cmd: bool = False,
+        logger: logging.Logger | None = None,
+        command: str | None = None,
+    ) -> "SampleRecord":
+        """Collect sample by executing worker command.
+
+        Args:
+            ssh: Connection to execute on
+            worker_cfg: Worker configuration (command, use_shell)
+            use_time_cmd: Wrap command with 'time' for execution timing
+            logger: Logger for command execution
+            command: Command to run instead of worker_cfg.command (sub-command)
+
+        Returns:
+            Collected record
+        """
+        begin = time.time()
+        result = exec_command(
+            ssh,
+            command or worker_cfg.command,
+            use_time_cmd=use_time_cmd,
+            use_shell=getattr(worker_cfg, "use_shell", False),
+            logger=logger,
+            exec_logger=logger,
+        )
+        return cls.from_result(begin, result)
+
+    @classmethod
+    def from_result(cls, begin: float, result: CmdResult) -> "SampleRecord":
+        """Build record from an executed command result.
+
+        Args:
+            begin: Local begin time as epoch seconds
+            result: Command result (single, batched or remote sampled)
+
+        Returns:
+            Sample record
+        """
+        record = cls(begin)
+
+        # Remote sampler records carry the begin time taken next to the hardware
+        if result.timestamp is not None:
+            record.begin = result.timestamp
+            record.remote = True
+
+        record.rcode = result.rcode
+        record.send_ms = result.send_ms
+        record.read_ms = result.read_ms
+        record.parsed_ms = result.parsed_ms
+        record.stderr = result.stderr
+        if result.success:
+            record.snapshot = result.stdout
+        else:
+            logging.getLogger(LogName.MAIN.value).error(
+                f"{LogMsg.SAMPLE_CMD_FAIL.value}: {result.stderr or 'No output'}"
+            )
+            record.snapshot = ""
+
+        record.end = time.time()
+        return record
+
+    @classmethod
+    def from_results(cls, begin: float, results: list[CmdResult]) -> "SampleRecord":
+        """Build one record from the results of several sub-commands run in one batch.
+
+        Outputs of successful sub-commands are joined line-wise so a key/value
+        parser sees them as one report; elapsed times add up.
+
+        Args:
+            begin: Local begin time as epoch seconds
+            results: Sub-command results in order
+
+        Returns:
+            Sample record
+        """
+        if len(results) == 1:
+            return cls.from_result(begin, results[0])
+
+        record = cls(begin)
+        outputs = []
+        for result in results:
+            record.parsed_ms += result.parsed_ms
+            if result.success:
+                outputs.append(result.stdout)
+            else:
+                record.rcode = record.rcode or result.rcode
+                record.stderr += result.stderr
+                logging.getLogger(LogName.MAIN.value).error(
+                    f"{LogMsg.SAMPLE_CMD_FAIL.value}: {result.cmd}: {result.stderr or 'No output'}"
+                )
+        if results:
+            record.send_ms = results[0].send_ms
+            record.read_ms = results[0].read_ms
+        record.snapshot = "\n".join(outputs)
+        record.end = time.time()
+        return record
+
+    @property
+    def begin_str(self) -> str:
+        """Get begin time formatted for log rows.
+
+        Returns:
+            UTC time with millisecond precision
+        """
+        return dt.fromtimestamp(self.begin, UTC).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
 class PlotSampleData:
     """Plot data extracted from sample.
 
@@ -156,18 +156,20 @@ class SlxScanner(BaseScanner):
         else:
             logger.info(LogMsg.FBR_CLI_ENTERING.value)
         logger.debug(f"{LogMsg.CMD_EXEC.value}: 'fbr-CLI'")
+        start = time.perf_counter()
+        # exec_shell_cmd returns on the prompt; the empty command confirms fbr-CLI is ready
         self._ssh.exec_shell_cmd("fbr-CLI")
-        time.sleep(0.5)
         welcome_msg = self._ssh.exec_shell_cmd("")
         logger.debug(f"{LogMsg.CMD_EXEC_RESULT.value}:\n\n{welcome_msg}\n")
-        logger.info(LogMsg.FBR_CLI_ENTERED.value)
+        logger.info(f"{LogMsg.FBR_CLI_ENTERED.value} (ready in {(time.perf_counter() - start) * 1000:.0f} ms)")
 
     def _exit_fbr_cli(self) -> None:
         """Exit fbr-CLI."""
         logger = self._get_logger()
         logger.info(LogMsg.FBR_CLI_EXIT_CTRL_C.value)
         self._exec_with_logging("\x03", "Ctrl+C")
-        time.sleep(0.3)
+        # Drain trailing output until the shell is quiet instead of a fixed sleep
+        self._ssh.clear_shell()
         logger.info(LogMsg.FBR_CLI_EXITED.value)
 
     def _get_interface_name(self, port_id: str) -> str | None:
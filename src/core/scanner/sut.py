@@ -5,18 +5,32 @@ import logging
 import threading
 import time
 
-from src.core.connect import LocalConnection, create_ssh_connection
-from src.core.enum.connect import ConnectType, HostType, ShowPartType
+from src.core.bundle import BundleWorker
+from src.core.connect import (
+    LocalConnection,
+    RemoteSampler,
+    SshConnection,
+    SshTransportPool,
+    broker_available,
+    create_ssh_connection,
+)
+from src.core.deadband import DeadbandFilter
+from src.core.enum.connect import ConnectType, HostType, NetdevSource, ShowPartType
 from src.core.enum.messages import LogMsg
+from src.core.link_events import LinkEventWorker
 from src.core.parser import (
+    MlxlinkRecord,
     SutDmesgFlapParser,
     SutEthtoolModuleParser,
     SutIpmitoolFanNameParser,
     SutIpmitoolFanParser,
     SutMlxlinkAmberParser,
     SutMlxlinkParser,
+    SutNetdevParser,
     SutTxErrorsParser,
 )
+from src.core.parser.sut.netdev import PROC_COUNTERS, SYSFS_COUNTERS, netdev_columns, netdev_command
+from src.core.schedule import AdaptiveInterval
 from src.core.worker import WorkerConfig
 from src.models.scanner import BaseScanner
 from src.platform.software_manager import SoftwareManager
@@ -44,8 +58,17 @@ class SutScanner(BaseScanner):
         self._sut_link_flap_logger = loggers["sut_link_flap"]
         self._sut_tx_errors_logger = loggers["sut_tx_errors"]
         self._sut_ipmitool_fan_logger = loggers["sut_ipmitool_fan"]
+        self._sut_netdev_logger = loggers["sut_netdev"]
         self._system_info_logger = loggers["sut_system_info"]
         self._software_manager: SoftwareManager | None = None
+        # A running local broker already shares transports across processes
+        self._transport_pool = SshTransportPool() if cfg.sut_shared_transport and not broker_available() else None
+        self._remote_sampler: RemoteSampler | None = None
+        self._sampler_connection = None
+        self._stream_workers = 0
+        self._pipeline_workers = 0
+        self._deferred_worker_cfgs: list[WorkerConfig] | None = None
+        self._bundle_worker_cfgs: list[WorkerConfig] | None = None
 
     def _exec_with_logging(self, cmd: str, logger: logging.Logger) -> tuple[str, int]:
         """Execute command with logging.
@@ -71,11 +94,15 @@ class SutScanner(BaseScanner):
         try:
             if self._cfg.sut_connect_type == ConnectType.LOCAL:
                 self._logger.info(LogMsg.CMD_LOCAL_EXEC_USED.value)
-                self._ssh = LocalConnection(host=self._cfg.sut_host, sudo_pass=self._cfg.sut_sudo_pass)
+                self._ssh = LocalConnection(
+                    host=self._cfg.sut_host,
+                    sudo_pass=self._cfg.sut_sudo_pass,
+                    privileged_session=self._cfg.sut_privileged_session,
+                )
             else:
                 self._logger.info(f"{LogMsg.SCANNER_SUT_CONN_HOST.value}: {self._cfg.sut_host}")
                 self._logger.debug(f"{LogMsg.SCANNER_SUT_JUMP_HOST.value}: {self._cfg.jump_host}")
-                self._ssh = create_ssh_connection(self._cfg, HostType.SUT)
+                self._ssh = self._new_remote_connection()
 
             if not self._ssh.connect():
                 self._logger.error(LogMsg.SSH_CONN_FAILED.value)
@@ -267,6 +294,29 @@ class SutScanner(BaseScanner):
         if not self._start_workers():
             self._logger.warning(LogMsg.MAIN_SCAN_FAILED_START.value)
 
+    def disconnect(self) -> None:
+        """Disconnect, stop remote sampler and close pooled transports."""
+        if self._remote_sampler:
+            self._remote_sampler.stop()
+            self._remote_sampler = None
+        if self._sampler_connection:
+            self._sampler_connection.disconnect()
+            self._sampler_connection = None
+        super().disconnect()
+        if self._transport_pool:
+            self._logger.debug(self._transport_pool.summary())
+            self._transport_pool.close_all()
+
+    def _new_remote_connection(self):
+        """Create remote SUT connection, leased from the shared pool when enabled.
+
+        Returns:
+            PooledSshConnection, SshConnection or BrokerConnection
+        """
+        if self._transport_pool:
+            return self._transport_pool.lease_for(self._cfg, HostType.SUT)
+        return create_ssh_connection(self._cfg, HostType.SUT)
+
     def _create_ssh_factory(self):
         """Create SSH connection factory for workers.
 
@@ -276,11 +326,209 @@ class SutScanner(BaseScanner):
 
         def factory():
             if self._cfg.sut_connect_type == ConnectType.LOCAL:
-                return LocalConnection(host=self._cfg.sut_host, sudo_pass=self._cfg.sut_sudo_pass)
-            return create_ssh_connection(self._cfg, HostType.SUT)
+                return LocalConnection(
+                    host=self._cfg.sut_host,
+                    sudo_pass=self._cfg.sut_sudo_pass,
+                    privileged_session=self._cfg.sut_privileged_session,
+                )
+            return self._new_remote_connection()
+
+        return factory
+
+    def _create_stream_factory(self):
+        """Create connection factory for a worker holding a long-lived stream.
+
+        Pooled streams get transports of their own, MAX_STREAMS per transport,
+        so they never take the session limit of the transport running the
+        sampling commands.
+
+        Returns:
+            Callable that creates new SSH connection
+        """
+        if not self._transport_pool or self._cfg.sut_connect_type == ConnectType.LOCAL:
+            return self._create_ssh_factory()
+
+        group = f"streams-{self._stream_workers // SshConnection.MAX_STREAMS}"
+        self._stream_workers += 1
+
+        def factory():
+            return self._transport_pool.lease_for(self._cfg, HostType.SUT, group, privileged=False)
 
         return factory
 
+    def _create_pipeline_factory(self, depth: int):
+        """Create connection factory for a worker with depth overlapping executions.
+
+        The connection runs depth commands at once (depth exec channels or
+        root shells); pooled workers get a transport of their own instead of
+        competing with every other worker for the channels of the shared one.
+
+        Args:
+            depth: Pipeline depth of the worker
+
+        Returns:
+            Callable that creates new SSH connection
+        """
+        if self._cfg.sut_connect_type == ConnectType.LOCAL:
+
+            def local_factory():
+                return LocalConnection(
+                    host=self._cfg.sut_host,
+                    sudo_pass=self._cfg.sut_sudo_pass,
+                    privileged_session=self._cfg.sut_privileged_session,
+                    max_sessions=depth,
+                )
+
+            return local_factory
+
+        if not self._transport_pool:
+
+            def factory():
+                return create_ssh_connection(self._cfg, HostType.SUT, max_channels=depth)
+
+            return factory
+
+        group = f"pipeline-{self._pipeline_workers}"
+        self._pipeline_workers += 1
+
+        def pooled_factory():
+            return self._transport_pool.lease_for(self._cfg, HostType.SUT, group, max_channels=depth)
+
+        return pooled_factory
+
+    def _new_deadband(self) -> DeadbandFilter | None:
+        """Create change-only filter for a telemetry worker.
+
+        Returns:
+            Deadband filter from sut_deadband settings, or None when disabled
+        """
+        if not self._cfg.sut_deadband:
+            return None
+        return DeadbandFilter(
+            self._cfg.sut_deadband_abs,
+            self._cfg.sut_deadband_rel,
+            self._cfg.sut_deadband_max_silence_sec,
+            self._cfg.sut_deadband_attributes,
+        )
+
+    def _new_adaptive(self, base_ms: int, tighten: bool = True) -> AdaptiveInterval | None:
+        """Create adaptive interval policy for a worker.
+
+        Args:
+            base_ms: Configured worker interval in milliseconds (starting point)
+            tighten: Allow intervals below base_ms (expensive low-res commands only relax)
+
+        Returns:
+            Adaptive interval from sut_adaptive settings, or None when disabled
+        """
+        if not self._cfg.sut_adaptive:
+            return None
+        min_ms = self._cfg.sut_adaptive_min_ms if tighten else max(self._cfg.sut_adaptive_min_ms, base_ms)
+        return AdaptiveInterval(
+            base_ms,
+            min_ms,
+            max(self._cfg.sut_adaptive_max_ms, min_ms),
+            volatility_rel=self._cfg.sut_adaptive_volatility_rel,
+            hold_sec=self._cfg.sut_adaptive_hold_sec,
+        )
+
+    def _add_worker_to_manager(
+        self, worker_cfg: WorkerConfig, ssh_factory=None, dedicated_thread: bool = False
+    ) -> None:
+        """Add worker to manager, deferring it while remote sampler commands are gathered.
+
+        Args:
+            worker_cfg: Worker configuration
+            ssh_factory: Optional connection factory
+            dedicated_thread: Run worker on own thread even when the worker engine is enabled
+        """
+        # Sub-command, pipelined and adaptive workers schedule their own executions,
+        # the sampler runs one fixed command
+        own_schedule = (
+            bool(worker_cfg.sub_commands) or worker_cfg.pipeline_depth > 1 or worker_cfg.adaptive is not None
+        )
+        if self._deferred_worker_cfgs is not None and ssh_factory is None and not own_schedule:
+            self._deferred_worker_cfgs.append(worker_cfg)
+            return
+        # Pipelined workers need their own channels, one serial batch per tick would undo the overlap;
+        # a bundle ticks on fixed member intervals, so adaptive workers run on their own as well
+        if (
+            self._bundle_worker_cfgs is not None
+            and ssh_factory is None
+            and worker_cfg.pipeline_depth <= 1
+            and worker_cfg.adaptive is None
+        ):
+            self._bundle_worker_cfgs.append(worker_cfg)
+            return
+        super()._add_worker_to_manager(worker_cfg, ssh_factory, dedicated_thread)
+
+    def _start_bundle_worker(self, interface: str) -> None:
+        """Add one bundle worker running the gathered commands of an interface.
+
+        Args:
+            interface: Network interface the commands belong to
+        """
+        worker_cfgs, self._bundle_worker_cfgs = self._bundle_worker_cfgs or [], None
+        if len(worker_cfgs) == 1:
+            super()._add_worker_to_manager(worker_cfgs[0])
+            return
+        if not worker_cfgs:
+            return
+
+        self._logger.debug(f"Bundling {len(worker_cfgs)} commands for '{interface}'")
+        self._worker_manager.add(
+            BundleWorker(
+                interface,
+                worker_cfgs,
+                self._cfg,
+                self._create_ssh_factory(),
+                shared_flap_state=self._worker_manager.get_shared_flap_state(),
+                statistics=self._worker_manager.get_statistics(),
+            )
+        )
+
+    def _create_sampled_factory(self, cmd_id: int):
+        """Create factory for workers fed by the remote sampler.
+
+        Args:
+            cmd_id: Sampler command id
+
+        Returns:
+            Callable that creates SampledConnection
+        """
+        fallback_factory = self._create_ssh_factory()
+
+        def factory():
+            return self._remote_sampler.lease(cmd_id, fallback_factory())
+
+        return factory
+
+    def _start_sampled_workers(self) -> None:
+        """Start remote sampler for deferred worker commands and add their workers.
+
+        Falls back to per-sample execution when the agent cannot be started.
+        """
+        worker_cfgs, self._deferred_worker_cfgs = self._deferred_worker_cfgs or [], None
+        if not worker_cfgs:
+            return
+
+        connection = self._create_ssh_factory()()
+        if connection.connect():
+            sampler = RemoteSampler(connection, sudo_pass=self._cfg.sut_sudo_pass)
+            cmd_ids = [sampler.register(c.command, c.scan_interval_ms) for c in worker_cfgs]
+            if sampler.start():
+                self._remote_sampler = sampler
+                self._sampler_connection = connection
+                # Sampled workers block until their record arrives, keep them off the engine pool
+                for worker_cfg, cmd_id in zip(worker_cfgs, cmd_ids, strict=True):
+                    self._add_worker_to_manager(worker_cfg, self._create_sampled_factory(cmd_id), dedicated_thread=True)
+                return
+            connection.disconnect()
+
+        self._logger.warning("Remote sampler unavailable, falling back to per-sample execution")
+        for worker_cfg in worker_cfgs:
+            self._add_worker_to_manager(worker_cfg)
+
     def _start_workers(self) -> bool:
         """Start worker threads.
 
@@ -300,6 +548,10 @@ class SutScanner(BaseScanner):
             skip_tx_errors = ShowPartType.NO_TX_ERRORS in self._cfg.sut_show_parts
             skip_fan = ShowPartType.NO_FAN in self._cfg.sut_show_parts
 
+            # Gather worker commands first so they can be shipped to the remote sampler together
+            if self._cfg.sut_remote_sampler:
+                self._deferred_worker_cfgs = []
+
             # Create fan worker once (not per interface)
             if not skip_fan:
                 self._create_ipmitool_fan_worker()
@@ -307,8 +559,18 @@ class SutScanner(BaseScanner):
             else:
                 worker_count = 0
 
+            # One netdev snapshot of all interfaces (not per interface)
+            if self._cfg.sut_netdev:
+                self._create_netdev_worker()
+                worker_count += 1
+
+            # Remote sampler already ships all commands together, bundling is for per-sample execution
+            bundle = self._cfg.sut_bundle_commands and self._deferred_worker_cfgs is None
+
             for interface in self._cfg.sut_scan_interfaces:
                 self._logger.debug(f"{LogMsg.SCANNER_SUT_SETUP_INTERFACE.value}: '{interface}'")
+                if bundle:
+                    self._bundle_worker_cfgs = []
                 pci_id = helper.get_pci_id(self._ssh, interface)
                 self._logger.debug(f"{LogMsg.SCANNER_SUT_PCI_ID.value} '{interface}': '{pci_id}'")
 
@@ -331,6 +593,12 @@ class SutScanner(BaseScanner):
                     self._create_tx_errors_worker(interface)
                     worker_count += 1
 
+                if bundle:
+                    self._start_bundle_worker(interface)
+
+            if self._deferred_worker_cfgs is not None:
+                self._start_sampled_workers()
+
             self._logger.info(f"{LogMsg.SCANNER_WORKERS_CREATED.value}: {worker_count} (SUT monitoring)")
         except Exception:
             self._logger.exception(LogMsg.WORKER_FAILED.value)
@@ -344,31 +612,31 @@ class SutScanner(BaseScanner):
         Args:
             pci_id: PCI device ID
         """
-        attributes = [
-            "temperature",
-            "voltage",
-            "bias_current",
-            "rx_power",
-            "tx_power",
-            "time_since_last_clear",
-            "effective_physical_errors",
-            "effective_physical_ber",
-            "raw_physical_errors_per_lane",
-            "raw_physical_ber",
-            "physical_grade",
-            "height_eye",
-            "phase_eye",
-        ]
-
         worker_cfg = WorkerConfig()
         worker_cfg.command = f"mlxlink -d {pci_id} -e -m -c"
-        worker_cfg.parser = SutMlxlinkParser()
-        worker_cfg.attributes = attributes
+        worker_cfg.parser = SutMlxlinkParser(carry_over=self._cfg.sut_mlxlink_split)
+        worker_cfg.attributes = list(MlxlinkRecord.ATTRIBUTES)
         worker_cfg.logger = self._sut_mxlink_logger
         worker_cfg.scan_interval_ms = self._cfg.sut_scan_interval_high_res_ms
         worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
-
-        self._add_worker_to_manager(worker_cfg)
+        worker_cfg.deadband = self._new_deadband()
+        worker_cfg.adaptive = self._new_adaptive(worker_cfg.scan_interval_ms)
+        # mlxlink is far slower than the high-res interval, overlap executions to sample it more often
+        worker_cfg.pipeline_depth = self._cfg.sut_pipeline_depth
+
+        if self._cfg.sut_mlxlink_split:
+            # Error counters move fast, module telemetry and eye opening change slowly.
+            # The parser carries the fields of the other queries over, so every row has the full attribute set.
+            worker_cfg.sub_commands = [
+                (f"mlxlink -d {pci_id} -c", self._cfg.sut_scan_interval_high_res_ms),
+                (f"mlxlink -d {pci_id} -m", self._cfg.sut_scan_interval_low_res_ms),
+                (f"mlxlink -d {pci_id} -e", self._cfg.sut_scan_interval_low_res_ms),
+            ]
+
+        if worker_cfg.pipeline_depth > 1:
+            self._add_worker_to_manager(worker_cfg, self._create_pipeline_factory(worker_cfg.pipeline_depth))
+        else:
+            self._add_worker_to_manager(worker_cfg)
 
     def _create_mlxlink_amber_worker(self, pci_id: str) -> None:
         """Create mlxlink amber worker.
@@ -399,6 +667,8 @@ class SutScanner(BaseScanner):
         worker_cfg.logger = self._sut_mtemp_logger
         worker_cfg.scan_interval_ms = self._cfg.sut_scan_interval_low_res_ms
         worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
+        worker_cfg.deadband = self._new_deadband()
+        worker_cfg.adaptive = self._new_adaptive(worker_cfg.scan_interval_ms, tighten=False)
 
         self._add_worker_to_manager(worker_cfg)
 
@@ -423,6 +693,8 @@ class SutScanner(BaseScanner):
         worker_cfg.logger = self._sut_ethtool_logger
         worker_cfg.scan_interval_ms = self._cfg.sut_scan_interval_high_res_ms
         worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
+        worker_cfg.deadband = self._new_deadband()
+        worker_cfg.adaptive = self._new_adaptive(worker_cfg.scan_interval_ms)
 
         self._add_worker_to_manager(worker_cfg)
 
@@ -448,6 +720,23 @@ class SutScanner(BaseScanner):
         worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
         worker_cfg.is_flap_logger = True
 
+        if self._cfg.sut_link_event_stream:
+            # One long-lived kernel log stream instead of a ring buffer dump per tick (polls as fallback);
+            # the blocking stream read needs its own thread
+            self._logger.debug(f"{LogMsg.SCANNER_SUT_WORKER_CMD.value}: '{worker_cfg.command}' (streamed)")
+            self._worker_manager.add(
+                LinkEventWorker(
+                    worker_cfg,
+                    f'dmesg --follow --time-format iso | grep --line-buffered -i "{interface}.*link"',
+                    self._cfg,
+                    self._create_stream_factory(),
+                    shared_flap_state=self._worker_manager.get_shared_flap_state(),
+                    statistics=self._worker_manager.get_statistics(),
+                ),
+                dedicated_thread=True,
+            )
+            return
+
         self._add_worker_to_manager(worker_cfg)
 
     def _create_tx_errors_worker(self, interface: str) -> None:
@@ -465,6 +754,26 @@ class SutScanner(BaseScanner):
         worker_cfg.logger = self._sut_tx_errors_logger
         worker_cfg.scan_interval_ms = self._cfg.sut_scan_interval_tx_errors_ms
         worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
+        worker_cfg.is_trigger = True  # A tx_errors change opens a recording window like a flap
+        worker_cfg.adaptive = self._new_adaptive(worker_cfg.scan_interval_ms)
+
+        self._add_worker_to_manager(worker_cfg)
+
+    def _create_netdev_worker(self) -> None:
+        """Create netdev snapshot worker reading the counters of all interfaces in one call."""
+        interfaces = list(self._cfg.sut_scan_interfaces)
+        source = self._cfg.sut_netdev_source
+        counters = self._cfg.sut_netdev_counters or list(
+            PROC_COUNTERS if source == NetdevSource.PROC else SYSFS_COUNTERS
+        )
+
+        worker_cfg = WorkerConfig()
+        worker_cfg.command = netdev_command(interfaces, counters, source)
+        worker_cfg.parser = SutNetdevParser(interfaces, counters, source, rates=self._cfg.sut_netdev_rates)
+        worker_cfg.attributes = netdev_columns(interfaces, counters)
+        worker_cfg.logger = self._sut_netdev_logger
+        worker_cfg.scan_interval_ms = self._cfg.sut_netdev_interval_ms
+        worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
 
         self._add_worker_to_manager(worker_cfg)
 
@@ -478,5 +787,7 @@ class SutScanner(BaseScanner):
         worker_cfg.logger = self._sut_ipmitool_fan_logger
         worker_cfg.scan_interval_ms = self._cfg.sut_scan_interval_low_res_ms
         worker_cfg.max_log_size_kb = self._cfg.sut_scan_max_log_size_kb
+        worker_cfg.deadband = self._new_deadband()
+        worker_cfg.adaptive = self._new_adaptive(worker_cfg.scan_interval_ms, tighten=False)
 
         self._add_worker_to_manager(worker_cfg)
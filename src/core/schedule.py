@@ -0,0 +1,285 @@
+"""Worker tick scheduling.
+
+TickScheduler paces a sampling loop. With a fixed-rate policy the n-th tick
+is due at start + n * interval regardless of how long each command took, so
+the configured interval is the real sample period whenever the command is
+fast enough; lateness and missed ticks show where it is not. IntervalGroup
+lets one such loop serve several commands that each have their own interval.
+AdaptiveInterval moves a loop's interval between bounds as its values and
+link events demand.
+"""
+
+from threading import Event
+import time
+from typing import Any
+
+from src.core.enum.connect import SchedulePolicy
+
+
+class TickScheduler:
+    """Deadline based pacing for one worker loop.
+
+    Call start() before the first command and wait() after each one, or
+    advance() and mark_started() when the caller sleeps itself (WorkerEngine).
+    """
+
+    __slots__ = ("_interval", "_last_lateness_ms", "_last_missed", "_next", "_policy")
+
+    def __init__(self, interval_ms: float, policy: SchedulePolicy = SchedulePolicy.DELAY):
+        """Initialize scheduler.
+
+        Args:
+            interval_ms: Tick interval in milliseconds
+            policy: Schedule policy
+        """
+        self._interval = max(interval_ms, 0) / 1000
+        self._policy = policy
+        self._next = 0.0
+        self._last_lateness_ms = 0.0
+        self._last_missed = 0
+
+    @property
+    def policy(self) -> SchedulePolicy:
+        """Get schedule policy.
+
+        Returns:
+            Schedule policy
+        """
+        return self._policy
+
+    @property
+    def interval_ms(self) -> float:
+        """Get tick interval.
+
+        Returns:
+            Interval in milliseconds
+        """
+        return self._interval * 1000
+
+    def set_interval(self, interval_ms: float) -> None:
+        """Change tick interval, effective from the next tick.
+
+        Args:
+            interval_ms: Tick interval in milliseconds
+        """
+        self._interval = max(interval_ms, 0) / 1000
+
+    @property
+    def last_lateness_ms(self) -> float:
+        """Get how late the last tick started after its deadline.
+
+        Returns:
+            Lateness in milliseconds (0 for DELAY policy)
+        """
+        return self._last_lateness_ms
+
+    @property
+    def last_missed(self) -> int:
+        """Get number of ticks dropped before the last tick.
+
+        Returns:
+            Missed tick count (0 for DELAY policy)
+        """
+        return self._last_missed
+
+    def start(self) -> None:
+        """Anchor the tick grid at now (first tick is due immediately)."""
+        self._next = time.monotonic()
+        self._last_lateness_ms = 0.0
+        self._last_missed = 0
+
+    def next_deadline(self, now: float) -> tuple[float, int]:
+        """Advance to the next tick to run.
+
+        Args:
+            now: Current time.monotonic() value
+
+        Returns:
+            Tuple of (deadline, missed ticks)
+        """
+        if self._policy == SchedulePolicy.DELAY:
+            return now + self._interval, 0
+
+        deadline = self._next + self._interval
+        if self._interval <= 0 or deadline >= now:
+            return deadline, 0
+
+        # Overrun: whole ticks that are already past
+        overdue = int((now - deadline) // self._interval)
+        if self._policy == SchedulePolicy.COALESCE:
+            # Run the latest overdue tick now, the ones before it are dropped
+            return deadline + overdue * self._interval, overdue
+        return deadline + (overdue + 1) * self._interval, overdue + 1
+
+    def advance(self) -> float:
+        """Move to the next tick without waiting (for callers doing their own sleeping).
+
+        Returns:
+            Deadline of the next tick as time.monotonic() value
+        """
+        deadline, missed = self.next_deadline(time.monotonic())
+        self._next = deadline
+        self._last_missed = missed
+        return deadline
+
+    def mark_started(self) -> None:
+        """Record lateness of the tick that is starting now."""
+        if self._policy != SchedulePolicy.DELAY:
+            self._last_lateness_ms = max(time.monotonic() - self._next, 0.0) * 1000
+
+    def wait(self, stop_event: Event | None = None) -> bool:
+        """Sleep until the next tick.
+
+        Args:
+            stop_event: Optional event ending the wait early
+
+        Returns:
+            False if stop_event was set while waiting
+        """
+        delay = self.advance() - time.monotonic()
+        if delay > 0:
+            if stop_event is not None:
+                if stop_event.wait(delay):
+                    return False
+            else:
+                time.sleep(delay)
+
+        self.mark_started()
+        return True
+
+
+class IntervalGroup:
+    """Several independent intervals served by one loop ticking at the shortest of them.
+
+    Each tick, due() returns the entries whose own interval has elapsed. Half
+    a base tick of slack keeps jitter from pushing an entry to the next tick.
+    """
+
+    __slots__ = ("_due", "_intervals", "_slack")
+
+    def __init__(self, intervals_ms: list[float]):
+        """Initialize group.
+
+        Args:
+            intervals_ms: Interval of each entry in milliseconds
+        """
+        self._intervals = [max(interval, 0) / 1000 for interval in intervals_ms]
+        self._slack = min(self._intervals, default=0.0) / 2
+        self._due = [0.0] * len(self._intervals)
+
+    @property
+    def base_interval_ms(self) -> float:
+        """Get interval the loop should tick at.
+
+        Returns:
+            Shortest entry interval in milliseconds
+        """
+        return min(self._intervals, default=0.0) * 1000
+
+    def start(self) -> None:
+        """Make all entries due now."""
+        self._due = [time.monotonic()] * len(self._intervals)
+
+    def due(self) -> list[int]:
+        """Select entries due in this tick and move their deadlines on.
+
+        Returns:
+            Indexes of due entries
+        """
+        now = time.monotonic()
+        due = []
+        for i, interval in enumerate(self._intervals):
+            if self._due[i] - self._slack <= now:
+                due.append(i)
+                self._due[i] = max(self._due[i] + interval, now)
+        return due
+
+
+class AdaptiveInterval:
+    """Sampling interval that tightens on volatility and events and relaxes when stable.
+
+    A sample whose numeric values moved more than volatility_rel (relative)
+    since the previous sample halves the interval, an event (link flap,
+    tx_errors change) drops it to the minimum and holds it there for hold_sec.
+    Each stable sample after that stretches it by relax_factor, up to the maximum.
+    """
+
+    __slots__ = ("_hold_sec", "_hold_until", "_interval", "_max", "_min", "_prev", "_relax_factor", "_volatility_rel")
+
+    def __init__(
+        self,
+        base_ms: float,
+        min_ms: float,
+        max_ms: float,
+        volatility_rel: float = 0.01,
+        hold_sec: float = 30.0,
+        relax_factor: float = 1.25,
+    ):
+        """Initialize policy.
+
+        Args:
+            base_ms: Starting interval in milliseconds
+            min_ms: Shortest interval in milliseconds
+            max_ms: Longest interval in milliseconds
+            volatility_rel: Relative change between samples that counts as volatile
+            hold_sec: Seconds the interval stays at the minimum after an event
+            relax_factor: Interval growth per stable sample
+        """
+        self._min = min(min_ms, max_ms)
+        self._max = max(min_ms, max_ms)
+        self._interval = min(max(base_ms, self._min), self._max)
+        self._volatility_rel = volatility_rel
+        self._hold_sec = hold_sec
+        self._relax_factor = max(relax_factor, 1.0)
+        self._hold_until = float("-inf")
+        self._prev: list[Any] | None = None
+
+    @property
+    def interval_ms(self) -> float:
+        """Get current interval.
+
+        Returns:
+            Interval in milliseconds
+        """
+        return self._interval
+
+    def event(self, ts: float) -> None:
+        """Tighten to the minimum interval after an event.
+
+        Args:
+            ts: Event time as epoch seconds
+        """
+        self._interval = self._min
+        self._hold_until = max(self._hold_until, ts + self._hold_sec)
+
+    def observe(self, ts: float, values: list[Any] | None) -> float:
+        """Adjust interval from one sample.
+
+        Args:
+            ts: Sample begin time as epoch seconds
+            values: Row values, or None when the parser saw no change (a stable sample)
+
+        Returns:
+            Interval to use for the next tick in milliseconds
+        """
+        if values is None:
+            values = self._prev
+        prev, self._prev = self._prev, values
+        if prev is not None and self._volatile(prev, values):
+            self._interval = max(self._min, self._interval / 2)
+        elif ts >= self._hold_until:
+            self._interval = min(self._max, self._interval * self._relax_factor)
+        return self._interval
+
+    def _volatile(self, prev: list[Any], values: list[Any]) -> bool:
+        """Check if any numeric value moved more than the volatility threshold."""
+        for value, last in zip(values, prev, strict=False):
+            if value == last:
+                continue
+            try:
+                current, previous = float(value), float(last)
+            except (TypeError, ValueError):
+                continue
+            if abs(current - previous) > self._volatility_rel * max(abs(previous), 1e-9):
+                return True
+        return False
@@ -21,6 +21,9 @@ class WorkerStats:
     cycle_times: deque[float] = field(default_factory=lambda: deque(maxlen=20))
     parsed_times: deque[float] = field(default_factory=lambda: deque(maxlen=20))
     timestamps: deque[float] = field(default_factory=lambda: deque(maxlen=20))
+    lateness: deque[float] = field(default_factory=lambda: deque(maxlen=20))
+    ticks: int = 0
+    missed_ticks: int = 0
     max_samples: int = 20
 
     def add_duration(
@@ -54,6 +57,26 @@ class WorkerStats:
         if timestamp > 0:
             self.timestamps.append(timestamp)
 
+    def add_schedule(self, lateness_ms: float, missed: int) -> None:
+        """Add scheduler result of one tick.
+
+        Args:
+            lateness_ms: How late the tick started after its deadline
+            missed: Ticks dropped before this one (command overran the interval)
+        """
+        self.lateness.append(lateness_ms)
+        self.ticks += 1
+        self.missed_ticks += missed
+
+    def get_missed_ratio(self) -> float:
+        """Get share of scheduled ticks that were missed.
+
+        Returns:
+            Missed ticks / (run + missed ticks), or 0.0 if no data
+        """
+        total = self.ticks + self.missed_ticks
+        return self.missed_ticks / total if total else 0.0
+
     def get_min(self) -> float:
         """Get minimum duration in rolling window.
 
@@ -141,6 +164,18 @@ class WorkerStatistics:
             self._stats[command] = WorkerStats(command)
         self._stats[command].add_duration(duration_ms, send_ms, read_ms, cycle_ms, parsed_ms, timestamp)
 
+    def record_schedule(self, command: str, lateness_ms: float, missed: int) -> None:
+        """Record fixed-rate scheduler lateness and missed ticks.
+
+        Args:
+            command: Command of the worker
+            lateness_ms: How late the tick started after its deadline
+            missed: Ticks dropped before this one
+        """
+        if command not in self._stats:
+            self._stats[command] = WorkerStats(command)
+        self._stats[command].add_schedule(lateness_ms, missed)
+
     def get_summary(self) -> str:
         """Generate summary report of all worker statistics.
 
@@ -178,6 +213,10 @@ class WorkerStatistics:
             rows.append(f"Avg:  {mean:10.3f}ms │ Median: {median:8.3f}ms")
             rows.append(f"Send: {send_avg:10.3f}ms │ Read: {read_avg:10.3f}ms")
             rows.append(f"Cycle: {cycle_avg:9.3f}ms │ Time:   {parsed_avg:8.3f}ms")
+            if stats.ticks:
+                late_avg = sum(stats.lateness) / len(stats.lateness)
+                missed_pct = stats.get_missed_ratio() * 100
+                rows.append(f"Late: {late_avg:10.3f}ms │ Missed: {stats.missed_ticks} ({missed_pct:.1f}%)")
             rows.append("---")
 
         # Add metric descriptions once at the end
@@ -191,6 +230,8 @@ class WorkerStatistics:
         rows.append("  Read: Average time to read response from SSH connection")
         rows.append("  Cycle: Total time per iteration (Avg + Manual delay)")
         rows.append("  Time: Real execution time on remote system (from 'time' cmd)")
+        rows.append("  Late: Average start delay after the fixed-rate tick deadline")
+        rows.append("  Missed: Ticks dropped because the command overran the interval")
         rows.append("---")
         rows.append("Max Duration Analysis:")
         # Sort commands alphabetically for consistent display
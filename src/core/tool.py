@@ -50,6 +50,55 @@ class ToolResult:
         return not self._error.strip()
 
 
+def exec_command(
+    ssh: SshConnection,
+    cmd: str,
+    use_time_cmd: bool = False,
+    use_shell: bool = False,
+    timeout: int | None = 20,
+    logger: logging.Logger | None = None,
+    exec_logger: logging.Logger | None = None,
+) -> CmdResult:
+    """Execute command on a connection, turning failures into error results.
+
+    Args:
+        ssh: Connection to execute on
+        cmd: CLI command to execute
+        use_time_cmd: Wrap command with 'time' for execution timing
+        use_shell: Use interactive shell instead of exec_cmd
+        timeout: Command timeout in seconds (default: 20)
+        logger: Logger for success/failure messages
+        exec_logger: Logger passed to the connection
+
+    Returns:
+        Command result
+    """
+    log = logger or logging.getLogger(LogName.MAIN.value)
+
+    if not ssh.is_connected():
+        return ssh.get_cr_msg_connection(cmd, LogMsg.EXEC_CMD_FAIL)
+
+    try:
+        if use_shell:
+            output = ssh.exec_shell_cmd(cmd)
+            cmd_result = CmdResult(cmd=cmd, stdout=output, stderr="", exec_time=0.0, rcode=0)
+        else:
+            cmd_result = ssh.exec_cmd(cmd, timeout=timeout, use_time_cmd=use_time_cmd, logger=exec_logger)
+
+        if cmd_result.success:
+            log.debug(f"{LogMsg.CMD_EXEC_SUCCESS.value}: '{cmd}'")
+        else:
+            cmd_result = CmdResult.error(cmd, cmd_result.stderr)
+    except (OSError, TimeoutError) as e:
+        log.exception(f"Command execution failed: {cmd}")
+        cmd_result = CmdResult.error(cmd, str(e))
+    except Exception as e:
+        log.exception(f"Unexpected error executing command: {cmd}")
+        cmd_result = CmdResult.error(cmd, f"Unexpected error: {e}")
+
+    return cmd_result
+
+
 class Tool:
     """Base class for CLI-based network diagnostic tools.
 
@@ -95,31 +144,15 @@ class Tool:
         Returns:
             Command result
         """
-        log = logger or self._logger
-
-        if not self._ssh.is_connected():
-            return self._ssh.get_cr_msg_connection(cmd, LogMsg.EXEC_CMD_FAIL)
-
-        try:
-            # Use exec_logger if no logger passed
-            exec_log = logger or self._exec_logger
-            if use_shell:
-                output = self._ssh.exec_shell_cmd(cmd)
-                cmd_result = CmdResult(cmd=cmd, stdout=output, stderr="", exec_time=0.0, rcode=0)
-            else:
-                cmd_result = self._ssh.exec_cmd(cmd, timeout=timeout, use_time_cmd=use_time_cmd, logger=exec_log)
-
-            if cmd_result.success:
-                log.debug(f"{LogMsg.CMD_EXEC_SUCCESS.value}: '{cmd}'")
-            else:
-                cmd_result = CmdResult.error(cmd, cmd_result.stderr)
-        except (OSError, TimeoutError) as e:
-            log.exception(f"Command execution failed: {cmd}")
-            cmd_result = CmdResult.error(cmd, str(e))
-        except Exception as e:
-            log.exception(f"Unexpected error executing command: {cmd}")
-            cmd_result = CmdResult.error(cmd, f"Unexpected error: {e}")
-
+        cmd_result = exec_command(
+            self._ssh,
+            cmd,
+            use_time_cmd=use_time_cmd,
+            use_shell=use_shell,
+            timeout=timeout,
+            logger=logger or self._logger,
+            exec_logger=logger or self._exec_logger,
+        )
         self._results[cmd] = cmd_result
         return cmd_result
 
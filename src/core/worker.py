@@ -6,24 +6,30 @@ This module provides:
 - WorkerCommand: Command configuration with optional parser
 """
 
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime as dt
 import logging
 from pathlib import Path
-import queue
 from threading import Event, Thread
 import time
 from typing import Any
 
-from pympler import asizeof
-
+from src.core.buffer import SampleRingBuffer
 from src.core.connect import SshConnection
+from src.core.deadband import DeadbandFilter
+from src.core.engine import WorkerEngine
+from src.core.enum.connect import BufferPolicy, LogCompression, SchedulePolicy
 from src.core.enum.messages import LogMsg
-from src.core.helpers import get_attr_value
+from src.core.helpers import get_attr_values, get_flap_values
 from src.core.json import Json
-from src.core.log.rotation import _mark_logger_for_rotation, check_and_rotate_log
+from src.core.log.raw_archive import RawArchiveWriter, raw_archive_path
+from src.core.log.rotation import _mark_logger_for_rotation, check_and_rotate_log, check_and_rotate_sink
+from src.core.log.sink import CsvSink, acquire_sink, release_sink
 from src.core.parser import SutTimeParser
-from src.core.sample import Sample
+from src.core.recorder import BlackBoxRecorder
+from src.core.sample import SampleRecord
+from src.core.schedule import AdaptiveInterval, IntervalGroup, TickScheduler
 from src.core.statistics import WorkerStatistics
 from src.interfaces.component import ITime
 from src.models.config import Config
@@ -43,8 +49,14 @@ class WorkerConfig:
         scan_interval_ms: Polling interval in milliseconds
         max_log_size_kb: Maximum log file size in KB before rotation (default 102400KB = 100MB)
         is_flap_logger: Whether this logger tracks link flaps
+        is_trigger: Whether rows logged by this worker (after its first) open black-box recording windows
         skip_header: Skip writing header row (data includes its own header)
         use_shell: Use interactive shell instead of exec_cmd (for SLX)
+        sub_commands: Optional (command, interval_ms) queries run instead of command, each on its
+            own interval; the outputs due in a tick are parsed together into one row
+        pipeline_depth: Overlapping in-flight executions for commands slower than their interval
+        deadband: Optional change-only filter; rows inside the deadband are buffered but not logged
+        adaptive: Optional policy moving the scan interval between bounds on volatility and trigger events
     """
 
     command: str = None
@@ -56,8 +68,13 @@ class WorkerConfig:
     scan_interval_ms: int = 500
     max_log_size_kb: int = 102400
     is_flap_logger: bool = False
+    is_trigger: bool = False
     skip_header: bool = False
     use_shell: bool = False
+    sub_commands: list[tuple[str, int]] | None = None
+    pipeline_depth: int = 1
+    deadband: DeadbandFilter | None = None
+    adaptive: AdaptiveInterval | None = None
 
 
 class Worker(Thread, ITime):
@@ -105,9 +122,29 @@ class Worker(Thread, ITime):
         self._statistics = statistics
 
         self._stop_event = Event()  # Signal for graceful shutdown
+        self._done = Event()  # Set by finish()
+        self._scheduler = TickScheduler(worker_cfg.scan_interval_ms, self._schedule_policy)
+        self._engine: WorkerEngine | None = None  # Set when driven by a shared engine
+        self._reconnect = 0
+        self._last_start: float | None = None
+        self._tick_due = False
+        self._sub_intervals = (
+            IntervalGroup([interval for _, interval in worker_cfg.sub_commands]) if worker_cfg.sub_commands else None
+        )
+
+        # Pipelining: in-flight (launch time, future) in launch order and smoothed command latency
+        self._pipeline: ThreadPoolExecutor | None = None
+        self._inflight: deque[tuple[float, Future]] = deque()
+        self._latency_ms = float(worker_cfg.scan_interval_ms)
+        self._next_launch = 0.0
 
-        self._collected_samples: queue.Queue = queue.Queue()  # Thread-safe queue for samples
-        self._extracted_samples: list[Sample] = []  # Extracted samples for analysis
+        self._sink: CsvSink | None = None  # Clean CSV output when sut_csv_sink is enabled
+        self._recorder: BlackBoxRecorder | None = None  # Event windows + summaries when sut_recorder is enabled
+        self._raw_archive: RawArchiveWriter | None = None  # Unparsed outputs when sut_raw_archive is enabled
+        self._seen_trigger: float | None = None
+        self._rows_logged = 0
+
+        self._buffer = self._new_buffer()  # Bounded columnar history of parsed samples
 
         self._logger = worker_cfg.logger
         # Use shared dicts for rotation state (modified by rotation function)
@@ -123,6 +160,35 @@ class Worker(Thread, ITime):
         """
         return hasattr(self._cfg, "sut_time_cmd") and self._cfg.sut_time_cmd
 
+    @property
+    def _schedule_policy(self) -> SchedulePolicy:
+        """Get sampling schedule policy (fixed delay unless configured).
+
+        Returns:
+            Schedule policy
+        """
+        return getattr(self._cfg, "sut_schedule_policy", SchedulePolicy.DELAY)
+
+    def _buffer_columns(self) -> list[str]:
+        """Get sample buffer columns (attributes, or a single value column).
+
+        Returns:
+            Column names
+        """
+        return list(self._worker_cfg.attributes) if self._worker_cfg.attributes else ["value"]
+
+    def _new_buffer(self) -> SampleRingBuffer:
+        """Create empty sample buffer sized from configuration.
+
+        Returns:
+            Sample ring buffer
+        """
+        return SampleRingBuffer(
+            self._buffer_columns(),
+            capacity=getattr(self._cfg, "sut_sample_buffer_capacity", 4096),
+            policy=getattr(self._cfg, "sut_sample_buffer_policy", BufferPolicy.OVERWRITE),
+        )
+
     def _build_csv_header(self) -> str:
         """Build CSV header from worker config.
 
@@ -138,30 +204,22 @@ class Worker(Thread, ITime):
             headers.append("value")
         return ",".join(headers)
 
-    def _extract_timing_data(self, sample: Sample) -> tuple[float, float, float]:
-        """Extract timing data from sample command result.
+    def _extract_timing_data(self, sample: SampleRecord) -> tuple[float, float, float]:
+        """Extract timing data from sample record.
 
         Args:
-            sample: Sample with command result
+            sample: Collected sample record
 
         Returns:
             Tuple of (send_ms, read_ms, parsed_ms)
         """
-        send_ms = 0.0
-        read_ms = 0.0
-        parsed_ms = 0.0
-
-        if sample.cmd_result:
-            send_ms = sample.cmd_result.send_ms
-            read_ms = sample.cmd_result.read_ms
-            parsed_ms = sample.cmd_result.parsed_ms
-
-            if self._time_cmd_enabled:
-                time_parser = SutTimeParser(self._logger.name)
-                time_parser.parse(sample.cmd_result.stderr)
-                parsed_ms = time_parser.get_result()
+        parsed_ms = sample.parsed_ms
+        if self._time_cmd_enabled and not parsed_ms:
+            time_parser = SutTimeParser(self._logger.name)
+            time_parser.parse(sample.stderr)
+            parsed_ms = time_parser.get_result()
 
-        return send_ms, read_ms, parsed_ms
+        return sample.send_ms, sample.read_ms, parsed_ms
 
     def _record_statistics(
         self,
@@ -170,6 +228,7 @@ class Worker(Thread, ITime):
         read_ms: float,
         parsed_ms: float,
         cmd_start: float,
+        cycle_ms: float | None = None,
     ) -> None:
         """Record command duration statistics.
 
@@ -179,9 +238,11 @@ class Worker(Thread, ITime):
             read_ms: Read time
             parsed_ms: Parse time
             cmd_start: Command start timestamp
+            cycle_ms: Measured cycle time (default: duration + scan interval)
         """
         if hasattr(self, "_statistics") and self._statistics:
-            cycle_ms = cmd_duration_ms + self._worker_cfg.scan_interval_ms
+            if cycle_ms is None:
+                cycle_ms = cmd_duration_ms + self._scheduler.interval_ms
             self._statistics.record_duration(
                 self._worker_cfg.command,
                 cmd_duration_ms,
@@ -192,11 +253,37 @@ class Worker(Thread, ITime):
                 timestamp=cmd_start,
             )
 
-    def _parse_sample_output(self, sample: Sample) -> None:
+    def _next_due(self, sampled: bool) -> float:
+        """Get when the next sample is due, unless the remote sampler paces the loop.
+
+        Args:
+            sampled: Whether last sample came from the remote sampler
+
+        Returns:
+            Due time as time.monotonic() value
+        """
+        if sampled:
+            # Remote agent keeps the grid; re-anchor so a fallback to local execution starts on time
+            self._scheduler.start()
+            return time.monotonic()
+
+        self._tick_due = True
+        return self._scheduler.advance()
+
+    def _record_schedule(self) -> None:
+        """Record lateness and missed ticks of the tick that is starting now."""
+        self._tick_due = False
+        self._scheduler.mark_started()
+        if self._scheduler.policy != SchedulePolicy.DELAY and self._statistics:
+            self._statistics.record_schedule(
+                self._worker_cfg.command, self._scheduler.last_lateness_ms, self._scheduler.last_missed
+            )
+
+    def _parse_sample_output(self, sample: SampleRecord) -> None:
         """Parse sample output using configured parser.
 
         Args:
-            sample: Sample to parse (modified in place)
+            sample: Sample record to parse (modified in place)
         """
         if self._worker_cfg.parser is not None:
             if hasattr(self._worker_cfg.parser, "_logger"):
@@ -208,17 +295,31 @@ class Worker(Thread, ITime):
         else:
             sample.snapshot = ""
 
-    def _log_flap_data(self, timestamp: str, parsed_ms: float, flap: Any) -> None:
+    def _sample_values(self, sample: SampleRecord) -> list[Any]:
+        """Get row values of a parsed sample.
+
+        Args:
+            sample: Sample record with snapshot data
+
+        Returns:
+            One value per attribute, or the snapshot itself
+        """
+        if self._worker_cfg.attributes is not None:
+            return get_attr_values(sample.snapshot, self._worker_cfg.attributes)
+        return [sample.snapshot]
+
+    def _log_flap_data(self, timestamp: str, parsed_ms: float, flap: Any, values: list[str]) -> None:
         """Log flap detection data and mark all active loggers for rotation.
 
         Args:
             timestamp: Begin timestamp
             parsed_ms: Parsed time in milliseconds
             flap: Flap object with interface, down_time, up_time, duration
+            values: Row values from get_flap_values()
         """
         main_logger = logging.getLogger("main")
         self._shared_flap_state["flaps_detected"] = True
-        self._shared_flap_state["last_flap_time"] = time.time()
+        self._shared_flap_state["last_flap_time"] = self._shared_flap_state["trigger_time"] = time.time()
 
         # Mark ALL active loggers for rotation (not just flap logger)
         if "active_loggers" in self._shared_flap_state:
@@ -230,28 +331,54 @@ class Worker(Thread, ITime):
         row = [timestamp]
         if self._time_cmd_enabled:
             row.append(f"{parsed_ms:.3f}")
-        row.append(flap.interface)
-        row.append(flap.down_time.strftime("%Y-%m-%d %H:%M:%S.%f"))
-        row.append(flap.up_time.strftime("%Y-%m-%d %H:%M:%S.%f"))
-        row.append(str(flap.duration))
-        self._logger.info(",".join(row))
+        row.extend(values)
+        self._write_row(row)
 
-    def _log_sample_data(self, timestamp: str, parsed_ms: float, sample: Sample) -> None:
-        """Log regular sample data.
+    def _log_sample_data(self, timestamp: str, parsed_ms: float, values: list[Any], begin: float) -> None:
+        """Log regular sample data (through the black-box recorder in recorder mode).
 
         Args:
             timestamp: Begin timestamp
             parsed_ms: Parsed time in milliseconds
-            sample: Sample with snapshot data
+            values: Row values from _sample_values()
+            begin: Begin time as epoch seconds
         """
         row = [timestamp]
         if self._time_cmd_enabled:
             row.append(f"{parsed_ms:.3f}")
-        if self._worker_cfg.attributes is not None:
-            row.extend(get_attr_value(sample.snapshot, attr) for attr in self._worker_cfg.attributes)
+        row.extend(values)
+
+        if self._worker_cfg.is_trigger and self._rows_logged:
+            self._shared_flap_state["trigger_time"] = begin
+        self._rows_logged += 1
+
+        if self._recorder is None:
+            self._write_row(row)
         else:
-            row.append(sample.snapshot)
-        self._logger.info(",".join(row))
+            self._recorder.record(begin, row)
+
+    def _poll_trigger(self) -> float | None:
+        """Get trigger event (flap, tx_errors change) published by another worker since the last call.
+
+        Returns:
+            Trigger time as epoch seconds, or None if there is no new trigger
+        """
+        trigger = self._shared_flap_state.get("trigger_time")
+        if trigger is None or trigger == self._seen_trigger:
+            return None
+        self._seen_trigger = trigger
+        return trigger
+
+    def _write_row(self, row: list[str]) -> None:
+        """Write CSV row to the sink, or through the logger when no sink is used.
+
+        Args:
+            row: Row fields
+        """
+        if self._sink is not None:
+            self._sink.write(",".join(row))
+        else:
+            self._logger.info(",".join(row))
 
     def run(self) -> None:
         """Main thread execution loop.
@@ -260,18 +387,49 @@ class Worker(Thread, ITime):
         and handles reconnection on failures. Runs until stop event is set.
         """
         self.start_timer()
+        if self.open():
+            while (due := self.step()) is not None:
+                delay = due - time.monotonic()
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
+        self.finish()
+
+    def open(self) -> bool:
+        """Connect and run one-time setup (pre-command, attributes, CSV header).
 
+        Returns:
+            True if worker is ready to step
+        """
         # Create and connect SSH connection for this worker
         try:
             self._ssh = self._ssh_factory()
             if not self._ssh.connect():
                 self._logger.error(f"Worker {self.name} failed to establish SSH connection")
-                return
+                return False
             self._logger.debug(f"Worker {self.name} established SSH connection")
         except Exception:
             self._logger.exception(f"Worker {self.name} failed to create SSH connection")
-            return
+            return False
+
+        self._prepare()
+        self._scheduler.start()
+        return True
+
+    def attach(self, ssh: SshConnection) -> None:
+        """Run one-time setup on a connection owned by someone else (bundled worker).
 
+        The worker is never started; its owner collects samples and passes
+        them to handle_sample().
+
+        Args:
+            ssh: Connected connection used for setup commands
+        """
+        self._ssh = ssh
+        self._owns_connection = False
+        self._prepare()
+
+    def _prepare(self) -> None:
+        """Run pre-command, collect attributes, write CSV header and register logger."""
         # Execute pre_command once before loop starts
         if self._worker_cfg.pre_command:
             try:
@@ -291,9 +449,48 @@ class Worker(Thread, ITime):
             except Exception:
                 self._logger.exception("Attribute collection failed")
 
-        # Write header unless skip_header is True
-        if not self._worker_cfg.skip_header:
-            self._write_raw_csv(self._build_csv_header())
+        # Attributes collected above define the buffer columns
+        if self._buffer.columns != self._buffer_columns():
+            self._buffer = self._new_buffer()
+        if self._worker_cfg.deadband is not None:
+            self._worker_cfg.deadband.bind(self._buffer_columns())
+
+        # Write header unless skip_header is True (a CSV sink writes it when the file is created)
+        header = None if self._worker_cfg.skip_header else self._build_csv_header()
+        csv_path = self._csv_path() if getattr(self._cfg, "sut_csv_sink", False) else None
+        if csv_path is not None and self._sink is None:
+            self._sink = acquire_sink(
+                csv_path,
+                header,
+                flush_interval_ms=getattr(self._cfg, "sut_csv_flush_ms", 200),
+                batch_rows=getattr(self._cfg, "sut_csv_batch_rows", 256),
+                segments=getattr(self._cfg, "sut_log_segments", 0),
+                compression=getattr(self._cfg, "sut_log_compression", LogCompression.GZIP),
+            )
+        elif header:
+            self._write_raw_csv(header)
+
+        # Raw archive mode: keep unparsed outputs so values can be re-derived offline (main_scan_reparse.py)
+        log_path = self._csv_path() if getattr(self._cfg, "sut_raw_archive", False) else None
+        if log_path is not None and self._raw_archive is None:
+            self._raw_archive = RawArchiveWriter(
+                raw_archive_path(log_path, self._worker_cfg.command), self._raw_archive_meta()
+            )
+
+        # Recorder mode: only event windows and summaries of this worker's rows reach the file
+        self._seen_trigger = self._shared_flap_state.get("trigger_time")
+        if (
+            getattr(self._cfg, "sut_recorder", False)
+            and not self._worker_cfg.is_flap_logger
+            and not self._worker_cfg.is_trigger
+            and self._recorder is None
+        ):
+            self._recorder = BlackBoxRecorder(
+                getattr(self._cfg, "sut_recorder_pre_sec", 10),
+                getattr(self._cfg, "sut_recorder_post_sec", 10),
+                getattr(self._cfg, "sut_recorder_summary_sec", 1),
+                self._write_row,
+            )
 
         # Register this logger as active (for flap rotation marking)
         if not self._worker_cfg.is_flap_logger:
@@ -303,74 +500,230 @@ class Worker(Thread, ITime):
             main_logger = logging.getLogger("main")
             main_logger.debug(f"Registered {self._logger.name} as active logger for flap rotation")
 
-        reconnect = 0
-        while not self._stop_event.is_set():
-            try:
-                # Check reconnection limit
-                if reconnect > self.MAX_RECONNECT:
-                    self._logger.info(
-                        f"{LogMsg.WORKER_RECONNECT_FAIL.value} {self.MAX_RECONNECT} times. Exiting worker thread: {self.name}"
-                    )
-                    break
+        self._reconnect = 0
+        self._last_start = None
+        if self._sub_intervals:
+            self._sub_intervals.start()
+        if self._worker_cfg.pipeline_depth > 1 and self._pipeline is None:
+            self._pipeline = ThreadPoolExecutor(self._worker_cfg.pipeline_depth, thread_name_prefix=f"{self.name}-pipe")
 
-                # Collect sample by executing command
-                cmd_start = time.time()
-                sample = Sample(self._cfg, self._ssh).collect(self._worker_cfg, logger=self._logger)
-                cmd_duration_ms = (time.time() - cmd_start) * 1000
+    def step(self) -> float | None:
+        """Collect, record and log one sample.
 
-                # Skip interrupted samples (Ctrl+C during collection)
-                if self._stop_event.is_set():
-                    break
+        Returns:
+            Due time (time.monotonic()) of the next step, or None when the worker is done
+        """
+        if self._stop_event.is_set():
+            return None
 
-                # Extract timing data and record statistics
-                send_ms, read_ms, parsed_ms = self._extract_timing_data(sample)
-                self._record_statistics(cmd_duration_ms, send_ms, read_ms, parsed_ms, cmd_start)
+        try:
+            # Check reconnection limit
+            if self._reconnect > self.MAX_RECONNECT:
+                self._logger.info(
+                    f"{LogMsg.WORKER_RECONNECT_FAIL.value} {self.MAX_RECONNECT} times. Exiting worker thread: {self.name}"
+                )
+                return None
+
+            if self._pipeline is not None:
+                return self._pipeline_step()
+
+            if self._tick_due:
+                self._record_schedule()
+
+            # Collect sample by executing command (or the due sub-commands in one batch)
+            cmds = self.due_commands()
+            if not cmds:
+                return self._next_due(sampled=False)
+            sample, cmd_start, cmd_duration_ms = self._collect(cmds)
+
+            # Skip interrupted samples (Ctrl+C during collection)
+            if self._stop_event.is_set():
+                return None
+
+            self.handle_sample(sample, cmd_start, cmd_duration_ms)
+
+            self._reconnect = 0  # Reset counter on success
+            return self._next_due(sample.remote)
+
+        except KeyboardInterrupt:
+            self._logger.info(f"{LogMsg.WORKER_USER_EXIT.value}: {self.name}")
+            return None
+        except Exception as e:
+            self._logger.exception(f"{LogMsg.WORKER_STOPPED.value}: {type(e).__name__}: {e}")
+            self._reconnect += 1
+            # Don't attempt reconnection - SSH connection is shared and managed externally
+            self._logger.exception(
+                f"Worker error - Attempt {self._reconnect}/{self.MAX_RECONNECT} - Command: {self._worker_cfg.command}"
+            )
+            if self._reconnect >= self.MAX_RECONNECT:
+                self._logger.critical(f"Worker {self.name} exceeded max reconnect attempts. Thread will exit.")
+            return time.monotonic() + min(self._reconnect, 5)  # Exponential backoff up to 5s
 
-                # Parse output
-                self._parse_sample_output(sample)
+    def _collect(self, cmds: list[str]) -> tuple[SampleRecord, float, float]:
+        """Execute commands of one tick.
 
-                # Add to thread-safe queue
-                self._collected_samples.put(sample)
+        Args:
+            cmds: Worker command or due sub-commands (run as one batch)
 
-                # Log sample value
-                timestamp = sample.begin.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] if sample.begin else ""
+        Returns:
+            Tuple of (sample, local start epoch seconds, duration in milliseconds)
+        """
+        cmd_start = time.time()
+        if len(cmds) == 1:
+            sample = SampleRecord.collect(
+                self._ssh,
+                self._worker_cfg,
+                use_time_cmd=self._time_cmd_enabled,
+                logger=self._logger,
+                command=cmds[0],
+            )
+        else:
+            sample = SampleRecord.from_results(cmd_start, self._ssh.exec_many(cmds, logger=self._logger))
+        return sample, cmd_start, (time.time() - cmd_start) * 1000
 
-                # Skip logging if parser returned None (no change detected)
-                if sample.snapshot is None:
-                    reconnect = 0
-                    sleep_time_ms = self._worker_cfg.scan_interval_ms
-                    time.sleep(float(sleep_time_ms / 1000))
-                    continue
+    def _pipeline_step(self) -> float | None:
+        """Emit finished in-flight samples and launch the next overlapping execution.
 
-                # Log data
-                if hasattr(sample.snapshot, "flaps"):
-                    for flap in sample.snapshot.flaps:
-                        self._log_flap_data(timestamp, parsed_ms, flap)
-                else:
-                    self._log_sample_data(timestamp, parsed_ms, sample)
+        Launches are staggered by the smoothed command latency divided by the
+        pipeline depth (never closer than the scan interval), so K executions
+        on separate channels sample a slow command K times per latency.
 
-                # Check log size and rotate if needed
-                self._check_and_rotate_log()
+        Returns:
+            Due time (time.monotonic()) of the next step, or None when stopped
+        """
+        depth = self._worker_cfg.pipeline_depth
+
+        # Only the oldest execution is emitted, so samples stay ordered by begin time
+        while self._inflight and self._inflight[0][1].done():
+            sample, cmd_start, cmd_duration_ms = self._inflight.popleft()[1].result()
+            if self._stop_event.is_set():
+                return None
+            self._latency_ms += (cmd_duration_ms - self._latency_ms) * 0.2
+            self.handle_sample(sample, cmd_start, cmd_duration_ms)
+            self._reconnect = 0
+
+        now = time.monotonic()
+        stagger = max(self._scheduler.interval_ms, self._latency_ms / depth) / 1000
+        if len(self._inflight) < depth and now >= self._next_launch:
+            cmds = self.due_commands()
+            if cmds:
+                self._inflight.append((now, self._pipeline.submit(self._collect, cmds)))
+            self._next_launch = now + stagger
+
+        if len(self._inflight) < depth:
+            return self._next_launch
+        # Full: come back when the oldest execution should be done
+        oldest_done = self._inflight[0][0] + self._latency_ms / 1000
+        return max(oldest_done, now + min(stagger, 0.05))
+
+    def due_commands(self) -> list[str]:
+        """Get commands to run in this tick.
 
-                reconnect = 0  # Reset counter on success
-                sleep_time_ms = self._worker_cfg.scan_interval_ms
-                time.sleep(float(sleep_time_ms / 1000))
+        Returns:
+            The worker command, or the sub-commands whose interval has elapsed
+        """
+        if self._sub_intervals is None:
+            return [self._worker_cfg.command]
+        return [self._worker_cfg.sub_commands[i][0] for i in self._sub_intervals.due()]
 
-            except KeyboardInterrupt:
-                self._logger.info(f"{LogMsg.WORKER_USER_EXIT.value}: {self.name}")
-                break
-            except Exception as e:
-                self._logger.exception(f"{LogMsg.WORKER_STOPPED.value}: {type(e).__name__}: {e}")
-                reconnect += 1
-                # Don't attempt reconnection - SSH connection is shared and managed externally
-                self._logger.exception(
-                    f"Worker error - Attempt {reconnect}/{self.MAX_RECONNECT} - Command: {self._worker_cfg.command}"
-                )
-                if reconnect >= self.MAX_RECONNECT:
-                    self._logger.critical(f"Worker {self.name} exceeded max reconnect attempts. Thread will exit.")
-                time.sleep(min(reconnect, 5))  # Exponential backoff up to 5s
+    def handle_sample(self, sample: SampleRecord, cmd_start: float, cmd_duration_ms: float) -> None:
+        """Record statistics for a collected sample, parse it, log it and buffer it.
+
+        Args:
+            sample: Collected sample record
+            cmd_start: Local command start as epoch seconds
+            cmd_duration_ms: Command duration in milliseconds
+        """
+        # Fixed-rate period is measured tick to tick (duration + interval only holds for DELAY)
+        cycle_ms = None
+        if self._last_start is not None and self._scheduler.policy != SchedulePolicy.DELAY:
+            cycle_ms = (cmd_start - self._last_start) * 1000
+        self._last_start = cmd_start
+
+        # Extract timing data and record statistics
+        send_ms, read_ms, parsed_ms = self._extract_timing_data(sample)
+        if sample.remote:
+            # Remote sampler paces the loop: wait time is the cycle, remote duration the command time
+            self._record_statistics(parsed_ms, send_ms, read_ms, parsed_ms, cmd_start, cmd_duration_ms)
+        else:
+            self._record_statistics(cmd_duration_ms, send_ms, read_ms, parsed_ms, cmd_start, cycle_ms)
+
+        if self._raw_archive is not None and isinstance(sample.snapshot, str):
+            self._raw_archive.append(sample.begin, sample.snapshot)
+
+        # Parse output
+        self._parse_sample_output(sample)
+
+        # Log data and keep it in the bounded buffer
+        timestamp = sample.begin_str
+        if sample.snapshot is not None and hasattr(sample.snapshot, "flaps"):
+            for flap in sample.snapshot.flaps:
+                self._record_flap(timestamp, sample.begin, parsed_ms, flap)
+        else:
+            # Triggers and the adaptive interval also see samples the parser found unchanged (None)
+            values = None if sample.snapshot is None else self._sample_values(sample)
+            self._observe(sample.begin, values)
+
+            # Skip logging if parser returned None (no change detected)
+            if values is None:
+                return
+
+            deadband = self._worker_cfg.deadband
+            if deadband is None or deadband.accept(sample.begin, values):
+                self._log_sample_data(timestamp, parsed_ms, values, sample.begin)
+            self._buffer.append(sample.begin, values)
+
+        # Check log size and rotate if needed
+        self._check_and_rotate_log()
+
+    def _observe(self, begin: float, values: list[Any] | None) -> None:
+        """Pass new trigger events and one sample to the recorder and adaptive interval.
+
+        Args:
+            begin: Sample begin time as epoch seconds
+            values: Row values, or None when the parser saw no change
+        """
+        adaptive = self._worker_cfg.adaptive
+        trigger = self._poll_trigger()
+        if trigger is not None:
+            if self._recorder is not None:
+                self._recorder.trigger(trigger)
+            if adaptive is not None:
+                adaptive.event(trigger)
+        if adaptive is not None:
+            self._scheduler.set_interval(adaptive.observe(begin, values))
+
+    def _record_flap(self, timestamp: str, begin: float, parsed_ms: float, flap: Any) -> None:
+        """Log and buffer one detected flap.
+
+        Args:
+            timestamp: Begin timestamp
+            begin: Begin time as epoch seconds
+            parsed_ms: Parsed time in milliseconds
+            flap: Flap object with interface, down_time, up_time, duration
+        """
+        values = get_flap_values(flap)
+        self._log_flap_data(timestamp, parsed_ms, flap, values)
+        self._buffer.append(begin, values)
+
+    def detach(self) -> None:
+        """Flush and release the CSV sink and raw archive (end of attach(), also run by finish())."""
+        if self._sink is not None:
+            release_sink(self._sink)
+            self._sink = None
+        if self._raw_archive is not None:
+            self._raw_archive.close()
+            self._raw_archive = None
+
+    def finish(self) -> None:
+        """Disconnect SSH connection and mark worker as done."""
+        self.detach()
+        if self._pipeline is not None:
+            # In-flight executions are dropped, their samples would arrive after the stop
+            self._pipeline.shutdown(wait=False, cancel_futures=True)
+            self._pipeline = None
+            self._inflight.clear()
 
-        # Cleanup: disconnect SSH connection
         if self._owns_connection and self._ssh:
             try:
                 self._ssh.disconnect()
@@ -379,10 +732,21 @@ class Worker(Thread, ITime):
                 self._logger.exception(f"Worker {self.name} failed to disconnect SSH")
 
         self.stop_timer()
+        self._done.set()
+
+    def bind_engine(self, engine: "WorkerEngine") -> None:
+        """Let a WorkerEngine drive this worker instead of its own thread.
+
+        Args:
+            engine: Engine calling open(), step() and finish()
+        """
+        self._engine = engine
 
     def close(self) -> None:
         """Signal worker to stop execution."""
         self._stop_event.set()
+        if self._engine:
+            self._engine.wake(self)
         self._logger.debug("Stop event is set")
 
     def close_and_wait(self) -> None:
@@ -391,6 +755,27 @@ class Worker(Thread, ITime):
         while self.is_alive():
             time.sleep(0.1)
 
+    def is_alive(self) -> bool:
+        """Check if worker is running (own thread or engine driven).
+
+        Returns:
+            True if running
+        """
+        if self._engine:
+            return not self._done.is_set()
+        return super().is_alive()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait until worker is done.
+
+        Args:
+            timeout: Maximum wait in seconds
+        """
+        if self._engine:
+            self._done.wait(timeout)
+            return
+        super().join(timeout)
+
     @property
     def command(self) -> str:
         """Get worker command.
@@ -400,19 +785,56 @@ class Worker(Thread, ITime):
         """
         return self._worker_cfg.command
 
-    def add(self, sample: Sample) -> None:
-        """Add sample to queue.
+    @property
+    def members(self) -> list["Worker"]:
+        """Get workers whose samples this worker collects.
 
-        Args:
-            sample: Sample to add
+        Returns:
+            This worker (bundles return their bundled workers)
+        """
+        return [self]
+
+    @property
+    def buffer(self) -> SampleRingBuffer:
+        """Get bounded sample buffer.
+
+        Returns:
+            Sample ring buffer (timestamp + one column per attribute)
         """
-        self.collected_samples.put(sample)
+        return self._buffer
 
     def clear(self) -> None:
-        """Clear extracted samples."""
-        self._extracted_samples.clear()
+        """Clear buffered samples."""
+        self._buffer.clear()
         self._logger.debug(LogMsg.WORKER_CLEAR_SAMPLES.value)
 
+    def _csv_path(self) -> Path | None:
+        """Get clean CSV path next to the worker log file.
+
+        Returns:
+            Log file path with .csv suffix, or None if the logger has no file
+        """
+        for handler in self._logger.handlers:
+            if isinstance(handler, logging.FileHandler):
+                return Path(handler.baseFilename).with_suffix(".csv")
+        return None
+
+    def _raw_archive_meta(self) -> dict:
+        """Describe how archived outputs are parsed (stored in the raw archive header).
+
+        Returns:
+            Command, parser class name, arguments and options, attributes and flap flag
+        """
+        parser = self._worker_cfg.parser
+        return {
+            "command": self._worker_cfg.command,
+            "parser": type(parser).__name__ if parser is not None else None,
+            "parser_args": getattr(parser, "args", {}),
+            "carry_over": getattr(parser, "carry_over", False),
+            "attributes": self._worker_cfg.attributes,
+            "is_flap_logger": self._worker_cfg.is_flap_logger,
+        }
+
     def _write_raw_csv(self, line: str) -> None:
         """Write raw CSV line directly to log file without logging prefix.
 
@@ -434,6 +856,17 @@ class Worker(Thread, ITime):
         if self._worker_cfg.is_flap_logger:
             return
 
+        if self._sink is not None:
+            check_and_rotate_sink(
+                self._sink,
+                self._logger.name,
+                self._worker_cfg.max_log_size_kb,
+                self._shared_flap_state,
+                self._has_rotated_since_flap_dict,
+                self._log_rotation_count_dict,
+            )
+            return
+
         # Use common rotation logic with CSV header preservation
         check_and_rotate_log(
             self._logger,
@@ -446,53 +879,15 @@ class Worker(Thread, ITime):
             timeout_sec=self._cfg.log_rotation_timeout_sec,
         )
 
-    def _log_mem_size(self, collection: Any) -> None:
-        """Log memory size of collection.
-
-        Args:
-            collection: Collection to measure
-        """
-        self._logger.debug(f"({__name__}) Extracted list size: {len(collection)}")
-        self._logger.debug(f"Mem size of extracted list: {round(asizeof.asizeof(collection) / (1024 * 1024), 2)} Mb")
-
-    def get_extracted_samples(self) -> list[Sample]:
-        """Get extracted samples.
-
-        Returns:
-            List of samples
-        """
-        return self._extracted_samples
-
-    def extract_all_samples(self) -> None:
-        """Extract all samples from queue."""
-        self._collect_all_samples()
-        self._log_mem_size(self._extracted_samples)
-
-    def first_sample(self) -> Sample | None:
-        """Get first sample from queue.
+    def get_extracted_samples(self) -> list[tuple]:
+        """Get buffered samples.
 
         Returns:
-            First sample or None if queue is empty
+            Rows (begin timestamp, *attribute values), oldest first
         """
-        if not self._extracted_samples:
-            self._collect_samples()
-            self._log_mem_size(self._extracted_samples[0])
-            return self._extracted_samples[0]
-        return None
-
-    def _collect_samples(self) -> None:
-        """Collect single sample from queue and add to extracted samples."""
-        self._extracted_samples.append(self._collected_samples.get())
-
-    def _collect_all_samples(self) -> None:
-        """Collect all available samples from queue and add to extracted samples."""
-        while True:
-            try:
-                self._extracted_samples.append(self._collected_samples.get_nowait())
-            except queue.Empty:
-                break
+        return self._buffer.rows()
 
-    def get_range(self, start: dt, end: dt) -> list[Sample]:
+    def get_range(self, start: dt, end: dt) -> list[tuple]:
         """Get samples within specified time range.
 
         Args:
@@ -500,38 +895,36 @@ class Worker(Thread, ITime):
             end: End datetime (inclusive)
 
         Returns:
-            List of samples within time range
+            Rows within time range, found by binary search on the buffer
         """
-        return [s for s in self.collected_samples.get() if hasattr(s, "begin") and start <= s.begin <= end]
+        return self._buffer.rows(start.timestamp(), end.timestamp())
 
-    def group_by_type(self) -> dict[str, list[Sample]]:
-        """Group samples by their class name.
+    def group_by_type(self) -> dict[str, list[str]]:
+        """Group buffer columns by their storage type.
 
         Returns:
-            Dictionary mapping class names to lists of samples
+            Dictionary mapping "float"/"object" to column names
         """
-        groups = defaultdict(list)
-        for s in self.collected_samples.get():
-            groups[type(s).__name__].append(s)
-        return dict(groups)
+        groups: dict[str, list[str]] = {}
+        for name, kind in self._buffer.column_types().items():
+            groups.setdefault(kind, []).append(name)
+        return groups
 
     def export_json(self, full_path: Path) -> None:
-        """Export samples to JSON.
+        """Export buffered samples to JSON.
 
         Args:
             full_path: Output file path
         """
-        Json.save(self.get_samples(), full_path)
+        Json.save({"columns": ["begin_timestamp", *self._buffer.columns], "rows": self._buffer.rows()}, full_path)
 
     def summary(self) -> str:
-        """Generate one-line summary of collected sample data.
+        """Generate one-line summary of buffered sample data.
 
         Returns:
-            Summary string with sample count and types
+            Summary string with fill level, drops and memory
         """
-        total_samples = len(self._collected_samples)
-        types = {type(s).__name__ for s in self._collected_samples.get()}
-        return f"Collected {total_samples} samples of types: {', '.join(sorted(types))}"
+        return self._buffer.summary()
 
 
 class WorkManager:
@@ -539,29 +932,40 @@ class WorkManager:
 
     Provides centralized management for multiple worker threads including
     lifecycle management, statistics tracking, and shared state coordination.
+    With engine_threads > 0 workers run on a shared WorkerEngine instead of
+    one thread each.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty worker pool."""
+    def __init__(self, engine_threads: int = 0) -> None:
+        """Initialize empty worker pool.
+
+        Args:
+            engine_threads: Threads of the shared worker engine (0 = one thread per worker)
+        """
         self._work_pool: list[Worker] = []
         self._shared_flap_state = {"flaps_detected": False, "workers_rotated": set()}
         self._statistics = WorkerStatistics()
+        self._engine = WorkerEngine(engine_threads) if engine_threads > 0 else None
 
         self._logger = logging.getLogger(LogName.MAIN.value)
 
-    def add(self, worker: Worker) -> None:
+    def add(self, worker: Worker, dedicated_thread: bool = False) -> None:
         """Add worker to pool and start execution.
 
         Args:
             worker: Worker instance to add
+            dedicated_thread: Run on own thread even when the engine is enabled (blocking waits)
         """
-        old_worker = self.get_worker(worker.command)
-        if old_worker is None:
-            worker.start()
-            self._work_pool.append(worker)
+        if self._has_command(worker.command):
+            # A pooled worker or bundle member already runs (or ran) this command, nothing is started again
+            self._logger.warning(f"{LogMsg.WORKER_ALREADY_EXISTS.value}: {worker.command}")
+            return
+
+        if self._engine and not dedicated_thread:
+            self._engine.add(worker)
         else:
-            old_worker.start()
-            self._logger.debug(f"{LogMsg.WORKER_ALREADY_EXISTS.value}: {worker.command}")
+            worker.start()
+        self._work_pool.append(worker)
 
     def get_statistics_summary(self) -> str:
         """Get statistics summary for all workers.
@@ -596,11 +1000,16 @@ class WorkManager:
     def stop_all(self) -> None:
         """Stop all workers in pool and wait for completion."""
         self._logger.debug(f"{LogMsg.WORKER_POOL_STOP.value} {len(self._work_pool)} workers in pool")
+        # Signal all first so workers wind down in parallel
+        for w in self._work_pool:
+            w.close()
         for w in self._work_pool:
             w.close_and_wait()
             self._logger.debug(f"{LogMsg.WORKER_STOPPED_NAME.value} '{w.name}'")
             w.join()
             self._logger.debug(f"{LogMsg.WORKER_JOINED_NAME.value} '{w.name}'")
+        if self._engine:
+            self._engine.shutdown()
 
     def reset(self) -> None:
         """Reset work manager."""
@@ -609,8 +1018,21 @@ class WorkManager:
         self.clear()
         self._logger.debug(LogMsg.WORKER_RESET_DONE.value)
 
+    def _has_command(self, command: str) -> bool:
+        """Check if a pooled worker or a bundle member runs the command.
+
+        Args:
+            command: Command string to search for
+
+        Returns:
+            True if the command is taken
+        """
+        return any(w.command == command or any(m.command == command for m in w.members) for w in self._work_pool)
+
     def get_worker(self, command: str) -> Worker | None:
-        """Get worker by command string.
+        """Get worker by command string (for reading its samples, never to start or finish it).
+
+        Bundle members are returned too; they are driven by their bundle.
 
         Args:
             command: Command string to search for
@@ -622,6 +1044,10 @@ class WorkManager:
             if w.command == command:
                 self._logger.debug(f"{LogMsg.WORKER_FOUND.value}: {w.command}")
                 return w
+            for member in w.members:
+                if member is not w and member.command == command:
+                    self._logger.debug(f"{LogMsg.WORKER_FOUND.value}: {member.command} (bundled)")
+                    return member
         self._logger.debug(f"{LogMsg.WORKER_NOT_FOUND.value}: {command}")
         return None
 
@@ -24,7 +24,7 @@ class BaseScanner(IScanner):
         self._logger = logger
         self._shutdown_event = shutdown_event
         self._ssh: SshConnection | None = None
-        self._worker_manager = WorkManager()
+        self._worker_manager = WorkManager(getattr(cfg, "sut_engine_threads", 0))
 
     @property
     def worker_manager(self) -> WorkManager:
@@ -40,18 +40,23 @@ class BaseScanner(IScanner):
         if self._ssh:
             self._ssh.disconnect()
 
-    def _add_worker_to_manager(self, worker_cfg: WorkerConfig) -> None:
+    def _add_worker_to_manager(
+        self, worker_cfg: WorkerConfig, ssh_factory=None, dedicated_thread: bool = False
+    ) -> None:
         """Add worker to manager.
 
         Args:
             worker_cfg: Worker configuration
+            ssh_factory: Optional connection factory (default: _create_ssh_factory())
+            dedicated_thread: Run worker on own thread even when the worker engine is enabled
         """
         self._logger.debug(f"{LogMsg.SCANNER_SUT_WORKER_CMD.value}: '{worker_cfg.command}'")
         shared_state = self._worker_manager.get_shared_flap_state()
         statistics = self._worker_manager.get_statistics()
 
         # Create SSH factory for per-worker connections
-        ssh_factory = self._create_ssh_factory()
+        if ssh_factory is None:
+            ssh_factory = self._create_ssh_factory()
 
         self._worker_manager.add(
             Worker(
@@ -60,7 +65,8 @@ class BaseScanner(IScanner):
                 ssh_factory,
                 shared_flap_state=shared_state,
                 statistics=statistics,
-            )
+            ),
+            dedicated_thread=dedicated_thread,
         )
 
     def _create_ssh_factory(self):
@@ -15,6 +15,7 @@ class LogName(Enum):
     SUT_LINK_FLAP = "sut_link_flap"
     SUT_TX_ERRORS = "sut_tx_errors"
     SUT_IPMITOOL_FAN = "sut_ipmitool_fan"
+    SUT_NETDEV = "sut_netdev"
 
     SLX_EYE = "slx_eye"
     SLX_DSC = "slx_dsc"
@@ -146,6 +146,32 @@ class AptManager(IPackageManager):
         self._logger.error(LogMsg.SW_PKG_LIST_FAIL.value)
         return None
 
+    def get_package_versions(self, packages: list[str]) -> dict[str, str]:
+        """Get versions of several packages in one batched round trip.
+
+        Args:
+            packages: Names of packages to query
+
+        Returns:
+            dict[str, str]: Package name to version (empty string if not found)
+        """
+        if not self._ssh:
+            self._logger.error(LogMsg.SSH_CONN_NOT_AVAILABLE.value)
+            return {}
+
+        self._logger.debug(f"{LogMsg.SW_PKG_LIST.value} ({len(packages)} packages batched)")
+
+        results = self._ssh.exec_many([f"dpkg -l {package}" for package in packages])
+
+        versions = {}
+        for package, result in zip(packages, results, strict=True):
+            if result.success:
+                versions[package] = self._parse_version(result.stdout)
+            else:
+                self._logger.error(f"{LogMsg.SW_PKG_LIST_FAIL.value}: {package}")
+                versions[package] = ""
+        return versions
+
     def _parse_version(self, output: str) -> str:
         """Parse dpkg -l output to extract version string.
 
@@ -579,10 +605,19 @@ class SoftwareManager:
             packages_to_check, _ = self._validate_package_support(required_packages)
 
         version_info = {}
+        supported = [pkg for pkg in packages_to_check if pkg in SUPPORTED_PACKAGES]
+        if isinstance(self._package_manager, AptManager):
+            # One batched round trip instead of one dpkg call per package
+            batched = self._package_manager.get_package_versions(supported)
+        else:
+            batched = {}
+
         # Check each supported command for version information
         for pkg in packages_to_check:
             self._logger.debug(f"Checking version for package: {pkg}")
-            if pkg in SUPPORTED_PACKAGES:
+            if pkg in batched:
+                version_info[pkg] = batched[pkg]
+            elif pkg in SUPPORTED_PACKAGES:
                 version_info[pkg] = self._package_manager.get_package_info(pkg)
             else:
                 version_info[pkg] = "Unsupported package"
@@ -1,12 +1,12 @@
+from datetime import UTC, datetime as dt
 import logging
-from typing import Any
 
 from nicegui import ui
 import plotly.graph_objects as go
 
-from src.core.sample import PlotSampleData
 from src.core.worker import WorkManager
 from src.models.config import Config
+from src.platform.enums.log import LogName
 
 logger = logging.getLogger(LogName.MAIN.value)
 
@@ -37,6 +37,7 @@ class GraphView:
         self._interface = interface
         self._source = source
         self._value = value
+        self._last_timestamp: float | None = None  # Newest sample already plotted
 
     def _close_card(self, card: ui.card) -> None:
         """Close graph card.
@@ -47,46 +48,25 @@ class GraphView:
         card.delete()
         logger.debug("Card deleted")
 
-    def _update_traces(self, add_x: Any, add_y: Any) -> None:
-        """Update graph traces.
-
-        Args:
-            add_x: X value to add
-            add_y: Y value to add
-        """
-        self._fig.update_traces(
-            x=[*list(self._fig.data[0].x), add_x], y=[*list(self._fig.data[0].y), add_y], selector=0
-        )
-
     def update(self) -> None:
-        """Update graph with new data."""
+        """Append samples buffered since the last update to the graph."""
         worker = self._work_manager.get_worker(self._interface)
-        samples = worker.get_all_samples()
-
-        y_axis_label = None
-        for i in samples:
-            plot_sample = PlotSampleData(i, self._source, self._value)
-            if len(self._fig.data) > 0:
-                self._update_traces(plot_sample.get_data_x(), plot_sample.get_data_y())
-            else:
-                self._fig.add_trace(
-                    go.Scatter(
-                        x=[plot_sample.x()],
-                        y=[plot_sample.y()],
-                        name=self._interface,
-                    )
-                )
-
-            if y_axis_label is None:
-                y_axis_label = plot_sample.y_label()
-
-        worker.clear()
+        timestamps, values = worker.buffer.column(self._value, since=self._last_timestamp)
+        if not timestamps:
+            return
+        self._last_timestamp = timestamps[-1]
+
+        x = [dt.fromtimestamp(ts, UTC) for ts in timestamps]
+        if len(self._fig.data) > 0:
+            self._fig.update_traces(x=[*self._fig.data[0].x, *x], y=[*self._fig.data[0].y, *values], selector=0)
+        else:
+            self._fig.add_trace(go.Scatter(x=x, y=values, name=self._interface))
 
         self._fig.update_layout(
             margin={"l": 10, "r": 10, "t": 30, "b": 10},
             title=f"Interface: {self._interface} - Source: {self._source} - Value: {self._value}",
             xaxis_title="",
-            yaxis_title=y_axis_label,
+            yaxis_title=self._value,
             legend_title="Legend",
             xaxis={"type": "date", "tickformat": "%d %b %H:%M:%S", "tickangle": -45},
         )
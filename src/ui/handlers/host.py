@@ -6,7 +6,7 @@ from typing import Any
 
 from nicegui import ui
 
-from src.core.connect import SshConnection
+from src.core.connect import BrokerConnection, SshConnection, broker_available
 from src.models.config import Config
 
 logger = logging.getLogger(LogName.MAIN.value)
@@ -23,12 +23,12 @@ class HostHandler:
         """
         self._cfg = cfg
         self._current_host_index: int | None = None
-        self._connection_callbacks: list[Callable[[SshConnection | None], None]] = []
+        self._connection_callbacks: list[Callable[[SshConnection | BrokerConnection | None], None]] = []
         self._host_selectors: list[ui.select] = []
-        self._route_connections: dict[int, SshConnection] = {}
+        self._route_connections: dict[int, SshConnection | BrokerConnection] = {}
 
     @property
-    def current_connection(self) -> SshConnection | None:
+    def current_connection(self) -> SshConnection | BrokerConnection | None:
         """Get current SSH connection.
 
         Returns:
@@ -54,7 +54,7 @@ class HostHandler:
         """
         return self._current_connection is not None and self._current_connection.is_connected()
 
-    def register_connection_callback(self, callback: Callable[[SshConnection | None], None]) -> None:
+    def register_connection_callback(self, callback: Callable[[SshConnection | BrokerConnection | None], None]) -> None:
         """Register callback for connection changes.
 
         Args:
@@ -107,10 +107,16 @@ class HostHandler:
             if hasattr(self, "_current_connection") and self._current_connection:
                 self._current_connection.disconnect()
 
-            # Create new connection
-            self._current_connection = SshConnection(
-                host=host.ip, username=host.username, password=host.password.get_secret_value()
-            )
+            # Create new connection (through the local broker when it runs)
+            if broker_available():
+                self._current_connection = BrokerConnection(host.ip, host.username, host.password.get_secret_value())
+            else:
+                self._current_connection = SshConnection(
+                    host=host.ip,
+                    username=host.username,
+                    password=host.password.get_secret_value(),
+                    max_channels=SshConnection.SHARED_MAX_CHANNELS,
+                )
 
             if self._current_connection.connect():
                 self._current_host_index = host_index
@@ -218,7 +224,11 @@ class HostHandler:
         route = self._cfg.networks.routes[route_index]
 
         try:
-            connection = SshConnection.from_route(route)
+            # Route connections are shared by all tabs, allow concurrent channels
+            if broker_available():
+                connection = BrokerConnection.from_route(route)
+            else:
+                connection = SshConnection.from_route(route, max_channels=SshConnection.SHARED_MAX_CHANNELS)
             if connection.connect():
                 self._route_connections[route_index] = connection
                 ui.notify(f"Connected to route: {route.summary}", color="positive")
@@ -259,7 +269,7 @@ class HostHandler:
         connection = self._route_connections.get(route_index)
         return connection is not None and connection.is_connected()
 
-    def get_route_connection(self, route_index: int) -> SshConnection | None:
+    def get_route_connection(self, route_index: int) -> SshConnection | BrokerConnection | None:
         """Get connection for a specific route.
 
         Args:
@@ -193,6 +193,18 @@ class SystemContent:
         except Exception:
             return "", "Command execution failed"
 
+    def _execute_commands(self, cmds: list[str], timeout: int = 10) -> list[tuple[str, str]]:
+        """Execute several SSH commands in one batched round trip."""
+        try:
+            if self._parent_panel and self._selected_route is not None:
+                connection = self._parent_panel.get_screen_connection(self._screen_num)
+                if connection and connection.is_connected():
+                    return [(r.stdout, r.stderr) for r in connection.exec_many(cmds, timeout=timeout)]
+                return [("", "No connection available")] * len(cmds)
+        except Exception:
+            return [("", "Command execution failed")] * len(cmds)
+        return [("", "")] * len(cmds)
+
     def _get_system_info(self) -> None:
         """Get general system information."""
         if not self._is_connected() or not self._system_info_container:
@@ -209,8 +221,8 @@ class SystemContent:
         with self._system_info_container, ui.card().classes("w-full p-4 border"):
             ui.label("General System Information").classes("font-bold text-green-600 mb-2")
 
-            for cmd, label in commands:
-                stdout, stderr = self._execute_command(cmd)
+            outputs = self._execute_commands([cmd for cmd, _ in commands])
+            for (_, label), (stdout, stderr) in zip(commands, outputs, strict=True):
                 if stdout:
                     ui.label(f"{label}: {stdout.strip()}").classes("text-sm")
                 elif stderr:
@@ -246,8 +258,8 @@ class SystemContent:
         with self._system_info_container, ui.card().classes("w-full p-4 border"):
             ui.label("Memory & Storage Information").classes("font-bold text-purple-600 mb-2")
 
-            for cmd, label in commands:
-                stdout, stderr = self._execute_command(cmd)
+            outputs = self._execute_commands([cmd for cmd, _ in commands])
+            for (_, label), (stdout, stderr) in zip(commands, outputs, strict=True):
                 if stdout:
                     ui.label(label).classes("font-semibold text-sm mt-2")
                     ui.code(stdout).classes("text-xs")
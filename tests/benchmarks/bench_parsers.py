@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Benchmark all command output parsers on recorded tool output.
+
+Standalone runner (no pytest-benchmark needed, not collected by pytest). Each
+case parses captured output from tests/benchmarks/fixtures and reports time
+per parse (best of several timeit repeats), peak allocation per parse
+(tracemalloc) and throughput. Scaling cases cover a 10k-line dmesg dump and
+64 ports of ethtool/mlxlink output and a 64-port netdev snapshot. Results can be saved as a baseline and
+later runs compared against it to catch regressions.
+
+Usage:
+    python -m tests.benchmarks.bench_parsers
+    python -m tests.benchmarks.bench_parsers --filter dmesg
+    python -m tests.benchmarks.bench_parsers --save baseline.json
+    python -m tests.benchmarks.bench_parsers --compare baseline.json --tolerance 0.25
+"""
+
+import argparse
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime as dt, timedelta
+import itertools
+import json
+from pathlib import Path
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from src.core.enum.connect import NetdevSource
+from src.core.parser import (
+    SlxDscParser,
+    SlxEyeParser,
+    SutDmesgFlapParser,
+    SutEthtoolModuleParser,
+    SutIpmitoolFanParser,
+    SutMlxlinkAmberParser,
+    SutMlxlinkParser,
+    SutNetdevParser,
+    SutTimeParser,
+)
+from src.core.parser.sut.netdev import PROC_COUNTERS, SYSFS_COUNTERS
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PORTS = 64
+REPEAT = 5
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmark case: a callable parsing `lines` lines / `size` bytes per call."""
+
+    name: str
+    run: Callable[[], object]
+    lines: int
+    size: int
+
+
+def load(name: str) -> str:
+    """Read recorded fixture output."""
+    return (FIXTURES / name).read_text()
+
+
+def scaled_dmesg(lines: int) -> str:
+    """Repeat the recorded dmesg capture up to `lines` lines with timestamps kept increasing."""
+    recorded = load("dmesg_link.txt").splitlines()
+    stamps = [dt.fromisoformat(line.split(" ", 1)[0].replace(",", ".")) for line in recorded]
+    span = stamps[-1] - stamps[0] + timedelta(seconds=1)
+
+    out = []
+    for i, (stamp, line) in zip(range(lines), itertools.cycle(zip(stamps, recorded, strict=True))):
+        shifted = stamp + span * (i // len(recorded))
+        out.append(shifted.isoformat(timespec="microseconds").replace(".", ",") + " " + line.split(" ", 1)[1])
+    return "\n".join(out) + "\n"
+
+
+def sysfs_netdev(ports: int) -> tuple[list[str], str]:
+    """Build `date +clock:%s.%N; grep -sH .` output of all sysfs counters of `ports` interfaces.
+
+    Returns:
+        Tuple of (interface names, command output)
+    """
+    interfaces = [f"ens{i // 2 + 1}f{i % 2}np{i % 2}" for i in range(ports)]
+    lines = ["clock:1792179769.209503412"]
+    for i, iface in enumerate(interfaces):
+        lines.extend(
+            f"/sys/class/net/{iface}/statistics/{counter}:{(i + 1) * 918_273_645 + j * 7_919}"
+            for j, counter in enumerate(SYSFS_COUNTERS)
+        )
+    return interfaces, "\n".join(lines) + "\n"
+
+
+def _case(name: str, parser_factory: Callable[[], object], *outputs: str, method: str = "parse") -> Case:
+    """Build a case parsing each output with its own parser (one parser per port/worker, like the scanner).
+
+    Parsers are created and fed once up front so stateful parsers (header on first parse) are
+    measured in their steady state.
+    """
+    parsers = [parser_factory() for _ in outputs]
+    calls = [(getattr(parser, method), output) for parser, output in zip(parsers, outputs, strict=True)]
+    for call, output in calls:
+        call(output)
+
+    def run() -> None:
+        for call, output in calls:
+            call(output)
+
+    return Case(name, run, sum(o.count("\n") for o in outputs), sum(len(o.encode()) for o in outputs))
+
+
+def _feed_case(name: str, raw: str) -> Case:
+    """Build a case streaming raw line by line through SutDmesgFlapParser.feed()."""
+    lines = raw.splitlines()
+
+    def run() -> None:
+        feed = SutDmesgFlapParser(dt.fromtimestamp(0, tz=UTC)).feed
+        for line in lines:
+            feed(line)
+
+    return Case(name, run, len(lines), len(raw.encode()))
+
+
+def build_cases() -> list[Case]:
+    """All benchmark cases, recorded output first, then scaling cases."""
+    epoch = dt.fromtimestamp(0, tz=UTC)
+    mlxlink = load("mlxlink.txt")
+    sfp = load("ethtool_module_sfp.txt")
+    dmesg_10k = scaled_dmesg(10_000)
+    ports, netdev = sysfs_netdev(PORTS)
+    proc_ifaces = ["eno1np0", "ens1f0np0", "ens1f1np1"]
+
+    return [
+        _case("mlxlink", SutMlxlinkParser, mlxlink),
+        _case("ethtool_module qsfp28", SutEthtoolModuleParser, load("ethtool_module.txt")),
+        _case("ethtool_module sfp28", SutEthtoolModuleParser, sfp),
+        _case("dmesg_flap 100 lines", lambda: SutDmesgFlapParser(epoch), load("dmesg_link.txt")),
+        _feed_case("dmesg_flap feed 100 lines", load("dmesg_link.txt")),
+        _case("ipmitool_fan", SutIpmitoolFanParser, load("ipmitool_fan.txt")),
+        _case("ipmitool_fan attributes", SutIpmitoolFanParser, load("ipmitool_fan.txt"), method="parse_attributes"),
+        _case("mlxlink_amber", SutMlxlinkAmberParser, load("mlxlink_amber.txt")),
+        _case("slx_eye", SlxEyeParser, load("slx_eyescan.txt")),
+        _case("slx_dsc", SlxDscParser, load("slx_dsc.txt")),
+        _case("time bash", SutTimeParser, load("time_bash.txt")),
+        _case("time zsh", SutTimeParser, load("time_zsh.txt")),
+        _case("time gnu", SutTimeParser, load("time_gnu.txt")),
+        _case(
+            "netdev proc",
+            lambda: SutNetdevParser(proc_ifaces, list(PROC_COUNTERS), NetdevSource.PROC),
+            load("proc_net_dev.txt"),
+        ),
+        # Scaling
+        _case("dmesg_flap 10k lines", lambda: SutDmesgFlapParser(epoch), dmesg_10k),
+        _feed_case("dmesg_flap feed 10k lines", dmesg_10k),
+        _case(f"mlxlink x{PORTS} ports", SutMlxlinkParser, *[mlxlink] * PORTS),
+        _case(f"ethtool_module sfp28 x{PORTS} ports", SutEthtoolModuleParser, *[sfp] * PORTS),
+        _case(f"netdev sysfs x{PORTS} ports", lambda: SutNetdevParser(ports, list(SYSFS_COUNTERS)), netdev),
+    ]
+
+
+def measure(case: Case, min_time: float) -> dict[str, float]:
+    """Measure one case.
+
+    Args:
+        case: Benchmark case
+        min_time: Minimum time (s) of one timing repeat
+
+    Returns:
+        us (best time per call), peak_kib (peak allocation per call), lines_per_s and mb_per_s
+    """
+    timer = timeit.Timer(case.run)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    us = min(timer.repeat(repeat=REPEAT, number=number)) / number * 1e6
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    case.run()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        "us": us,
+        "peak_kib": peak / 1024,
+        "lines_per_s": case.lines / us * 1e6,
+        "mb_per_s": case.size / us,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark command output parsers on recorded fixtures")
+    parser.add_argument("-f", "--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum time (s) of one timing repeat")
+    parser.add_argument("--save", type=Path, help="write results as JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare against JSON baseline, exit 1 on regressions")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else {}
+
+    print(f"Python {platform.python_version()} on {platform.machine()}, best of {REPEAT}\n")
+    print(f"{'case':<36} {'lines':>6} {'KiB':>7} {'us/parse':>10} {'peak KiB':>9} {'klines/s':>9} {'MB/s':>7}")
+
+    results = {}
+    regressions = []
+    for case in build_cases():
+        if args.filter not in case.name:
+            continue
+        result = results[case.name] = measure(case, args.min_time)
+        line = (
+            f"{case.name:<36} {case.lines:>6} {case.size / 1024:>7.1f} {result['us']:>10.2f} "
+            f"{result['peak_kib']:>9.1f} {result['lines_per_s'] / 1e3:>9.1f} {result['mb_per_s']:>7.1f}"
+        )
+        if case.name in baseline:
+            ratio = result["us"] / baseline[case.name]["us"]
+            line += f"  {ratio:5.2f}x"
+            if ratio > 1 + args.tolerance:
+                regressions.append(case.name)
+                line += " REGRESSION"
+        print(line)
+
+    if args.save:
+        args.save.write_text(json.dumps({"python": platform.python_version(), "results": results}, indent=2))
+        print(f"\nBaseline written to {args.save}")
+    if regressions:
+        print(f"\n❌ {len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Test batched command framing (build_batch_script / split_batch_output)."""
+
+import io
+import os
+from pathlib import Path
+import subprocess
+import tempfile
+
+from src.core.connect import LocalConnection
+from src.core.connect.batch import (
+    build_batch_script,
+    build_command_frame,
+    new_batch_token,
+    read_framed_part,
+    split_batch_output,
+)
+
+token = new_batch_token()
+cmds = ["echo out; echo err >&2", "false", "printf 'no newline'", "exit 3", "echo last"]
+
+script = build_batch_script(cmds, token)
+result = subprocess.run(["bash", "-s"], input=script, capture_output=True, text=True, check=False)  # noqa: S607
+parts = split_batch_output(result.stdout, len(cmds), token)
+
+assert len(parts) == len(cmds), "Part count mismatch"
+assert parts[0].stdout == "out\n" and parts[0].stderr == "err\n" and parts[0].rcode == 0, "stdout/stderr split failed"
+assert parts[1].rcode == 1 and parts[1].stdout == "", "Failing command rc not captured"
+assert parts[2].stdout == "no newline", "Output without trailing newline mangled"
+assert parts[3].rcode == 3, "Exiting command aborted batch"
+assert parts[4].stdout == "last\n" and parts[4].complete, "Batch did not continue after exit"
+assert all(p.elapsed_ms >= 0 for p in parts), "Negative elapsed time"
+
+# Truncated output (e.g. batch killed mid-way) marks remaining commands incomplete
+cut = result.stdout[: result.stdout.find(f"__IC_{token}_3_ERR__")]
+truncated = split_batch_output(cut, len(cmds), token)
+assert [p.complete for p in truncated] == [True, True, True, False, False], "Truncation not detected"
+assert truncated[4].rcode == -1, "Missing command should fail"
+
+# Stream reader (privileged sessions) sees the same parts line by line
+stream = io.BytesIO(result.stdout.encode())
+streamed = [read_framed_part(stream.readline, token, i) for i in range(len(cmds))]
+assert streamed == parts, "Stream reader disagrees with split_batch_output"
+assert not read_framed_part(stream.readline, token, len(cmds)).complete, "EOF not detected"
+
+frame = build_command_frame("echo hi", token, 7)
+assert f"__IC_{token}_7_OUT__" in frame and frame.endswith("\n"), "Frame markers missing"
+
+# Sudo password on stdin never reaches the batch shell, whether sudo prompts or not (NOPASSWD, root)
+FAKE_SUDO = """#!/bin/sh
+{read}
+while [ "${{1#-}}" != "$1" ]; do [ "$1" = -p ] && shift; shift; done
+exec "$@"
+"""
+bin_dir = Path(tempfile.mkdtemp())
+os.environ["PATH"] = f"{bin_dir}:{os.environ['PATH']}"
+(bin_dir / "s3cret").write_text(f"#!/bin/sh\ntouch {bin_dir / 'leaked'}\n")  # Runs if the password is executed
+(bin_dir / "s3cret").chmod(0o755)
+for read in ("IFS= read -r pw", ":"):
+    (bin_dir / "sudo").write_text(FAKE_SUDO.format(read=read))
+    (bin_dir / "sudo").chmod(0o755)
+    results = LocalConnection(sudo_pass="s3cret").exec_many(["echo ok", "cat"])  # noqa: S106
+    assert [r.stdout for r in results] == ["ok", ""], f"Batch broken by sudo stdin ({read}): {results}"
+    assert not (bin_dir / "leaked").exists(), f"Password executed by the batch shell ({read})"
+
+print("\n✅ Batch framing split successfully!")
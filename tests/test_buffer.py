@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Test bounded columnar sample buffer (eviction, typed columns, range reads)."""
+
+import math
+
+from src.core.buffer import SampleRingBuffer
+from src.core.enum.connect import BufferPolicy
+
+buffer = SampleRingBuffer(["rx_power", "grade"], capacity=4)
+for i in range(6):
+    buffer.append(100.0 + i, [f"{i * 0.5:.6f}", "A" if i % 2 else ""])
+
+assert len(buffer) == 4 and buffer.dropped == 2, "Oldest rows not evicted"
+assert [r[0] for r in buffer.rows()] == [102.0, 103.0, 104.0, 105.0], "Ring order broken"
+assert buffer.column_types() == {"rx_power": "float", "grade": "object"}, "Column types not inferred"
+assert buffer.nbytes == 4 * 8 * 3, "Memory accounting not fixed-size"
+
+assert [r[1] for r in buffer.rows(103.0, 104.5)] == [1.5, 2.0], "Range read wrong"
+timestamps, values = buffer.column("rx_power", since=104.0)
+assert timestamps == [105.0] and values == [2.5], "Incremental column read wrong"
+
+empty = SampleRingBuffer(["v"])
+empty.append(1.0, [""])
+assert math.isnan(empty.rows()[0][1]), "Empty value must be stored as NaN"
+
+full = SampleRingBuffer(["v"], capacity=2, policy=BufferPolicy.DROP_NEW)
+assert full.append(1.0, [1]) and full.append(2.0, [2]), "Appends below capacity rejected"
+assert not full.append(3.0, [3]) and full.dropped == 1, "DROP_NEW accepted row while full"
+assert [r[1] for r in full.rows()] == [1.0, 2.0], "DROP_NEW lost history"
+
+print("✅ Sample ring buffer bounds memory and serves range reads!")
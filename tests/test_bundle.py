@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test bundled workers: due-member fan-out, per-member framing and members kept out of WorkManager.add()."""
+
+import logging
+import time
+from types import SimpleNamespace
+
+from src.core.bundle import BundleWorker
+from src.core.connect import LocalConnection
+from src.core.worker import Worker, WorkerConfig, WorkManager
+
+
+def _cfg(command: str, interval_ms: int) -> WorkerConfig:
+    worker_cfg = WorkerConfig()
+    worker_cfg.command = command
+    worker_cfg.logger = logging.getLogger(f"test_bundle_{interval_ms}")
+    worker_cfg.scan_interval_ms = interval_ms
+    return worker_cfg
+
+
+cfg = SimpleNamespace(log_rotation_timeout_sec=300, sut_time_cmd=False)
+fast_cfg = _cfg("echo fast", 20)
+slow_cfg = _cfg("printf 'slow\\nline 2'; echo oops >&2", 10_000)
+split_cfg = _cfg("echo split", 20)
+split_cfg.sub_commands = [("echo part-1", 20), ("echo part-2", 20)]
+
+bundle = BundleWorker("eth0", [fast_cfg, slow_cfg, split_cfg], cfg, LocalConnection, {"flaps_detected": False})
+fast, slow, split = bundle.members
+assert bundle.open(), "Bundle did not open"
+for _ in range(3):
+    due = bundle.step()
+    time.sleep(max(due - time.monotonic(), 0))
+
+# Every tick runs the fast members, the slow one only in the first (due) tick
+assert len(fast.buffer) == 3 and len(split.buffer) == 3, f"Fast members: {len(fast.buffer)}, {len(split.buffer)}"
+assert len(slow.buffer) == 1, f"Slow member sampled {len(slow.buffer)} times before its interval"
+
+# Each member gets only its own framed output (multi-line stdout kept, stderr not mixed in)
+assert [row[1] for row in fast.buffer.rows()] == ["fast"] * 3, f"Wrong fast output: {fast.buffer.rows()}"
+assert slow.buffer.rows()[0][1] == "slow\nline 2", f"Wrong slow output: {slow.buffer.rows()}"
+assert split.buffer.rows()[0][1] == "part-1\npart-2", f"Sub-commands not joined: {split.buffer.rows()}"
+
+# A worker for a bundled command is refused; the member is neither returned for starting nor detached
+manager = WorkManager()
+manager._work_pool.append(bundle)  # noqa: SLF001  (bundle is already open, added as if started)
+standalone = Worker(_cfg("echo fast", 20), cfg, LocalConnection, manager.get_shared_flap_state())
+manager.add(standalone)
+assert manager.get_workers_in_pool() == [bundle], "Worker for a bundled command added"
+assert standalone.ident is None and fast.ident is None, "Worker or bundle member started"
+assert manager.get_worker("echo fast") is fast, "Bundle members not found for reading samples"
+bundle.step()
+assert len(fast.buffer) == 4, "Member stopped sampling after a duplicate add"
+
+bundle.finish()
+
+print("✅ Bundles fan due commands out to their members!")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Test per-transport channel limit (streams refused at MaxSessions, execs keep a channel, lease execs and shells)."""
+
+import io
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+
+from src.core.connect import LocalConnection
+from src.core.connect.pool import SshTransportPool
+from src.core.connect.privileged import PrivilegedSessionPool
+from src.core.connect.ssh import SshConnection
+
+
+class FakeChannel:
+    """Session channel recording whether it is open."""
+
+    def __init__(self, transport: "FakeTransport"):
+        self._transport = transport
+        transport.open += 1
+
+    def exec_command(self, cmd: str) -> None:
+        pass
+
+    def makefile_stdin(self, _mode: str) -> io.BytesIO:
+        return io.BytesIO()
+
+    def makefile(self, _mode: str) -> io.BytesIO:
+        return io.BytesIO()
+
+    def shutdown_write(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._transport.open -= 1
+
+
+class FakeTransport:
+    """Transport counting open session channels like sshd MaxSessions does."""
+
+    def __init__(self):
+        self.open = 0
+
+    def is_active(self) -> bool:
+        return True
+
+    def open_session(self) -> FakeChannel:
+        return FakeChannel(self)
+
+
+class FakeOutput(io.BytesIO):
+    """stdout/stderr of an exec channel."""
+
+    def __init__(self, data: bytes = b""):
+        super().__init__(data)
+        self.channel = self
+
+    def recv_exit_status(self) -> int:
+        return 0
+
+
+class FakeClient:
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_transport(self) -> FakeTransport:
+        return self.transport
+
+    def exec_command(self, _cmd: str, **_kwargs) -> tuple[None, FakeOutput, FakeOutput]:
+        """Run an exec channel for a while, recording the peak number running at once."""
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+        return None, FakeOutput(b"ok"), FakeOutput()
+
+
+conn = SshConnection("sut", "user", "pass", keepalive_interval=0, max_channels=8)
+client = FakeClient()
+conn._ssh_client = client  # noqa: SLF001
+channels = conn._channels  # noqa: SLF001
+transport = client.transport
+
+streams = [conn.open_stream(f"dmesg --follow #{i}") for i in range(12)]
+opened = [s for s in streams if s is not None]
+assert len(opened) == SshConnection.MAX_STREAMS, f"Expected {SshConnection.MAX_STREAMS} streams, got {len(opened)}"
+assert transport.open == SshConnection.MAX_STREAMS, "Refused stream still opened a channel"
+
+# The last channel stays free for execs; a second concurrent exec waits instead of exceeding MaxSessions
+view = conn.shell_view()
+assert view._channels is channels, "Shell view has its own limit on the shared transport"  # noqa: SLF001
+assert channels.acquire(timeout=0), "Exec could not get the reserved channel"
+assert not channels.acquire(timeout=0.01), "Exec exceeded the session limit"
+waiter = threading.Thread(target=lambda: channels.acquire(timeout=2))
+waiter.start()
+opened[0].close()
+opened[0].close()  # Idempotent: releases only once
+waiter.join()
+assert channels.open == SshConnection.MAX_STREAMS + 1, f"Channel count drifted: {channels.open}"
+
+for stream in opened[1:]:
+    stream.close()
+assert conn.open_stream("dmesg --follow") is not None, "Closed streams did not free their channels"
+
+# Stream groups of a route get transports of their own
+pool = SshTransportPool(keepalive_interval=0)
+main, streams_0 = pool.lease("sut", "user", "pass"), pool.lease("sut", "user", "pass", group="streams-0")
+assert main._key != streams_0._key and pool.lease("sut", "user", "pass")._key == main._key, "Groups share a transport"  # noqa: SLF001
+
+# Leases of one transport get shell views of their own, never the shared connection's shell
+first, second = pool.lease("sut", "user", "pass"), pool.lease("sut", "user", "pass")
+first._conn = second._conn = conn  # noqa: SLF001  (as if connected through the pool)
+assert first.shell_ready_ms is None and second.shell_ready_ms is None, "Fresh lease shells report a prompt"
+shells = first._shell, second._shell  # noqa: SLF001
+assert shells[0] is not shells[1] and conn not in shells, "Leases share a shell"
+assert all(s._ssh_client is client for s in shells), "Lease shell not on the shared transport"  # noqa: SLF001
+first.disconnect()
+assert first._shell is None and conn._ssh_client is client, "Lease shell not released or transport closed"  # noqa: SLF001
+
+# Execs of many leases on one transport never exceed its channel limit
+bounded = SshConnection("sut", "user", "pass", keepalive_interval=0, max_channels=3)
+bounded._ssh_client = exec_client = FakeClient()  # noqa: SLF001
+leases = [pool.lease("sut", "user", "pass", group="bounded") for _ in range(4)]
+for lease in leases:
+    lease._conn = bounded  # noqa: SLF001
+runners = [threading.Thread(target=leases[i % 4].exec_cmd, args=("true",)) for i in range(16)]
+for runner in runners:
+    runner.start()
+for runner in runners:
+    runner.join()
+assert exec_client.peak == 3, f"Leases ran {exec_client.peak} execs at once on a 3-channel transport"
+
+# Privileged shells refused a channel fall back per command without disabling the session mode
+bin_dir = Path(tempfile.mkdtemp())
+(bin_dir / "sudo").write_text('#!/bin/sh\nwhile [ "${1#-}" != "$1" ]; do [ "$1" = -p ] && shift; shift; done\nexec "$@"\n')
+(bin_dir / "sudo").chmod(0o755)  # NOPASSWD sudo run as root
+os.environ["PATH"] = f"{bin_dir}:{os.environ['PATH']}"
+refuse = True
+local = LocalConnection()
+privileged = PrivilegedSessionPool(lambda cmd: None if refuse else local.open_stream(cmd), "pass")
+assert privileged.exec("id -u") is None and privileged.available, "Channel refusal disabled privileged sessions"
+refuse = False
+result = privileged.exec("id -u")
+assert result is not None and result.stdout == "0", "Session not retried once a channel is free"
+privileged.close_all()
+
+print("✅ Channels stay within the transport session limit!")
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Test deadband filter (thresholds, ignored attributes, heartbeat)."""
+
+from src.core.deadband import DeadbandFilter
+
+overrides = {"clock": {"ignore": True}, "power": {"abs": 0, "rel": 0.1}}
+db = DeadbandFilter(abs_threshold=0.5, max_silence_sec=10, overrides=overrides)
+db.bind(["temp", "power", "clock", "state"])
+
+assert db.accept(0, ["40.0", "2.0", "1", "up"]), "First row must pass"
+assert not db.accept(1, ["40.4", "2.1", "2", "up"]), "Changes inside deadband passed"
+assert not db.accept(2, ["40.3", "2.15", "3", "up"]), "Ignored attribute passed a row"
+assert db.accept(3, ["40.6", "2.0", "4", "up"]), "Drift beyond deadband since last passed row not detected"
+assert db.accept(4, ["40.6", "2.3", "5", "up"]), "Relative threshold not applied"
+assert db.accept(5, ["40.6", "2.3", "6", "down"]), "Non-numeric change not detected"
+assert not db.accept(14, ["40.6", "2.3", "7", "down"]), "Heartbeat came too early"
+assert db.accept(15, ["40.6", "2.3", "8", "down"]), "Heartbeat missing after max silence"
+
+print("✅ Deadband filter records changes and heartbeats only!")
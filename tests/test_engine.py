@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test shared worker engine: serialized per-worker steps, close/wake, shutdown and duplicate adds."""
+
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+from src.core.connect import LocalConnection
+from src.core.worker import Worker, WorkerConfig, WorkManager
+
+
+class _RecordingWorker(Worker):
+    """Worker recording when its steps run and whether two of them overlapped."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.steps: list[float] = []
+        self.overlapped = False
+        self._running = threading.Lock()
+
+    def step(self):
+        if not self._running.acquire(blocking=False):
+            self.overlapped = True
+            return super().step()
+        try:
+            self.steps.append(time.monotonic())
+            return super().step()
+        finally:
+            self._running.release()
+
+
+def _worker(manager: WorkManager, command: str, interval_ms: int) -> _RecordingWorker:
+    worker_cfg = WorkerConfig()
+    worker_cfg.command = command
+    worker_cfg.logger = logging.getLogger(f"test_engine_{interval_ms}")
+    worker_cfg.scan_interval_ms = interval_ms
+    cfg = SimpleNamespace(log_rotation_timeout_sec=300, sut_time_cmd=False)
+    return _RecordingWorker(worker_cfg, cfg, LocalConnection, manager.get_shared_flap_state(), manager.get_statistics())
+
+
+manager = WorkManager(engine_threads=2)
+fast = _worker(manager, "echo fast", 20)
+slow = _worker(manager, "echo slow", 100)
+idle = _worker(manager, "echo idle", 10_000)
+for worker in (fast, slow, idle):
+    manager.add(worker)
+
+# Adding a command that already runs neither starts nor binds the new worker
+duplicate = _worker(manager, "echo fast", 20)
+manager.add(duplicate)
+assert len(manager.get_workers_in_pool()) == 3, "Duplicate worker added to pool"
+assert duplicate._engine is None and duplicate.ident is None, "Duplicate worker started"  # noqa: SLF001
+
+time.sleep(0.5)
+
+# Steps of one worker never overlap and follow its own interval, fast workers step more often
+for worker in (fast, slow):
+    assert not worker.overlapped, f"Steps of '{worker.command}' overlapped"
+    gaps = [b - a for a, b in zip(worker.steps, worker.steps[1:], strict=False)]
+    interval = worker._worker_cfg.scan_interval_ms / 1000  # noqa: SLF001
+    assert gaps and min(gaps) > interval * 0.5, f"'{worker.command}' stepped early: {gaps}"
+assert len(fast.steps) > 2 * len(slow.steps), f"Fast {len(fast.steps)} vs slow {len(slow.steps)} steps"
+assert len(idle.steps) == 1, "Idle worker stepped before its interval"
+
+# close() wakes a worker waiting for a distant tick, it finishes without waiting for it
+begin = time.monotonic()
+idle.close()
+idle.join(timeout=2)
+assert not idle.is_alive() and time.monotonic() - begin < 1, "Closed worker not woken"
+
+# stop_all() closes every worker and shuts the engine down
+manager.stop_all()
+assert not fast.is_alive() and not slow.is_alive(), "Workers still running after stop_all()"
+engine = manager._engine  # noqa: SLF001
+assert engine._executor is None and engine._dispatcher is None, "Engine threads not stopped"  # noqa: SLF001
+steps = len(fast.steps)
+time.sleep(0.1)
+assert len(fast.steps) == steps, "Worker stepped after shutdown"
+
+print("✅ Worker engine serializes steps, wakes closed workers and shuts down!")
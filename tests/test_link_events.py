@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test streamed link event detection (incremental dmesg parsing, local stream worker, line archive)."""
+
+from datetime import UTC, datetime as dt
+import logging
+from pathlib import Path
+import tempfile
+import time
+from types import SimpleNamespace
+
+from src.core.connect import LocalConnection
+from src.core.link_events import LinkEventWorker
+from src.core.parser import SutDmesgFlapParser
+from src.core.reparse import reparse
+from src.core.worker import WorkerConfig
+
+DOWN = "2030-01-01T10:00:00,100000+00:00 mlx5_core 0000:01:00.0 eth0: Link down"
+UP = "2030-01-01T10:00:02,600000+00:00 mlx5_core 0000:01:00.0 eth0: Link up"
+OLD = "2020-01-01T10:00:00,000000+00:00 mlx5_core 0000:01:00.0 eth0: Link down"
+
+parser = SutDmesgFlapParser(dt.now(UTC))
+assert parser.feed(OLD) is None and parser.feed("unrelated line") is None, "Old or foreign line produced a flap"
+assert parser.feed(DOWN) is None, "Down event alone is not a flap"
+flap = parser.feed(UP)
+assert flap is not None and flap.interface == "eth0" and flap.duration == 2.5, f"Wrong flap: {flap}"
+assert parser.feed(UP) is None, "Repeated up event produced a second flap"
+
+# Stream worker: flap is logged and marked in shared state as soon as the line arrives
+log_file = Path(tempfile.mkdtemp()) / "sut_link_flap.log"
+logger = logging.getLogger("test_link_flap")
+logger.addHandler(logging.FileHandler(log_file))
+logger.setLevel(logging.INFO)
+
+worker_cfg = WorkerConfig()
+worker_cfg.command = "true"
+worker_cfg.parser = SutDmesgFlapParser(dt.now(UTC))
+worker_cfg.attributes = ["interface", "down_timestamp", "up_timestamp", "duration"]
+worker_cfg.logger = logger
+worker_cfg.is_flap_logger = True
+cfg = SimpleNamespace(log_rotation_timeout_sec=300, sut_time_cmd=False, sut_raw_archive=True)
+state = {"flaps_detected": False}
+
+worker = LinkEventWorker(worker_cfg, f"printf '%s\\n' '{DOWN}' '{UP}'; sleep 5", cfg, LocalConnection, state)
+assert worker.open(), "Worker did not open"
+worker.step()
+worker.step()
+assert state["flaps_detected"] and "trigger_time" in state, "Streamed flap not marked in shared state"
+assert len(worker.buffer) == 1, "Streamed flap not buffered"
+begin = time.monotonic()
+worker.close()
+worker.finish()
+assert time.monotonic() - begin < 2, "Closing did not end the blocked stream"
+assert "eth0" in log_file.read_text(), "Streamed flap not logged"
+
+# Streamed lines are archived one record each and re-parsed into the same flap
+archives = list(log_file.parent.glob("*.raw"))
+assert len(archives) == 1, f"Expected one stream archive, got {archives}"
+frame = reparse(archives[0], processes=1, chunk_records=1)
+assert frame["duration"].tolist() == [2.5], f"Streamed flap not re-parsed:\n{frame}"
+
+
+class _ClosedWhileReading:
+    """Stream closed by another thread's close() while a step reads from it."""
+
+    def __init__(self, owner: LinkEventWorker):
+        self._owner = owner
+
+    def readline(self) -> bytes:
+        self._owner.close()
+        msg = "I/O operation on closed file"
+        raise ValueError(msg)
+
+    def close(self) -> None:
+        pass
+
+
+closing = LinkEventWorker(worker_cfg, "true", cfg, LocalConnection, {"flaps_detected": False})
+closing._stream = _ClosedWhileReading(closing)  # noqa: SLF001
+assert closing.step() is None and closing._stream is None, "Close during a stream read not handled"  # noqa: SLF001
+
+print("✅ Link events are detected from the stream as they arrive!")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Test single-pass mlxlink parsing into a typed record."""
+
+from src.core.parser.sut.mlxlink import MlxlinkRecord, SutMlxlinkParser
+
+MODULE = """Module Info
+-----------
+State                              : Active
+Temperature [C]                    : 45 [-5..75]
+Rx Power Current [dBm]             : -1.23,-1.1,-1.3,-1.2 [-10.4..2.4]
+"""
+COUNTERS = """Physical Counters and BER Info
+------------------------------
+Time Since Last Clear [Min]        : 1.2E+02
+Raw Physical BER                   : N/A
+Physical Grade                     : 12345,12345
+"""
+
+parser = SutMlxlinkParser()
+parser.parse(MODULE)
+record = parser.get_result()
+assert record.temperature == 45.0 and record.rx_power == -1.23 and record.state == "Active", "Wrong module values"
+row = record.row(MlxlinkRecord.ATTRIBUTES)
+assert len(row) == len(MlxlinkRecord.ATTRIBUTES), "Row must follow worker columns"
+assert row[0] == "45.000000" and row[3] == "-1.230000" and row[5] == "", "Row not formatted like get_attr_value"
+assert record.row(["rx_power", "unknown"]) == ["-1.230000", ""], "Attribute subset not resolved by name"
+
+# Without carry-over every output starts empty; with it, split queries complete each other
+parser.parse(COUNTERS)
+record = parser.get_result()
+assert record.temperature is None and record.time_since_last_clear == 120.0, "Stale value kept without carry-over"
+assert record.raw_physical_ber is None and record.physical_grade == "12345,12345", "Wrong counter values"
+
+split = SutMlxlinkParser(carry_over=True)
+split.parse(MODULE)
+split.parse(COUNTERS)
+record = split.get_result()
+assert record.temperature == 45.0 and record.time_since_last_clear == 120.0, "Split fields not carried over"
+
+print("✅ mlxlink output is parsed in one pass into a typed record!")
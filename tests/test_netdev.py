@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test netdev snapshot parsing (one call for all ports, ns clock, vectorized deltas, wrap vs reset)."""
+
+from src.core.enum.connect import NetdevSource
+from src.core.parser import SutNetdevParser
+from src.core.parser.sut.netdev import netdev_columns, netdev_command
+
+INTERFACES = ["eth0", "eth1"]
+COUNTERS = ["rx_bytes", "tx_errors"]
+COLUMNS = netdev_columns(INTERFACES, COUNTERS)
+
+
+def sysfs(clock: float, eth0: tuple[int, int], eth1_rx: int | None, clock_line: str = "clock:{}") -> str:
+    """Build `date +clock:%s.%N; grep -sH .` output (a missing file prints nothing)."""
+    lines = [
+        clock_line.format(clock),
+        f"/sys/class/net/eth0/statistics/rx_bytes:{eth0[0]}",
+        f"/sys/class/net/eth0/statistics/tx_errors:{eth0[1]}",
+    ]
+    if eth1_rx is not None:
+        lines.append(f"/sys/class/net/eth1/statistics/rx_bytes:{eth1_rx}")
+    return "\n".join(lines)
+
+
+command = netdev_command(INTERFACES, COUNTERS, NetdevSource.SYSFS)
+assert command.startswith("date +clock:%s.%N; grep -sH . ") and command.count("/statistics/") == 4, command
+assert COLUMNS == ["interval_ms", "eth0.rx_bytes", "eth0.tx_errors", "eth1.rx_bytes", "eth1.tx_errors"]
+
+parser = SutNetdevParser(INTERFACES, COUNTERS)
+parser.parse(sysfs(1_700_000_000.000_000_001, (1_000, 5), 2**32 - 300))
+assert parser.get_result() is None, "First snapshot has no deltas"
+
+# ns clock: the interval keeps sub-10ms precision
+parser.parse(sysfs(1_700_000_000.012_345_678, (1_500, 7), 2**32 - 200))
+row = parser.get_result().row(COLUMNS)
+assert row == ["12.346", "500", "2", "100", ""], f"Wrong deltas (ns interval, missing counter): {row}"
+
+# 32-bit wrap at the counter's previous rate
+parser.parse(sysfs(1_700_000_000.024_691_356, (1_600, 7), 50))
+assert parser.get_result().row(COLUMNS)[3] == "250", f"32-bit wrap not unwrapped: {parser.get_result().row(COLUMNS)}"
+
+parser.parse(sysfs(1_700_000_000.037_037_034, (200, 7), 80))
+assert parser.get_result().row(COLUMNS)[1] == "200", "Counter reset not counted from zero"
+assert parser.get_result().row(["eth1.rx_bytes", "unknown"]) == ["30", ""], "Column subset not resolved by name"
+
+# Driver reload of a slowly moving 64-bit counter in the upper 32-bit half is a reset, not a ~2^32 wrap
+parser = SutNetdevParser(INTERFACES, COUNTERS)
+for clock, rx in ((10.0, 3_000_000_000), (10.05, 3_000_000_100), (10.10, 40)):
+    parser.parse(sysfs(clock, (0, 0), rx))
+assert parser.get_result().row(COLUMNS)[3] == "40", f"Reset taken for a wrap: {parser.get_result().row(COLUMNS)}"
+
+# Counters seen above 2^32 are 64-bit and never wrap at 2^32
+parser = SutNetdevParser(INTERFACES, COUNTERS)
+for clock, rx in ((10.0, 2**32 + 5), (10.05, 2**32 - 10), (10.10, 2**32 - 5), (10.15, 10)):
+    parser.parse(sysfs(clock, (0, 0), rx))
+assert parser.get_result().row(COLUMNS)[3] == "10", "64-bit counter unwrapped at 2^32"
+
+# Raw archives of older versions carry /proc/uptime instead of the clock line
+parser = SutNetdevParser(INTERFACES, COUNTERS)
+parser.parse(sysfs(100.00, (1_000, 5), 0, "/proc/uptime:{} 987.65"))
+parser.parse(sysfs(100.05, (1_500, 5), 0, "/proc/uptime:{} 987.65"))
+assert parser.get_result().row(COLUMNS)[0] == "50.000", "Uptime clock of old archives not read"
+
+# /proc/net/dev: all interfaces in one file, rates per second
+PROC = """{clock}
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs colls carrier compressed
+    lo: 9999 99 0 0 0 0 0 0 9999 99 0 0 0 0 0 0
+  eth0: {rx} 10 0 0 0 0 0 0 777 7 {tx_err} 0 0 0 0 0
+  eth1: {rx} 10 0 0 0 0 0 0 777 7 0 0 0 0 0 0"""
+
+parser = SutNetdevParser(INTERFACES, COUNTERS, NetdevSource.PROC, rates=True)
+assert netdev_command(INTERFACES, COUNTERS, "proc") == "date +%s.%N; cat /proc/net/dev"
+parser.parse(PROC.format(clock=1_700_000_050.0, rx=1_000, tx_err=1))
+parser.parse(PROC.format(clock=1_700_000_050.5, rx=2_000, tx_err=3))
+result = parser.get_result()
+assert result.row(COLUMNS) == ["500.000", "2000.000", "4.000", "2000.000", "0.000"], result.row(COLUMNS)
+assert parser.args["source"] == "proc" and SutNetdevParser(**parser.args).args == parser.args, "Args not reusable"
+
+print("✅ Netdev counters of all ports are parsed from one snapshot!")
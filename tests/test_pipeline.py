@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test pipelined workers: overlapping executions, begin-ordered samples, channels sized to the depth."""
+
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+from src.core.connect import LocalConnection
+from src.core.connect.pool import SshTransportPool
+from src.core.worker import Worker, WorkerConfig
+
+DEPTH = 3
+SAMPLES = 6
+
+
+class _SlowWorker(Worker):
+    """Worker whose first execution is the slowest, so later ones finish before it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self.begins: list[float] = []
+        self._lock = threading.Lock()
+
+    def _collect(self, cmds):
+        with self._lock:
+            delay = 0.3 if self.calls == 0 else 0.1
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            result = super()._collect(cmds)
+            time.sleep(delay)
+            return result
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def handle_sample(self, sample, cmd_start, cmd_duration_ms):
+        self.begins.append(sample.begin)
+        super().handle_sample(sample, cmd_start, cmd_duration_ms)
+
+
+worker_cfg = WorkerConfig()
+worker_cfg.command = "echo 1"
+worker_cfg.logger = logging.getLogger("test_pipeline")
+worker_cfg.scan_interval_ms = 20
+worker_cfg.pipeline_depth = DEPTH
+cfg = SimpleNamespace(log_rotation_timeout_sec=300, sut_time_cmd=False)
+
+worker = _SlowWorker(worker_cfg, cfg, LocalConnection, {"flaps_detected": False})
+assert worker.open(), "Worker did not open"
+deadline = time.monotonic() + 5
+while len(worker.begins) < SAMPLES and time.monotonic() < deadline:
+    due = worker.step()
+    assert due is not None, "Pipelined worker stopped"
+    time.sleep(max(due - time.monotonic(), 0))
+worker.finish()
+
+assert len(worker.begins) >= SAMPLES, f"Only {len(worker.begins)} samples emitted"
+assert worker.max_running > 1, "Pipelined executions did not overlap"
+assert worker.max_running <= DEPTH, f"More than {DEPTH} executions in flight: {worker.max_running}"
+assert worker.begins == sorted(worker.begins), f"Samples not emitted in begin order: {worker.begins}"
+
+# Pooled pipelined workers lease a transport of their own with one exec channel per in-flight execution
+pool = SshTransportPool(max_channels=8)
+main = pool.lease("sut", "user", "pass")
+pipelined = pool.lease("sut", "user", "pass", group="pipeline-0", max_channels=DEPTH)
+entries = pool._entries  # noqa: SLF001
+assert entries[pipelined._key].connection.max_channels == DEPTH, "Pipeline transport not sized to depth"  # noqa: SLF001
+assert entries[main._key].connection.max_channels == 8, "Main transport lost the pool default"  # noqa: SLF001
+pool.close_all()
+
+print("✅ Pipelined executions overlap and samples stay in begin order!")
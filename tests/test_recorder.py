@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Test black-box recorder (summaries outside events, full resolution around triggers)."""
+
+from src.core.recorder import BlackBoxRecorder
+
+written: list[list[str]] = []
+rec = BlackBoxRecorder(pre_sec=3.0, post_sec=0.1, summary_sec=1.0, write=written.append)
+
+# 20 ms samples for 5 s: one summary row per second
+for i in range(250):
+    rec.record(i * 0.02, [str(i)])
+assert [r[0] for r in written] == ["0", "50", "100", "150", "200"], f"Unexpected summaries: {written}"
+
+# Trigger at t=5.0: the whole pre-trigger window from 2.0 on is written (summaries not again),
+# then all rows until 5.1
+rec.trigger(5.0)
+for i in range(250, 270):
+    rec.record(i * 0.02, [str(i)])
+rows = [int(r[0]) for r in written]
+assert len(rows) == len(set(rows)), "Rows written twice"
+pre = rows[5:]
+assert pre[: 150 - 3] == [i for i in range(100, 250) if i not in (100, 150, 200)], "Pre-trigger window not written"
+assert rows[-6:] == list(range(250, 256)), "Post-trigger window not written"
+assert 256 not in rows, "Rows after post window not summarized"
+
+print("✅ Black-box recorder keeps event windows and summaries only!")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Test raw archive mode and offline re-parse (worker archive, chunks, carry-over, crash recovery, flaps)."""
+
+import logging
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+
+from src.core.connect import LocalConnection
+from src.core.log.raw_archive import RawArchive, RawArchiveWriter
+from src.core.parser import SutMlxlinkParser
+from src.core.reparse import reparse
+from src.core.worker import Worker, WorkerConfig
+
+MODULE = "Temperature [C]                    : {} [-5..75]\nState                              : Active\n"
+COUNTERS = "Time Since Last Clear [Min]        : {}E+01\nPhysical Grade                     : 10834,10875\n"
+FLAP = "2030-01-01T10:00:{:02d},100000+00:00 mlx5_core 0000:01:00.0 eth0: Link {}"
+ATTRIBUTES = ["temperature", "time_since_last_clear", "physical_grade"]
+
+tmp = Path(tempfile.mkdtemp())
+
+# Worker in raw archive mode stores every unparsed output with its begin time
+out_file = tmp / "mlxlink.txt"
+out_file.write_text(MODULE.format(45))
+logger = logging.getLogger("test_reparse")
+logger.addHandler(logging.FileHandler(tmp / "sut_mxlink.log"))
+logger.setLevel(logging.INFO)
+
+worker_cfg = WorkerConfig()
+worker_cfg.command = f"cat {out_file}"
+worker_cfg.parser = SutMlxlinkParser(carry_over=True)
+worker_cfg.attributes = ATTRIBUTES
+worker_cfg.logger = logger
+worker_cfg.scan_interval_ms = 10
+cfg = SimpleNamespace(log_rotation_timeout_sec=300, sut_time_cmd=False, sut_raw_archive=True)
+
+worker = Worker(worker_cfg, cfg, LocalConnection, {"flaps_detected": False})
+assert worker.open(), "Worker did not open"
+worker.step()
+worker.step()
+worker.finish()
+archives = list(tmp.glob("sut_mxlink_cat_*.raw"))
+assert len(archives) == 1, f"Raw archive not written next to the log: {list(tmp.iterdir())}"
+with RawArchive(archives[0]) as archive:
+    begins, offsets, lengths = archive.index()
+    assert archive.meta["parser"] == "SutMlxlinkParser" and archive.meta["carry_over"], "Parser not described"
+    output = archive.output(offsets[0], lengths[0])
+    assert len(begins) == 2 and output == MODULE.format(45).strip(), "Raw output not kept"
+
+# Split queries (carry-over) re-parsed in parallel chunks: counters outputs keep the last module values
+path = tmp / "split.raw"
+writer = RawArchiveWriter(path, {"parser": "SutMlxlinkParser", "carry_over": True, "attributes": ATTRIBUTES})
+for i in range(10):
+    writer.append(1_000 + i, MODULE.format(40 + i) if i % 3 == 0 else COUNTERS.format(i))
+writer.close()
+with path.open("ab") as f:
+    f.write(b"\x00\x01\x02")  # Record cut short by a crash
+
+frame = reparse(path, processes=2, chunk_records=4)
+assert len(frame) == 10, f"Expected 10 rows, got {len(frame)}"
+assert frame["temperature"].tolist() == [40, 40, 40, 43, 43, 43, 46, 46, 46, 49], "Carry-over not forward filled"
+assert frame["time_since_last_clear"].iloc[1] == 10.0 and frame["physical_grade"].iloc[1] == "10834,10875"
+assert frame["begin_timestamp"].iloc[9].timestamp() == 1_009, "Begin time not kept"
+
+# Appending after a crash: the record cut short is dropped, new records stay readable
+path.write_bytes(path.read_bytes()[:-5])
+writer = RawArchiveWriter(path, {})
+writer.append(1_010, COUNTERS.format(10))
+writer.close()
+with RawArchive(path) as archive:
+    begins, offsets, lengths = archive.index()
+    assert begins.tolist() == [*range(1_000, 1_009), 1_010], f"Records after the cut lost: {begins}"
+    assert archive.output(offsets[-1], lengths[-1]) == COUNTERS.format(10), "Appended record unreadable"
+
+# Flap archives: every output is a dmesg window, a flap seen by an earlier chunk is not reported again
+path = tmp / "flap.raw"
+meta = {"parser": "SutDmesgFlapParser", "attributes": ["interface", "down", "up", "duration"], "is_flap_logger": True}
+writer = RawArchiveWriter(path, meta)
+window = []
+for i in range(6):
+    window += [FLAP.format(i * 5, "down"), FLAP.format(i * 5 + 2, "up")]
+    writer.append(1_893_492_000 + i * 5, "\n".join(window))
+writer.close()
+
+frame = reparse(path, processes=2, chunk_records=2)
+assert len(frame) == 6 and frame["duration"].tolist() == [2.0] * 6, f"Wrong flaps:\n{frame}"
+
+print("✅ Raw archives are re-parsed offline in parallel chunks!")
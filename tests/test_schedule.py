@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test fixed-rate tick scheduling and missed-tick accounting."""
+
+import logging
+import time
+from types import SimpleNamespace
+
+from src.core.connect import LocalConnection
+from src.core.enum.connect import SchedulePolicy
+from src.core.schedule import AdaptiveInterval, IntervalGroup, TickScheduler
+from src.core.statistics import WorkerStatistics
+from src.core.worker import Worker, WorkerConfig
+
+# Deadlines: on time, overrun by 2.5 intervals (SKIP drops 3 ticks, COALESCE runs tick 3 now and drops 2)
+skip = TickScheduler(10, SchedulePolicy.SKIP)
+skip._next = 100.0  # noqa: SLF001
+assert skip.next_deadline(100.005) == (100.01, 0), "On-time tick moved"
+deadline, missed = skip.next_deadline(100.035)
+assert missed == 3 and abs(deadline - 100.04) < 1e-9, f"SKIP overrun wrong: {deadline}, {missed}"
+
+coalesce = TickScheduler(10, SchedulePolicy.COALESCE)
+coalesce._next = 100.0  # noqa: SLF001
+deadline, missed = coalesce.next_deadline(100.035)
+assert missed == 2 and abs(deadline - 100.03) < 1e-9, f"COALESCE overrun wrong: {deadline}, {missed}"
+
+delay = TickScheduler(10, SchedulePolicy.DELAY)
+assert delay.next_deadline(5.0) == (5.01, 0), "DELAY must sleep full interval after command"
+
+# Fixed rate keeps the period at the interval although each "command" takes 40% of it
+scheduler = TickScheduler(20, SchedulePolicy.SKIP)
+scheduler.start()
+begin = time.monotonic()
+for _ in range(10):
+    time.sleep(0.008)
+    scheduler.wait()
+elapsed = time.monotonic() - begin
+assert 0.195 <= elapsed < 0.26, f"Fixed-rate period drifted: {elapsed * 1000:.1f}ms for 10 ticks"
+
+stats = WorkerStatistics()
+stats.record_schedule("cmd", 1.5, 0)
+stats.record_schedule("cmd", 2.5, 3)
+assert "Missed: 3 (60.0%)" in stats.get_summary(), "Missed ticks not reported"
+
+# Sub-commands on their own intervals: all due at start, then only the ones whose interval elapsed
+group = IntervalGroup([20, 500])
+assert group.base_interval_ms == 20, "Group must tick at its shortest interval"
+group.start()
+assert group.due() == [0, 1], "All entries must be due at start"
+assert group.due() == [], "Entry due again before its interval"
+group._due = [0.0, time.monotonic() + 1]  # noqa: SLF001
+assert group.due() == [0], "Slow entry ran on the fast interval"
+
+# Adaptive interval: halves on volatile values, drops to min on events, relaxes when stable
+adaptive = AdaptiveInterval(100, 20, 400, volatility_rel=0.05, hold_sec=1.0)
+assert adaptive.observe(0.0, ["10.0"]) == 125, "Stable start must relax"
+assert adaptive.observe(0.1, ["12.0"]) == 62.5, "Volatile value must tighten"
+adaptive.event(0.2)
+assert adaptive.observe(0.3, ["12.0"]) == 20, "Interval must hold at min after event"
+assert adaptive.observe(1.3, ["12.0"]) == 25, "Interval must relax after hold"
+for i in range(20):
+    adaptive.observe(2.0 + i, ["12.0"])
+assert adaptive.interval_ms == 400, "Interval exceeded max"
+scheduler.set_interval(adaptive.interval_ms)
+assert scheduler.interval_ms == 400, "Scheduler interval not updated"
+
+# Worker whose parser reports "no change" (None) still sees triggers and relaxes after the hold
+class _UnchangedParser:
+    def parse(self, _output: str) -> None:
+        pass
+
+    def get_result(self) -> None:
+        return None
+
+
+worker_cfg = WorkerConfig()
+worker_cfg.command = "echo 0"
+worker_cfg.parser = _UnchangedParser()
+worker_cfg.logger = logging.getLogger("test_schedule")
+worker_cfg.scan_interval_ms = 100
+worker_cfg.adaptive = AdaptiveInterval(100, 20, 400, hold_sec=0.0)
+cfg = SimpleNamespace(log_rotation_timeout_sec=300, sut_time_cmd=False)
+state = {"flaps_detected": False}
+
+worker = Worker(worker_cfg, cfg, LocalConnection, state)
+assert worker.open(), "Worker did not open"
+state["trigger_time"] = time.time()  # tx_errors change published by another worker
+worker.step()
+assert worker_cfg.adaptive.interval_ms == 25, "Trigger not seen on an unchanged sample"
+for _ in range(3):
+    worker.step()
+worker.finish()
+assert worker._scheduler.interval_ms > 25, "Interval did not relax on unchanged samples"  # noqa: SLF001
+
+print("✅ Tick scheduler keeps fixed rate and counts missed ticks!")
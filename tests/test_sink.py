@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test asynchronous batched CSV sink (clean rows, ordered rotation, shared files)."""
+
+import gzip
+from pathlib import Path
+import tempfile
+import time
+
+from src.core.enum.connect import LogCompression
+from src.core.log.segments import SegmentArchive
+from src.core.log.sink import CsvSink, CsvWriter, acquire_sink, release_sink
+
+tmp = Path(tempfile.mkdtemp())
+writer = CsvWriter(flush_interval_ms=20)
+
+sink = CsvSink(tmp / "data.csv", header="ts,value", writer=writer, batch_rows=1000)
+for i in range(3):
+    sink.write(f"{i},{i * 10}")
+time.sleep(0.1)
+assert (tmp / "data.csv").read_text() == "ts,value\n0,0\n1,10\n2,20\n", "Rows not flushed by interval"
+
+# Rotation is applied in queue order: rows before it stay in the old file
+sink.write("3,30")
+sink.rotate(tmp / "data_1.csv")
+assert sink.size_kb == 0, "Pending rotation must not trigger another one"
+sink.write("4,40")
+sink.clear()
+sink.write("5,50")
+sink.close()
+assert (tmp / "data.csv").read_text().endswith("2,20\n3,30\n"), "Row before rotation moved"
+assert (tmp / "data_1.csv").read_text() == "ts,value\n5,50\n", "Clear after rotation not applied in order"
+
+# Workers logging to the same file share one sink (header written once)
+first = acquire_sink(tmp / "shared.csv", "h")
+second = acquire_sink(tmp / "shared.csv", "h")
+assert first is second, "Same path must share one sink"
+first.write("a")
+release_sink(first)
+second.write("b")
+release_sink(second)
+assert (tmp / "shared.csv").read_text() == "h\na\nb\n", "Shared sink lost rows or repeated header"
+
+# Segmented sink rolls instead of clearing; closed segments are compressed and pruned, flap segments kept
+archive = SegmentArchive(tmp / "seg.csv", keep=1, compression=LogCompression.GZIP)
+seg = CsvSink(tmp / "seg.csv", header="h", writer=writer, archive=archive)
+for i, retain in enumerate([True, False, False]):
+    seg.write(str(i))
+    seg.roll(retain)
+seg.write("3")
+seg.close()
+assert sorted(p.name for p in tmp.glob("seg*")) == ["seg.csv.gz", "seg_2.csv.gz", "seg_3.csv"], "Wrong retention"
+assert gzip.decompress((tmp / "seg.csv.gz").read_bytes()) == b"h\n0\n", "Flap segment not retained intact"
+assert archive.retained == [tmp / "seg.csv.gz"], "Flap segment not tracked as retained"
+assert (tmp / "seg_3.csv").read_text() == "h\n3\n", "Active segment lost rows"
+
+print("✅ CSV sink writes clean batched rows and rotates in order!")